@@ -0,0 +1,175 @@
+import hashlib
+import os
+import struct
+import zlib
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# Opt-in: store new full_decision_json payloads compressed
+COMPRESS_ENV = "RELEASEGATE_AUDIT_COMPRESS"
+
+# Stored value: MAGIC + dict_id (uint32, 0 = no dictionary) + zlib stream
+MAGIC = b"RGZ1"
+_HEADER = struct.Struct(">4sI")
+NO_DICTIONARY = 0
+
+# zlib only uses the last 32 KiB of a preset dictionary
+MAX_DICT_SIZE = 32 * 1024
+COMPRESSION_LEVEL = 9
+
+# sha256 -> dictionary bytes; dictionaries are immutable, so content-addressing
+# keeps the cache valid across databases whose dict_ids overlap
+_dict_cache: Dict[str, bytes] = {}
+
+
+def compression_enabled() -> bool:
+    return os.getenv(COMPRESS_ENV, "0") == "1"
+
+
+def ensure_compression_schema(conn):
+    """Versioned, append-only compression dictionaries for full_decision_json."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS audit_compression_dicts (
+            dict_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            dictionary BLOB NOT NULL,
+            dictionary_sha256 TEXT NOT NULL,
+            sample_count INTEGER NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS prevent_audit_compression_dicts_update
+        BEFORE UPDATE ON audit_compression_dicts
+        BEGIN
+            SELECT RAISE(FAIL, 'Compression dictionaries are immutable: UPDATE not allowed');
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS prevent_audit_compression_dicts_delete
+        BEFORE DELETE ON audit_compression_dicts
+        BEGIN
+            SELECT RAISE(FAIL, 'Compression dictionaries are immutable: DELETE not allowed');
+        END;
+    """)
+
+
+def _fragments(canonical_json: str) -> Iterable[str]:
+    # Canonical JSON uses ", " between members; each member is a candidate
+    for part in canonical_json.split(", "):
+        if len(part) >= 4:
+            yield part + ", "
+
+
+def train_dictionary(samples: List[str], size: int = MAX_DICT_SIZE) -> bytes:
+    """
+    Build a preset dictionary from sample payloads.
+
+    JSON members that recur across samples (policy ids, messages, enforcement
+    targets, key names) are kept, ranked by bytes saved; the most valuable go
+    last, where zlib matches them at the shortest distance.
+    """
+    doc_freq: Counter = Counter()
+    for sample in samples:
+        doc_freq.update(set(_fragments(sample)))
+
+    ranked = sorted(
+        (fragment for fragment, count in doc_freq.items() if count > 1),
+        key=lambda fragment: (doc_freq[fragment] * len(fragment), fragment),
+        reverse=True,
+    )
+    chosen, used = [], 0
+    for fragment in ranked:
+        encoded = fragment.encode("utf-8")
+        if used + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        used += len(encoded)
+    chosen.reverse()
+    return b"".join(chosen)
+
+
+def store_dictionary(conn, dictionary: bytes, sample_count: int) -> int:
+    """Add a new dictionary version; it becomes the active one. Runs in the caller's transaction."""
+    cursor = conn.execute(
+        "INSERT INTO audit_compression_dicts (dictionary, dictionary_sha256, sample_count, created_at) VALUES (?, ?, ?, ?)",
+        (dictionary, hashlib.sha256(dictionary).hexdigest(), sample_count, datetime.now(timezone.utc).isoformat())
+    )
+    return cursor.lastrowid
+
+
+def get_dictionary(conn, dict_id: int) -> bytes:
+    row = conn.execute("SELECT dictionary_sha256 FROM audit_compression_dicts WHERE dict_id = ?", (dict_id,)).fetchone()
+    if row is None:
+        raise ValueError(f"Unknown compression dictionary {dict_id}")
+    digest = row[0]
+    dictionary = _dict_cache.get(digest)
+    if dictionary is None:
+        blob = conn.execute("SELECT dictionary FROM audit_compression_dicts WHERE dict_id = ?", (dict_id,)).fetchone()[0]
+        dictionary = bytes(blob)
+        if hashlib.sha256(dictionary).hexdigest() != digest:
+            raise ValueError(f"Compression dictionary {dict_id} is corrupt")
+        _dict_cache[digest] = dictionary
+    return dictionary
+
+
+def active_dictionary(conn) -> Tuple[int, bytes]:
+    """Newest dictionary, or (NO_DICTIONARY, b"") if none was trained."""
+    row = conn.execute("SELECT MAX(dict_id) FROM audit_compression_dicts").fetchone()
+    if row[0] is None:
+        return NO_DICTIONARY, b""
+    return row[0], get_dictionary(conn, row[0])
+
+
+def compress(text: str, dict_id: int, dictionary: bytes) -> bytes:
+    if dictionary:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL)
+    return _HEADER.pack(MAGIC, dict_id) + compressor.compress(text.encode("utf-8")) + compressor.flush()
+
+
+def encode_payload(conn, canonical_json: str) -> Union[str, bytes]:
+    """Value to store in full_decision_json: compressed if enabled, else the text itself."""
+    if not compression_enabled():
+        return canonical_json
+    dict_id, dictionary = active_dictionary(conn)
+    return compress(canonical_json, dict_id, dictionary)
+
+
+def decode_payload(conn, value: Union[str, bytes, None]) -> Optional[str]:
+    """Canonical JSON text for a stored full_decision_json value (compressed or not)."""
+    if value is None or isinstance(value, str):
+        return value
+    value = bytes(value)
+    if not value.startswith(MAGIC):
+        return value.decode("utf-8")
+    _, dict_id = _HEADER.unpack_from(value)
+    if dict_id == NO_DICTIONARY:
+        decompressor = zlib.decompressobj()
+    else:
+        decompressor = zlib.decompressobj(zdict=get_dictionary(conn, dict_id))
+    data = decompressor.decompress(value[_HEADER.size:]) + decompressor.flush()
+    return data.decode("utf-8")
+
+
+def train_from_decisions(conn, sample_size: int = 2000) -> Optional[Dict[str, int]]:
+    """
+    Train and store a dictionary from the most recent decisions.
+    Returns stats, or None if there are too few decisions to train on.
+    """
+    rows = conn.execute(
+        "SELECT full_decision_json FROM audit_decisions ORDER BY created_at DESC, decision_id DESC LIMIT ?",
+        (sample_size,)
+    ).fetchall()
+    samples = [decode_payload(conn, row[0]) for row in rows]
+    if len(samples) < 2:
+        return None
+    dictionary = train_dictionary(samples)
+    from releasegate.storage.database import Database
+    dict_id = Database.for_path().write(lambda wconn: store_dictionary(wconn, dictionary, len(samples)))
+
+    raw = sum(len(s.encode("utf-8")) for s in samples)
+    packed = sum(len(compress(s, dict_id, dictionary)) for s in samples)
+    return {"dict_id": dict_id, "dictionary_bytes": len(dictionary), "samples": len(samples),
+            "sample_bytes": raw, "compressed_bytes": packed}
@@ -0,0 +1,48 @@
+import csv
+import json
+from typing import Any, Dict, Iterable, Optional, Sequence, TextIO
+
+from releasegate.audit.reader import ALL_COLUMNS, SUMMARY_COLUMNS, AuditReader
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], out: TextIO, fmt: str, columns: Sequence[str]) -> int:
+    """Write rows to `out` as they arrive. Returns the number of rows written."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=list(columns), extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            out.write(json.dumps(row, default=str) + "\n")
+            count += 1
+    return count
+
+
+def export_decisions(
+    out: TextIO,
+    fmt: str = "ndjson",
+    repo: Optional[str] = None,
+    status: Optional[str] = None,
+    pr: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    include_json: bool = False,
+    page_size: int = 1000,
+) -> int:
+    """
+    Stream audit decisions (oldest first) to `out` in constant memory.
+    full_decision_json is only read when include_json is set.
+    """
+    columns = ALL_COLUMNS if include_json else SUMMARY_COLUMNS
+    rows = AuditReader.iter_decisions(
+        repo=repo, status=status, pr=pr, since=since, until=until,
+        columns=columns, page_size=page_size,
+    )
+    return write_rows(rows, out, fmt, columns)
@@ -1,85 +1,204 @@
 import json
 import hashlib
 import os
-from typing import Optional, Dict
+import threading
+from typing import Optional, Dict, List, Tuple
+
+try:
+    import fcntl
+except ImportError: # Windows: in-process serialization only
+    fcntl = None
 
 from releasegate.audit.types import AuditEvent
-from releasegate.storage.atomic import atomic_write
+from releasegate.storage.group_commit import GroupCommitter
 from releasegate.storage.paths import get_audit_log_path
 
+GENESIS_HASH = "0000000000000000000000000000000000000000000000000000000000000000"
+
+# fsync every committed batch (one fsync per group, not per event)
+AUDIT_FSYNC = os.getenv("RELEASEGATE_AUDIT_FSYNC", "0") == "1"
+
+_TAIL_CHUNK = 64 * 1024
+
+
+def compute_event_hash(event_dict: Dict) -> str:
+    """
+    SHA256 of the canonical JSON representation of the event
+    (excluding the event_hash field itself).
+    """
+    # Create copy to avoid mutating original
+    data = event_dict.copy()
+    data["event_hash"] = None # Nullify for computation
+
+    # Canonical JSON: sort keys, no spaces
+    payload = json.dumps(data, sort_keys=True, separators=(',', ':')).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def read_last_hash(f, size: int) -> Optional[str]:
+    """event_hash of the last line of an open binary log file of `size` bytes."""
+    if size <= 0:
+        return None
+    try:
+        # Read backwards in chunks until we have the whole last line
+        end = size
+        tail = b""
+        while end > 0:
+            start = max(0, end - _TAIL_CHUNK)
+            f.seek(start)
+            tail = f.read(end - start) + tail
+            end = start
+            # Ignore the trailing newline of the last record
+            if tail.rstrip(b"\n").rfind(b"\n") != -1:
+                break
+        last_line = tail.rstrip(b"\n").rsplit(b"\n", 1)[-1].decode()
+        if not last_line.strip():
+            return None
+        return json.loads(last_line).get("event_hash")
+    except Exception:
+        return None
+
+
+class AuditLogWriter:
+    """
+    Serialized, group-committed appender for one audit log file.
+
+    The chain head (last event_hash) and file size are kept in memory, so an
+    append never re-reads the log. Each batch is written under an exclusive
+    flock; if the file's inode or size changed since our last write (another
+    process appended, or the log was rotated), the head is re-read from the
+    tail first, which keeps the chain exact across processes.
+    """
+
+    _writers: Dict[str, "AuditLogWriter"] = {}
+    _writers_lock = threading.Lock()
+
+    def __init__(self, log_path: str):
+        self.log_path = log_path
+        self._fd: Optional[int] = None
+        self._ino: Optional[int] = None
+        self._size = -1
+        self._head: Optional[str] = None
+        self.committer: GroupCommitter[Tuple[AuditEvent, bool], str] = GroupCommitter(self._write_batch)
+
+    @classmethod
+    def for_path(cls, log_path: str) -> "AuditLogWriter":
+        key = os.path.abspath(log_path)
+        with cls._writers_lock:
+            writer = cls._writers.get(key)
+            if writer is None:
+                writer = cls._writers[key] = cls(log_path)
+        return writer
+
+    def append(self, events: List[AuditEvent], fsync: bool = False) -> List[str]:
+        return self.committer.commit([(event, fsync) for event in events])
+
+    def last_hash(self) -> Optional[str]:
+        """Current chain head as stored on disk."""
+        if not os.path.exists(self.log_path):
+            return None
+        with open(self.log_path, "rb") as f:
+            return read_last_hash(f, os.fstat(f.fileno()).st_size)
+
+    def _open(self) -> int:
+        # Reopen if the log was removed or replaced underneath us
+        try:
+            st = os.stat(self.log_path)
+        except FileNotFoundError:
+            st = None
+        if self._fd is not None and (st is None or st.st_ino != self._ino):
+            os.close(self._fd)
+            self._fd = None
+        if self._fd is None:
+            self._fd = os.open(self.log_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            self._ino = os.fstat(self._fd).st_ino
+            self._size = -1
+        return self._fd
+
+    def _write_batch(self, items: List[Tuple[AuditEvent, bool]]) -> List[str]:
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        fd = self._open()
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            size = os.fstat(fd).st_size
+            if size != self._size:
+                with open(fd, "rb", closefd=False) as f:
+                    self._head = read_last_hash(f, size)
+
+            head = self._head
+            lines = []
+            hashes = []
+            for event, _ in items:
+                # 1. Link to previous
+                event.previous_event_hash = head or GENESIS_HASH
+
+                # 2. Compute self hash
+                event_dict = event.to_dict()
+                current_hash = compute_event_hash(event_dict)
+                event.event_hash = current_hash
+                event_dict["event_hash"] = current_hash
+
+                lines.append(json.dumps(event_dict) + "\n")
+                hashes.append(current_hash)
+                head = current_hash
+
+            # 3. One append-only write (and at most one fsync) per batch
+            data = "".join(lines).encode("utf-8")
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if any(durable for _, durable in items):
+                os.fsync(fd)
+
+            self._head = head
+            self._size = size + len(data)
+            return hashes
+        except BaseException:
+            # Unknown on-disk state: re-read the tail next time
+            self._size = -1
+            raise
+        finally:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+
 class AuditLogger:
     """
     Manages the append-only, hash-chained audit log.
     """
-    
-    def __init__(self, repo_name: str):
+
+    def __init__(self, repo_name: str, fsync: Optional[bool] = None):
         self.log_path = get_audit_log_path(repo_name)
+        self.fsync = AUDIT_FSYNC if fsync is None else fsync
         self._ensure_dir()
-    
+        self.writer = AuditLogWriter.for_path(self.log_path)
+
     def _ensure_dir(self):
         os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
 
     def _get_last_hash(self) -> Optional[str]:
         """Reads the last line of the log to get the previous hash."""
-        if not os.path.exists(self.log_path):
-            return None
-        
-        try:
-            with open(self.log_path, 'rb') as f:
-                # Efficiently read last line
-                try:
-                    f.seek(-2, os.SEEK_END)
-                    while f.read(1) != b'\n':
-                        f.seek(-2, os.SEEK_CUR)
-                except OSError:
-                    f.seek(0)
-                
-                last_line = f.readline().decode()
-                
-                if not last_line.strip():
-                    return None
-                
-                data = json.loads(last_line)
-                return data.get("event_hash")
-        except Exception:
-            return None
+        return self.writer.last_hash()
 
     def _compute_hash(self, event_dict: Dict) -> str:
         """
         Computes SHA256 of the canonical JSON representation of the event
         (excluding the event_hash field itself).
         """
-        # Create copy to avoid mutating original
-        data = event_dict.copy()
-        data["event_hash"] = None # Nullify for computation
-        
-        # Canonical JSON: sort keys, no spaces
-        payload = json.dumps(data, sort_keys=True, separators=(',', ':')).encode("utf-8")
-        return hashlib.sha256(payload).hexdigest()
+        return compute_event_hash(event_dict)
 
     def append_event(self, event: AuditEvent):
         """
         Appends a new event to the log efficiently.
+        Concurrent appends to the same log are group-committed.
         """
-        # 1. Link to previous
-        prev_hash = self._get_last_hash()
-        event.previous_event_hash = prev_hash or "0000000000000000000000000000000000000000000000000000000000000000"
-        
-        # 2. Compute self hash
-        event_dict = event.to_dict()
-        current_hash = self._compute_hash(event_dict)
-        event.event_hash = current_hash
-        event_dict["event_hash"] = current_hash
-        
-        # 3. Append-only write
-        # We use standard append mode 'a' here. 
-        # Atomic write is tricky for appending to large files (requires copying).
-        # Since this is a log, OS append is generally safe enough, 
-        # or we could use the atomic utility if we accept the copy cost.
-        # For high-volume logs, direct append is preferred.
-        
-        with open(self.log_path, 'a') as f:
-            f.write(json.dumps(event_dict) + "\n")
-        
-        return current_hash
+        return self.writer.append([event], fsync=self.fsync)[0]
 
+    def append_events(self, events: List[AuditEvent]) -> List[str]:
+        """
+        Appends events as one contiguous run of the chain (single write).
+        Returns their event hashes in order.
+        """
+        return self.writer.append(list(events), fsync=self.fsync)
@@ -0,0 +1,311 @@
+import hashlib
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Store the tree root every N leaves (signed tree heads for consistency proofs)
+ROOT_INTERVAL = int(os.getenv("RELEASEGATE_MERKLE_ROOT_INTERVAL", "256"))
+
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+# RFC 6962 domain separation
+def leaf_hash(decision_hash: str) -> str:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(decision_hash)).hexdigest()
+
+def node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(b"\x01" + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+def _split(n: int) -> int:
+    """Largest power of two smaller than n (n > 1)."""
+    k = 1
+    while k * 2 < n:
+        k *= 2
+    return k
+
+
+def ensure_merkle_schema(conn):
+    """Side tables for the Merkle tree over audit_decisions.decision_hash."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS audit_merkle_leaves (
+            leaf_index INTEGER PRIMARY KEY,
+            decision_id TEXT NOT NULL UNIQUE,
+            decision_rowid INTEGER NOT NULL, -- audit_decisions.rowid (insertion order)
+            leaf_hash TEXT NOT NULL
+        )
+    """)
+    # Complete subtrees only: node (level, idx) covers leaves [idx * 2^level, (idx + 1) * 2^level)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS audit_merkle_nodes (
+            level INTEGER NOT NULL,
+            idx INTEGER NOT NULL,
+            hash TEXT NOT NULL,
+            PRIMARY KEY (level, idx)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS audit_merkle_roots (
+            tree_size INTEGER PRIMARY KEY,
+            root_hash TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    for table in ("audit_merkle_leaves", "audit_merkle_nodes", "audit_merkle_roots"):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS prevent_{table}_update
+            BEFORE UPDATE ON {table}
+            BEGIN
+                SELECT RAISE(FAIL, 'Audit Merkle tree is append-only: UPDATE not allowed');
+            END;
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS prevent_{table}_delete
+            BEFORE DELETE ON {table}
+            BEGIN
+                SELECT RAISE(FAIL, 'Audit Merkle tree is append-only: DELETE not allowed');
+            END;
+        """)
+
+
+class MerkleLog:
+    """
+    Append-only RFC 6962 Merkle tree over decision hashes, in insertion order.
+
+    Leaves and every complete subtree hash are stored, so appending is
+    O(log n) inserts and any root, inclusion proof or consistency proof is
+    built from O(log n) stored nodes without rehashing the table.
+    Runs on the caller's connection and inside the caller's transaction.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._nodes: Dict[Tuple[int, int], str] = {}
+
+    def size(self) -> int:
+        row = self.conn.execute("SELECT MAX(leaf_index) FROM audit_merkle_leaves").fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def sync(self) -> int:
+        """Append leaves for decisions not yet in the tree. Returns the new tree size."""
+        row = self.conn.execute(
+            "SELECT leaf_index, decision_rowid FROM audit_merkle_leaves ORDER BY leaf_index DESC LIMIT 1"
+        ).fetchone()
+        size, last_rowid = (0, 0) if row is None else (row[0] + 1, row[1])
+
+        pending = self.conn.execute(
+            "SELECT rowid, decision_id, decision_hash FROM audit_decisions WHERE rowid > ? ORDER BY rowid",
+            (last_rowid,)
+        ).fetchall()
+        for rowid, decision_id, decision_hash in pending:
+            self._append(size, rowid, decision_id, decision_hash)
+            size += 1
+            if size % ROOT_INTERVAL == 0:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO audit_merkle_roots (tree_size, root_hash, created_at) VALUES (?, ?, ?)",
+                    (size, self.root(size), datetime.now(timezone.utc).isoformat())
+                )
+        return size
+
+    def _append(self, index: int, rowid: int, decision_id: str, decision_hash: str):
+        h = leaf_hash(decision_hash)
+        self.conn.execute(
+            "INSERT INTO audit_merkle_leaves (leaf_index, decision_id, decision_rowid, leaf_hash) VALUES (?, ?, ?, ?)",
+            (index, decision_id, rowid, h)
+        )
+        self._put_node(0, index, h)
+        # Every time a right child completes, its parent subtree is complete too
+        level, idx = 0, index
+        while idx & 1:
+            h = node_hash(self._node(level, idx - 1), h)
+            level, idx = level + 1, idx >> 1
+            self._put_node(level, idx, h)
+
+    def _put_node(self, level: int, idx: int, h: str):
+        self.conn.execute("INSERT INTO audit_merkle_nodes (level, idx, hash) VALUES (?, ?, ?)", (level, idx, h))
+        self._nodes[(level, idx)] = h
+
+    def _node(self, level: int, idx: int) -> str:
+        h = self._nodes.get((level, idx))
+        if h is None:
+            row = self.conn.execute(
+                "SELECT hash FROM audit_merkle_nodes WHERE level = ? AND idx = ?", (level, idx)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Merkle node ({level}, {idx}) missing")
+            h = self._nodes[(level, idx)] = row[0]
+        return h
+
+    def subtree_hash(self, lo: int, hi: int) -> str:
+        """MTH(D[lo:hi]) from stored complete subtrees."""
+        n = hi - lo
+        if n == 0:
+            return EMPTY_ROOT
+        if n & (n - 1) == 0:
+            return self._node(n.bit_length() - 1, lo // n)
+        k = _split(n)
+        return node_hash(self.subtree_hash(lo, lo + k), self.subtree_hash(lo + k, hi))
+
+    def root(self, size: Optional[int] = None) -> str:
+        return self.subtree_hash(0, self.size() if size is None else size)
+
+    def leaf(self, decision_id: str) -> Optional[Tuple[int, str]]:
+        row = self.conn.execute(
+            "SELECT leaf_index, leaf_hash FROM audit_merkle_leaves WHERE decision_id = ?", (decision_id,)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def inclusion_proof(self, index: int, size: int) -> List[str]:
+        """RFC 6962 audit path for leaf `index` in the tree of `size` leaves."""
+        if not 0 <= index < size:
+            raise ValueError(f"Leaf {index} is not in a tree of size {size}")
+        path: List[str] = []
+        lo, hi = 0, size
+        while hi - lo > 1:
+            k = _split(hi - lo)
+            if index < lo + k:
+                path.append(self.subtree_hash(lo + k, hi))
+                hi = lo + k
+            else:
+                path.append(self.subtree_hash(lo, lo + k))
+                lo = lo + k
+        path.reverse()
+        return path
+
+    def consistency_proof(self, first: int, second: int) -> List[str]:
+        """RFC 6962 consistency proof between tree sizes first <= second."""
+        if not 0 < first <= second:
+            raise ValueError(f"Invalid tree sizes for consistency proof: {first}, {second}")
+        proof: List[str] = []
+        lo, hi, m, complete = 0, second, first, True
+        while True:
+            n = hi - lo
+            if m == n:
+                if not complete:
+                    proof.append(self.subtree_hash(lo, hi))
+                break
+            k = _split(n)
+            if m <= k:
+                proof.append(self.subtree_hash(lo + k, hi))
+                hi = lo + k
+            else:
+                proof.append(self.subtree_hash(lo, lo + k))
+                lo, m, complete = lo + k, m - k, False
+        proof.reverse()
+        return proof
+
+    def stored_roots(self) -> List[Dict[str, Any]]:
+        rows = self.conn.execute("SELECT tree_size, root_hash, created_at FROM audit_merkle_roots ORDER BY tree_size").fetchall()
+        return [{"tree_size": r[0], "root_hash": r[1], "created_at": r[2]} for r in rows]
+
+
+def verify_inclusion(leaf: str, index: int, size: int, path: List[str], root: str) -> bool:
+    """RFC 9162 2.1.3.2: check that `leaf` (a leaf hash) is at `index` of the tree with `root`."""
+    if not 0 <= index < size:
+        return False
+    fn, sn, r = index, size - 1, leaf
+    for p in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            if not fn & 1:
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r == root
+
+
+def verify_consistency(first: int, second: int, proof: List[str], first_root: str, second_root: str) -> bool:
+    """RFC 9162 2.1.4.2: check that the tree of size `first` is a prefix of the tree of size `second`."""
+    if first == second:
+        return not proof and first_root == second_root
+    if not 0 < first < second or not proof:
+        return False
+    if first & (first - 1) == 0:
+        proof = [first_root] + list(proof)
+    fn, sn = first - 1, second - 1
+    while fn & 1:
+        fn >>= 1
+        sn >>= 1
+    fr = sr = proof[0]
+    for c in proof[1:]:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            fr = node_hash(c, fr)
+            sr = node_hash(c, sr)
+            if not fn & 1:
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+        else:
+            sr = node_hash(sr, c)
+        fn >>= 1
+        sn >>= 1
+    return fr == first_root and sr == second_root and sn == 0
+
+
+def build_inclusion_proof(conn, decision_id: str, tree_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Self-contained inclusion proof for a recorded decision, or None if unknown."""
+    log = MerkleLog(conn)
+    leaf = log.leaf(decision_id)
+    if leaf is None:
+        return None
+    row = conn.execute("SELECT decision_hash FROM audit_decisions WHERE decision_id = ?", (decision_id,)).fetchone()
+    size = log.size() if tree_size is None else tree_size
+    index, _ = leaf
+    if not index < size <= log.size():
+        raise ValueError(f"Leaf {index} is not in a tree of size {size} (log has {log.size()} leaves)")
+    return {
+        "type": "inclusion",
+        "decision_id": decision_id,
+        "decision_hash": row[0],
+        "leaf_index": index,
+        "tree_size": size,
+        "root_hash": log.root(size),
+        "path": log.inclusion_proof(index, size),
+    }
+
+
+def build_consistency_proof(conn, first: int, second: Optional[int] = None) -> Dict[str, Any]:
+    log = MerkleLog(conn)
+    second = log.size() if second is None else second
+    if not 0 < first <= second <= log.size():
+        raise ValueError(f"Invalid tree sizes for consistency proof: {first}, {second} (log has {log.size()} leaves)")
+    return {
+        "type": "consistency",
+        "first_size": first,
+        "second_size": second,
+        "first_root": log.root(first),
+        "second_root": log.root(second),
+        "path": log.consistency_proof(first, second),
+    }
+
+
+def verify_proof(proof: Dict[str, Any], trusted_root: Optional[str] = None) -> bool:
+    """
+    Verify a proof produced by build_inclusion_proof / build_consistency_proof
+    without database access. `trusted_root` pins the (second) root to one the
+    auditor obtained independently.
+    """
+    try:
+        if proof["type"] == "inclusion":
+            if trusted_root and trusted_root != proof["root_hash"]:
+                return False
+            return verify_inclusion(
+                leaf_hash(proof["decision_hash"]), proof["leaf_index"], proof["tree_size"],
+                proof["path"], proof["root_hash"]
+            )
+        if proof["type"] == "consistency":
+            if trusted_root and trusted_root != proof["second_root"]:
+                return False
+            return verify_consistency(
+                proof["first_size"], proof["second_size"], proof["path"],
+                proof["first_root"], proof["second_root"]
+            )
+    except (KeyError, TypeError, ValueError):
+        return False
+    return False
@@ -1,39 +1,135 @@
 import sqlite3
 import json
-from typing import List, Optional, Dict, Any
-from releasegate.config import DB_PATH
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple
+
+# Every column except the (large) canonical decision JSON
+SUMMARY_COLUMNS = [
+    "decision_id", "context_id", "repo", "pr_number", "release_status",
+    "policy_bundle_hash", "engine_version", "decision_hash", "created_at", "evaluation_key",
+]
+ALL_COLUMNS = SUMMARY_COLUMNS + ["full_decision_json"]
+
+
+def _projection(columns: Optional[Sequence[str]]) -> str:
+    if columns is None:
+        return "*"
+    unknown = [c for c in columns if c not in ALL_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown audit column(s): {', '.join(unknown)}")
+    return ", ".join(columns)
+
+
+def _row_dict(conn, row, columns=None) -> Dict[str, Any]:
+    from releasegate.audit.compression import decode_payload
+    d = dict(row) if columns is None else {c: row[c] for c in columns}
+    if "full_decision_json" in d:
+        d["full_decision_json"] = decode_payload(conn, d["full_decision_json"])
+    return d
+
+
+def _filters(repo, status, pr, since=None, until=None) -> Tuple[List[str], List[Any]]:
+    clauses, params = [], []
+    if repo:
+        clauses.append("repo = ?")
+        params.append(repo)
+    if status:
+        clauses.append("release_status = ?")
+        params.append(status)
+    if pr:
+        clauses.append("pr_number = ?")
+        params.append(pr)
+    if since:
+        clauses.append("created_at >= ?")
+        params.append(since)
+    if until:
+        clauses.append("created_at < ?")
+        params.append(until)
+    return clauses, params
 
 class AuditReader:
     """
     Read-only access to audit logs.
+    Uses the per-thread audit connection (see audit.db.get_connection).
+    full_decision_json is always returned as canonical JSON text, even when
+    stored compressed.
     """
     
     @staticmethod
-    def list_decisions(repo: str, limit: int = 20, status: Optional[str] = None, pr: Optional[int] = None) -> List[Dict[str, Any]]:
+    def list_decisions(
+        repo: str,
+        limit: int = 20,
+        status: Optional[str] = None,
+        pr: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        before: Optional[Tuple[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Most recent decisions first. `columns` projects the result (default: all
+        columns); `before` is the (created_at, decision_id) of the last row of
+        the previous page, for keyset pagination.
+        """
         from releasegate.audit.db import get_connection
         conn = get_connection()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
-        query = "SELECT * FROM audit_decisions WHERE repo = ?"
-        params = [repo]
+        clauses, params = _filters(repo, status, pr)
+        if before:
+            clauses.append("(created_at, decision_id) < (?, ?)")
+            params.extend(before)
         
-        if status:
-            query += " AND release_status = ?"
-            params.append(status)
-            
-        if pr:
-            query += " AND pr_number = ?"
-            params.append(pr)
-            
-        query += " ORDER BY created_at DESC LIMIT ?"
+        query = f"SELECT {_projection(columns)} FROM audit_decisions WHERE {' AND '.join(clauses)}"
+        query += " ORDER BY created_at DESC, decision_id DESC LIMIT ?"
         params.append(limit)
         
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
         
-        return [dict(r) for r in rows]
+        return [_row_dict(conn, r) for r in rows]
+
+    @staticmethod
+    def iter_decisions(
+        repo: Optional[str] = None,
+        status: Optional[str] = None,
+        pr: Optional[int] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        include_json: bool = False,
+        page_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream decisions oldest first, one keyset page at a time, so memory
+        stays constant regardless of table size. Without `columns`, selects
+        SUMMARY_COLUMNS (plus full_decision_json if include_json).
+        """
+        from releasegate.audit.db import get_connection
+        if columns is None:
+            columns = ALL_COLUMNS if include_json else SUMMARY_COLUMNS
+        # The cursor key is always selected; strip it again if not requested
+        select = list(columns) + [c for c in ("created_at", "decision_id") if c not in columns]
+        projection = _projection(select)
+        
+        clauses, params = _filters(repo, status, pr, since, until)
+        after: Optional[Tuple[str, str]] = None
+        while True:
+            page_clauses, page_params = list(clauses), list(params)
+            if after:
+                page_clauses.append("(created_at, decision_id) > (?, ?)")
+                page_params.extend(after)
+            query = f"SELECT {projection} FROM audit_decisions"
+            if page_clauses:
+                query += f" WHERE {' AND '.join(page_clauses)}"
+            query += " ORDER BY created_at, decision_id LIMIT ?"
+            page_params.append(page_size)
+            
+            conn = get_connection()
+            rows = conn.execute(query, page_params).fetchall()
+            for row in rows:
+                yield _row_dict(conn, row, columns)
+            if len(rows) < page_size:
+                return
+            after = (rows[-1]["created_at"], rows[-1]["decision_id"])
 
     @staticmethod
     def get_decision(decision_id: str) -> Optional[Dict[str, Any]]:
@@ -44,10 +140,9 @@ class AuditReader:
         
         cursor.execute("SELECT * FROM audit_decisions WHERE decision_id = ?", (decision_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            d = dict(row)
+            d = _row_dict(conn, row)
             # Parse JSON for convenience if the caller wants it, or keep it strict. 
             # Let's return raw dictionary but maybe parse the full_decision_json if requested?
             # For now return DB columns.
@@ -63,8 +158,7 @@ class AuditReader:
         
         cursor.execute("SELECT * FROM audit_decisions WHERE evaluation_key = ?", (evaluation_key,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            return dict(row)
+            return _row_dict(conn, row)
         return None
@@ -2,7 +2,6 @@ import sqlite3
 import hashlib
 import json
 from datetime import datetime, timezone
-from releasegate.config import DB_PATH
 from releasegate.decision.types import Decision
 
 class AuditRecorder:
@@ -60,13 +59,14 @@ class AuditRecorder:
         # 2. Compute Integrity Hash
         decision_hash = hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
         
-        # 3. Insert
+        # 3. Insert (single writer; one transaction with the Merkle leaf and rollups)
         from releasegate.audit.db import get_connection
-        conn = get_connection()
-        cursor = conn.cursor()
+        from releasegate.audit.compression import encode_payload, decode_payload
+        from releasegate.storage.database import Database
+        conn = get_connection() # Ensures the audit schema
         
-        try:
-            cursor.execute("""
+        def insert(wconn):
+            wconn.execute("""
                 INSERT INTO audit_decisions (
                     decision_id, context_id, repo, pr_number, 
                     release_status, policy_bundle_hash, engine_version, 
@@ -81,28 +81,33 @@ class AuditRecorder:
                 decision.policy_bundle_hash,
                 AuditRecorder.ENGINE_VERSION,
                 decision_hash,
-                canonical_json,
+                encode_payload(wconn, canonical_json), # decision_hash is over the uncompressed JSON
                 decision.timestamp.isoformat(),
                 decision.evaluation_key
             ))
-            conn.commit()
+            # Extend the Merkle tree in the same transaction
+            from releasegate.audit.merkle import MerkleLog
+            MerkleLog(wconn).sync()
+            # Analytics rollups, also in the same transaction
+            from releasegate.storage.rollups import record_decision
+            record_decision(wconn, repo, decision.timestamp.isoformat()[:10], decision.release_status, decision.matched_policies)
+
+        try:
+            Database.for_path().write(insert)
             return decision
 
         except sqlite3.IntegrityError as e:
             # Idempotency: evaluation_key already exists -> fetch existing row
             if "audit_decisions.evaluation_key" in str(e) or "evaluation_key" in str(e):
-                cursor.execute("""
+                row = conn.execute("""
                     SELECT full_decision_json
                     FROM audit_decisions
                     WHERE evaluation_key = ?
                     LIMIT 1
-                """, (decision.evaluation_key,))
-                row = cursor.fetchone()
+                """, (decision.evaluation_key,)).fetchone()
                 if row and row[0]:
-                    existing = row[0]
+                    existing = decode_payload(conn, row[0])
                     if isinstance(existing, str):
                         existing = json.loads(existing)
                     return Decision.model_validate(existing)
             raise
-        finally:
-            conn.close()
@@ -1,13 +1,77 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional
 import os
-import json
+import sys
 import hashlib
+import threading
+import yaml
 from releasegate.audit.types import TraceableFinding
 from releasegate.engine import PolicyResult
+from releasegate.policy.registry import policy_dir_fingerprint
 
 # Assuming Phase 4 compiled policies are in a known location
 COMPILED_ROOT = "releasegate/policy/compiled"
 
+class CompiledPolicyEntry(NamedTuple):
+    path: str
+    data: Dict[str, Any]
+
+class CompiledPolicyIndex:
+    """
+    policy_id -> compiled file path and contents, for one version of a compiled root.
+
+    Built with a single walk of the directory (Phase 4 naming convention:
+    POLICY_ID.yaml, top-level files win over subdirectories). Shared across
+    injectors via `shared()`, and rebuilt only when the directory fingerprint
+    changes.
+    """
+
+    _shared: Dict[str, "CompiledPolicyIndex"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, compiled_root: str, version: Optional[str] = None):
+        self.compiled_root = compiled_root
+        self.version = version or policy_dir_fingerprint(compiled_root)
+        self.entries: Dict[str, CompiledPolicyEntry] = {}
+
+        for root, dirs, files in os.walk(compiled_root):
+            dirs.sort()
+            for file in sorted(files):
+                if not file.endswith(".yaml"):
+                    continue
+                policy_id = file[:-len(".yaml")]
+                if policy_id in self.entries:
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    with open(path) as f:
+                        data = yaml.safe_load(f)
+                except Exception as e:
+                    print(f"WARN: Failed to index compiled policy {path}: {e}", file=sys.stderr)
+                    continue
+                if isinstance(data, dict):
+                    self.entries[policy_id] = CompiledPolicyEntry(path, data)
+
+    @classmethod
+    def shared(cls, compiled_root: str = COMPILED_ROOT) -> "CompiledPolicyIndex":
+        """Index for the current version of compiled_root, built once per version."""
+        key = os.path.abspath(compiled_root)
+        version = policy_dir_fingerprint(compiled_root)
+        index = cls._shared.get(key)
+        if index is not None and index.version == version:
+            return index
+        with cls._shared_lock:
+            index = cls._shared.get(key)
+            if index is None or index.version != version:
+                index = cls(compiled_root, version)
+                cls._shared[key] = index
+        return index
+
+    def get(self, policy_id: str) -> Optional[CompiledPolicyEntry]:
+        return self.entries.get(policy_id)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
 class TraceabilityInjector:
     """
     Enriches raw Engine results with Traceable metadata from Phase 4 compiled artifacts.
@@ -15,32 +79,12 @@ class TraceabilityInjector:
     
     def __init__(self, compiled_root: str = COMPILED_ROOT):
         self.compiled_root = compiled_root
-        self.policy_cache = {}
+        self.index = CompiledPolicyIndex.shared(compiled_root)
     
     def _load_policy(self, policy_id: str) -> Optional[Dict]:
-        """Loads compiled YAML for a rule ID."""
-        if policy_id in self.policy_cache:
-            return self.policy_cache[policy_id]
-        
-        # Try to find file (Phase 4 compilation naming convention: POLICY_ID.yaml)
-        # Note: Rule IDs are unique files in Phase 4 output
-        path = os.path.join(self.compiled_root, f"{policy_id}.yaml")
-        if not os.path.exists(path):
-            # Try searching subdirs (e.g. standards/soc2/) 
-            for root, _, files in os.walk(self.compiled_root):
-                if f"{policy_id}.yaml" in files:
-                    path = os.path.join(root, f"{policy_id}.yaml")
-                    break
-            else:
-                return None
-        
-        try:
-            with open(path) as f:
-                data = json.load(f) # It's JSON-compatible YAML (loaded as dict)
-                self.policy_cache[policy_id] = data
-                return data
-        except Exception:
-            return None
+        """Compiled policy content for a rule ID."""
+        entry = self.index.get(policy_id)
+        return entry.data if entry else None
 
     def inject(self, result: PolicyResult) -> TraceableFinding:
         """
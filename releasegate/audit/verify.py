@@ -0,0 +1,265 @@
+import hashlib
+import hmac
+import json
+import mmap
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from releasegate.audit.log import GENESIS_HASH, compute_event_hash
+from releasegate.storage.atomic import atomic_write
+
+# HMAC key for checkpoints; without it no checkpoints are written or trusted
+CHECKPOINT_KEY_ENV = "RELEASEGATE_AUDIT_CHECKPOINT_KEY"
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+@dataclass
+class ChunkResult:
+    start: int
+    end: int
+    count: int = 0
+    first_prev: Optional[str] = None # previous_event_hash of the chunk's first entry
+    last_hash: Optional[str] = None
+    error_offset: Optional[int] = None
+    error_index: Optional[int] = None # Entry index within the chunk
+    error: Optional[str] = None
+
+
+@dataclass
+class LogVerification:
+    log_path: str
+    ok: bool
+    entries_verified: int # Entries checked in this run
+    total_entries: int # Including entries covered by the checkpoint
+    start_offset: int
+    head_hash: Optional[str]
+    resumed_from_checkpoint: bool = False
+    checkpoint_written: bool = False
+    broken_at_offset: Optional[int] = None # Byte offset of the first broken entry
+    broken_entry: Optional[int] = None # 0-based entry number in the log
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class DecisionVerification:
+    ok: bool
+    checked: int
+    mismatched: List[str] = field(default_factory=list) # decision_ids
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def checkpoint_path(log_path: str) -> str:
+    return log_path + ".checkpoint"
+
+
+def _sign(payload: Dict[str, Any], key: bytes) -> str:
+    message = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode("utf-8")
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+def _checkpoint_key() -> Optional[bytes]:
+    key = os.getenv(CHECKPOINT_KEY_ENV)
+    return key.encode("utf-8") if key else None
+
+
+def read_checkpoint(log_path: str, key: bytes) -> Optional[Dict[str, Any]]:
+    """A checkpoint whose signature is valid, or None."""
+    path = checkpoint_path(log_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        signature = data.pop("signature")
+    except Exception:
+        return None
+    if not hmac.compare_digest(signature, _sign(data, key)):
+        return None
+    return data
+
+
+def write_checkpoint(log_path: str, offset: int, entries: int, head_hash: str, key: bytes):
+    data = {
+        "log": os.path.basename(log_path),
+        "offset": offset,
+        "entries": entries,
+        "head_hash": head_hash,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+    data["signature"] = _sign(data, key)
+    with atomic_write(checkpoint_path(log_path)) as f:
+        json.dump(data, f, indent=2)
+
+
+def _line_hash_at(mm: mmap.mmap, end: int) -> Optional[str]:
+    """event_hash of the line ending at byte `end` (exclusive, after its newline)."""
+    if end <= 0 or end > len(mm) or mm[end - 1:end] != b"\n":
+        return None
+    start = mm.rfind(b"\n", 0, end - 1) + 1
+    try:
+        return json.loads(mm[start:end - 1]).get("event_hash")
+    except Exception:
+        return None
+
+
+def split_chunks(mm: mmap.mmap, start: int, end: int, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """Split [start, end) into ranges that begin and end on line boundaries."""
+    chunks = []
+    pos = start
+    while pos < end:
+        cut = min(pos + chunk_bytes, end)
+        if cut < end:
+            newline = mm.find(b"\n", cut - 1, end)
+            cut = end if newline == -1 else newline + 1
+        chunks.append((pos, cut))
+        pos = cut
+    return chunks
+
+
+def verify_chunk(log_path: str, start: int, end: int) -> ChunkResult:
+    """
+    Recompute hashes of the entries in [start, end) and check linkage inside
+    the chunk. Linkage to the previous chunk is checked by the caller.
+    Module-level so it can run in a worker process.
+    """
+    result = ChunkResult(start=start, end=end)
+    with open(log_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = start
+        prev = None
+        while pos < end:
+            newline = mm.find(b"\n", pos, end)
+            line_end = end if newline == -1 else newline
+            error = None
+            try:
+                if newline == -1:
+                    raise ValueError("truncated entry (no trailing newline)")
+                data = json.loads(mm[pos:line_end])
+                if not isinstance(data, dict):
+                    raise ValueError("not a JSON object")
+                stored = data.get("event_hash")
+                if compute_event_hash(data) != stored:
+                    error = "event_hash mismatch (entry modified)"
+                elif result.count and data.get("previous_event_hash") != prev:
+                    error = "previous_event_hash does not link to the preceding entry"
+            except ValueError as e:
+                error = f"unparsable entry: {e}"
+
+            if error:
+                result.error_offset = pos
+                result.error_index = result.count
+                result.error = error
+                return result
+
+            if result.count == 0:
+                result.first_prev = data.get("previous_event_hash")
+            prev = stored
+            result.last_hash = stored
+            result.count += 1
+            pos = line_end + 1
+    return result
+
+
+def verify_log(
+    log_path: str,
+    workers: Optional[int] = None,
+    use_checkpoint: bool = True,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    key: Optional[bytes] = None,
+) -> LogVerification:
+    """
+    Verify a hash-chained audit.ndjson written by AuditLogger.
+
+    The log is memory-mapped and split into line-aligned chunks whose hashes
+    are recomputed in parallel worker processes; chunk boundaries are then
+    checked for linkage in order. With a checkpoint key (argument or
+    RELEASEGATE_AUDIT_CHECKPOINT_KEY), verification resumes after the last
+    valid signed checkpoint and a new checkpoint is written on success.
+    """
+    key = key or _checkpoint_key()
+    size = os.path.getsize(log_path) if os.path.exists(log_path) else 0
+    if size == 0:
+        return LogVerification(log_path, ok=True, entries_verified=0, total_entries=0,
+                               start_offset=0, head_hash=None)
+
+    with open(log_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start, base_entries, expected_prev = 0, 0, GENESIS_HASH
+        resumed = False
+        if key and use_checkpoint:
+            cp = read_checkpoint(log_path, key)
+            # Only trust a checkpoint whose entry is still where it was
+            if cp and cp["offset"] <= size and _line_hash_at(mm, cp["offset"]) == cp["head_hash"]:
+                start, base_entries, expected_prev = cp["offset"], cp["entries"], cp["head_hash"]
+                resumed = True
+        chunks = split_chunks(mm, start, size, chunk_bytes)
+
+    if workers is None:
+        workers = min(len(chunks), os.cpu_count() or 1)
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(verify_chunk, [log_path] * len(chunks), *zip(*chunks)))
+    else:
+        results = [verify_chunk(log_path, s, e) for s, e in chunks]
+
+    report = LogVerification(log_path, ok=True, entries_verified=0, total_entries=base_entries,
+                             start_offset=start, head_hash=expected_prev if resumed else None,
+                             resumed_from_checkpoint=resumed)
+    for chunk in results:
+        # Boundary linkage: first entry of this chunk must point at the previous head
+        if chunk.count and chunk.first_prev != expected_prev:
+            report.ok = False
+            report.broken_at_offset = chunk.start
+            report.broken_entry = report.total_entries
+            report.error = "previous_event_hash does not link to the preceding entry"
+            return report
+        if chunk.error:
+            report.ok = False
+            report.broken_at_offset = chunk.error_offset
+            report.broken_entry = report.total_entries + chunk.error_index
+            report.error = chunk.error
+            report.entries_verified += chunk.error_index
+            return report
+        report.entries_verified += chunk.count
+        report.total_entries += chunk.count
+        if chunk.count:
+            expected_prev = chunk.last_hash
+            report.head_hash = chunk.last_hash
+
+    if key and report.head_hash and report.entries_verified:
+        write_checkpoint(log_path, size, report.total_entries, report.head_hash, key)
+        report.checkpoint_written = True
+    return report
+
+
+def verify_decisions(batch_size: int = 1000) -> DecisionVerification:
+    """
+    Recompute decision_hash over the stored canonical JSON of every audit
+    decision (decompressed first if stored compressed).
+    """
+    from releasegate.audit.db import get_connection
+    from releasegate.audit.compression import decode_payload
+    conn = get_connection()
+    cursor = conn.execute("SELECT decision_id, decision_hash, full_decision_json FROM audit_decisions")
+    report = DecisionVerification(ok=True, checked=0)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for decision_id, decision_hash, stored_json in rows:
+            report.checked += 1
+            try:
+                canonical_json = decode_payload(conn, stored_json)
+            except (ValueError, zlib.error):
+                canonical_json = None
+            if canonical_json is None or hashlib.sha256(canonical_json.encode("utf-8")).hexdigest() != decision_hash:
+                report.ok = False
+                report.mismatched.append(decision_id)
+    return report
@@ -47,6 +47,64 @@ def build_parser() -> argparse.ArgumentParser:
     # audit show
     audit_show = audit_sub.add_parser("show", help="Show full decision details")
     audit_show.add_argument("--decision-id", required=True)
+    
+    # audit export
+    audit_export = audit_sub.add_parser("export", help="Stream decisions as NDJSON or CSV")
+    audit_export.add_argument("--repo", help="Only this repo (default: all)")
+    audit_export.add_argument("--format", default="ndjson", choices=["ndjson", "csv"])
+    audit_export.add_argument("--output", help="Output file (default: stdout)")
+    audit_export.add_argument("--status", choices=["ALLOWED", "BLOCKED", "CONDITIONAL"])
+    audit_export.add_argument("--pr", type=int)
+    audit_export.add_argument("--since", help="Only decisions created at or after this ISO timestamp")
+    audit_export.add_argument("--until", help="Only decisions created before this ISO timestamp")
+    audit_export.add_argument("--include-json", action="store_true", help="Include full_decision_json")
+    audit_export.add_argument("--page-size", type=int, default=1000)
+    
+    # audit train-dict
+    audit_train = audit_sub.add_parser("train-dict", help="Train a compression dictionary for stored decision JSON")
+    audit_train.add_argument("--samples", type=int, default=2000, help="Number of recent decisions to sample")
+    
+    # audit verify
+    audit_verify = audit_sub.add_parser("verify", help="Verify audit log hash chain and decision hashes")
+    audit_verify.add_argument("--repo", help="Verify the hash-chained audit log of this repo")
+    audit_verify.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    audit_verify.add_argument("--full", action="store_true", help="Ignore checkpoints and verify from the start")
+    audit_verify.add_argument("--decisions", action="store_true", help="Verify decision_hash of stored decisions")
+    
+    # audit prove / consistency / verify-proof (Merkle proofs)
+    audit_prove = audit_sub.add_parser("prove", help="Produce and check a Merkle inclusion proof for a decision")
+    audit_prove.add_argument("--decision-id", required=True)
+    audit_prove.add_argument("--tree-size", type=int, help="Prove against this tree size (default: current)")
+    audit_prove.add_argument("--output", help="Write the proof JSON to file")
+    
+    audit_consistency = audit_sub.add_parser("consistency", help="Produce a Merkle consistency proof between two tree sizes")
+    audit_consistency.add_argument("--first", type=int, required=True)
+    audit_consistency.add_argument("--second", type=int, help="Default: current tree size")
+    audit_consistency.add_argument("--output", help="Write the proof JSON to file")
+    
+    audit_verify_proof = audit_sub.add_parser("verify-proof", help="Verify a proof file offline (no database)")
+    audit_verify_proof.add_argument("--proof", required=True, help="Proof JSON file")
+    audit_verify_proof.add_argument("--root", help="Trusted root hash to check the proof against")
+
+    # Compile Bundle Command
+    bundle_p = sub.add_parser("compile-bundle", help="Write a pre-validated policy bundle for fast startup.")
+    bundle_p.add_argument("--policy-dir", action="append",
+                          help="Policy directory (repeatable; default: compiled and def policy dirs)")
+    bundle_p.add_argument("--schema", choices=["compiled", "def", "auto"],
+                          help="Policy schema (default: per directory, else auto)")
+
+    sub.add_parser("backfill-rollups", help="Rebuild daily analytics rollups from run and audit history.")
+
+    cache_p = sub.add_parser("provider-cache", help="Inspect or maintain the GitHub/GitLab API response caches.")
+    cache_p.add_argument("action", choices=["stats", "maintain"])
+    cache_p.add_argument("--table", choices=["github_cache", "gitlab_cache"], action="append",
+                         help="Cache table (repeatable; default: both)")
+
+    history_p = sub.add_parser("export-history", help="Export run and label history to partitioned Parquet (incremental).")
+    history_p.add_argument("--out", default="data/history", help="Output directory (default: data/history)")
+    history_p.add_argument("--repo", help="Only export this repo")
+    history_p.add_argument("--full", action="store_true", help="Rebuild the export from scratch")
+    history_p.add_argument("--batch-size", type=int, default=50000)
 
     sub.add_parser("version", help="Print version.")
     return p
@@ -358,6 +416,62 @@ def main() -> int:
             return 1
         return 0
 
+    if args.cmd == "compile-bundle":
+        from releasegate.policy.bundle import write_bundle, bundle_path
+        
+        defaults = {"releasegate/policy/compiled": "compiled", "releasegate/policy/policies": "def"}
+        targets = args.policy_dir or list(defaults)
+        failed = False
+        for policy_dir in targets:
+            schema = args.schema or defaults.get(policy_dir.rstrip("/"), "auto")
+            if not os.path.isdir(policy_dir):
+                print(f"Error: Policy directory {policy_dir} not found.", file=sys.stderr)
+                failed = True
+                continue
+            try:
+                header = write_bundle(policy_dir, schema=schema)
+            except Exception as e:
+                print(f"Error: Failed to bundle {policy_dir}: {e}", file=sys.stderr)
+                failed = True
+                continue
+            print(f"Bundled {header['policy_count']} {schema} policies from {header['source_files']} files -> {bundle_path(policy_dir)}")
+        return 1 if failed else 0
+
+    if args.cmd == "backfill-rollups":
+        import json
+        from releasegate.audit.db import get_connection
+        from releasegate.storage.database import Database
+        from releasegate.storage.rollups import backfill
+        
+        get_connection() # Ensures the audit schema
+        print(json.dumps(Database.for_path().write(backfill), indent=2))
+        return 0
+
+    if args.cmd == "provider-cache":
+        import json
+        from releasegate.storage.provider_cache import CACHE_TABLES, ProviderCache
+        from releasegate.storage.schema import init_db
+        
+        init_db()
+        result = {}
+        for table in args.table or CACHE_TABLES:
+            cache = ProviderCache(table, interval_s=0)
+            result[table] = cache.maintain() if args.action == "maintain" else cache.stats()
+        print(json.dumps(result, indent=2))
+        return 0
+
+    if args.cmd == "export-history":
+        import json
+        from releasegate.storage.history_export import export_history
+        
+        try:
+            stats = export_history(args.out, repo=args.repo, batch_size=args.batch_size, full=args.full)
+        except (RuntimeError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(stats, indent=2))
+        return 0
+
     if args.cmd == "audit":
         from releasegate.audit.reader import AuditReader
         
@@ -384,6 +498,105 @@ def main() -> int:
             else:
                 print("Decision not found.", file=sys.stderr)
                 return 1
+        
+        elif args.audit_cmd == "export":
+            from releasegate.audit.export import export_decisions
+            
+            out = open(args.output, "w", newline="") if args.output else sys.stdout
+            try:
+                count = export_decisions(
+                    out, fmt=args.format, repo=args.repo, status=args.status, pr=args.pr,
+                    since=args.since, until=args.until, include_json=args.include_json,
+                    page_size=args.page_size,
+                )
+            finally:
+                if args.output:
+                    out.close()
+            print(f"Exported {count} decisions.", file=sys.stderr)
+        
+        elif args.audit_cmd == "train-dict":
+            import json
+            from releasegate.audit.db import get_connection
+            from releasegate.audit.compression import train_from_decisions, COMPRESS_ENV
+            
+            stats = train_from_decisions(get_connection(), sample_size=args.samples)
+            if stats is None:
+                print("Not enough decisions to train a dictionary.", file=sys.stderr)
+                return 1
+            print(json.dumps(stats, indent=2))
+            print(f"New decisions are compressed with it when {COMPRESS_ENV}=1.", file=sys.stderr)
+        
+        elif args.audit_cmd == "verify":
+            import json
+            from releasegate.audit.verify import verify_log, verify_decisions
+            from releasegate.storage.paths import get_audit_log_path
+            
+            if not args.repo and not args.decisions:
+                print("Error: pass --repo and/or --decisions", file=sys.stderr)
+                return 2
+            
+            report = {}
+            ok = True
+            if args.repo:
+                log_result = verify_log(get_audit_log_path(args.repo), workers=args.workers, use_checkpoint=not args.full)
+                report["log"] = log_result.to_dict()
+                ok = ok and log_result.ok
+            if args.decisions:
+                decision_result = verify_decisions()
+                report["decisions"] = decision_result.to_dict()
+                ok = ok and decision_result.ok
+            print(json.dumps(report, indent=2))
+            return 0 if ok else 1
+        
+        elif args.audit_cmd in ("prove", "consistency"):
+            import json
+            import hashlib
+            from releasegate.audit.db import get_connection
+            from releasegate.audit.merkle import MerkleLog, build_inclusion_proof, build_consistency_proof, verify_proof
+            from releasegate.audit.compression import decode_payload
+            
+            from releasegate.storage.database import Database
+            
+            conn = get_connection()
+            try:
+                # Decisions recorded before the tree existed are appended on first use
+                Database.for_path().write(lambda wconn: MerkleLog(wconn).sync())
+                if args.audit_cmd == "prove":
+                    proof = build_inclusion_proof(conn, args.decision_id, args.tree_size)
+                    if proof is None:
+                        print("Decision not found in the audit Merkle tree.", file=sys.stderr)
+                        return 1
+                    # The leaf commits to decision_hash; check it still matches the stored decision
+                    row = conn.execute(
+                        "SELECT full_decision_json FROM audit_decisions WHERE decision_id = ?", (args.decision_id,)
+                    ).fetchone()
+                    stored_hash = hashlib.sha256(decode_payload(conn, row[0]).encode("utf-8")).hexdigest()
+                    proof["decision_hash_matches_record"] = stored_hash == proof["decision_hash"]
+                else:
+                    proof = build_consistency_proof(conn, args.first, args.second)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+            
+            proof["valid"] = verify_proof(proof) and proof.get("decision_hash_matches_record", True)
+            if args.output:
+                with open(args.output, "w") as f:
+                    json.dump(proof, f, indent=2)
+            print(json.dumps(proof, indent=2))
+            return 0 if proof["valid"] else 1
+        
+        elif args.audit_cmd == "verify-proof":
+            import json
+            import time
+            from releasegate.audit.merkle import verify_proof
+            
+            with open(args.proof) as f:
+                proof = json.load(f)
+            start = time.perf_counter()
+            valid = verify_proof(proof, trusted_root=args.root)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(json.dumps({"type": proof.get("type"), "valid": valid, "elapsed_ms": round(elapsed_ms, 3)}, indent=2))
+            return 0 if valid else 1
         return 0
 
     return 2
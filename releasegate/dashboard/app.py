@@ -1,5 +1,4 @@
 import streamlit as st
-import sqlite3
 import pandas as pd
 import json
 import os
@@ -8,26 +7,36 @@ import sys
 # Add project root to path so we can import releasegate modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from releasegate.config import DB_PATH
 from releasegate.storage.sqlite import add_label
+from releasegate.storage import rollups
+from releasegate.storage.database import get_database, read_connection
+from releasegate.storage.schema import init_db
 from releasegate.model.train import train as train_model
 
 st.set_page_config(page_title="ComplianceBot Dashboard", page_icon=None, layout="wide")
 
 # --- Helper Functions ---
 def get_db_connection():
-    return sqlite3.connect(DB_PATH)
+    # Pooled per-thread read connection; not closed by callers
+    return read_connection()
 
-def load_data():
+# Only the most recent runs are loaded for the history table; KPIs and
+# charts come from the daily rollups, so reruns stay fast as history grows
+HISTORY_LIMIT = 500
+
+def load_data(repo=None):
     conn = get_db_connection()
-    # Load all runs
     query = """
     SELECT repo, pr_number, risk_score, risk_level, created_at, reasons_json, features_json
     FROM pr_runs
-    ORDER BY created_at DESC
     """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    params = []
+    if repo:
+        query += " WHERE repo = ?"
+        params.append(repo)
+    query += " ORDER BY created_at DESC LIMIT ?"
+    params.append(HISTORY_LIMIT)
+    df = pd.read_sql_query(query, conn, params=params)
     
     # Process JSON columns
     df['reasons'] = df['reasons_json'].apply(lambda x: json.loads(x) if x else [])
@@ -36,13 +45,24 @@ def load_data():
     df['created_at'] = pd.to_datetime(df['created_at'], format='mixed')
     return df
 
+def load_rollups(repo=None):
+    init_db()
+    conn = get_db_connection()
+    # Databases created before rollups existed: build them once from history
+    if not rollups.rollup_repos(conn) and conn.execute("SELECT 1 FROM pr_runs LIMIT 1").fetchone():
+        get_database().write(rollups.backfill)
+    daily = pd.DataFrame(rollups.daily_run_stats(conn, repo=repo), columns=["day", "runs", "high", "risk_sum"])
+    levels = rollups.run_level_counts(conn, repo=repo)
+    repos = rollups.rollup_repos(conn)
+    if not daily.empty:
+        daily['day'] = pd.to_datetime(daily['day'])
+        daily['risk_avg'] = daily['risk_sum'] / daily['runs']
+    return daily, levels, repos
+
 def load_stats():
     conn = get_db_connection()
-    total = conn.execute("SELECT COUNT(*) FROM pr_runs").fetchone()[0]
-    high_risk = conn.execute("SELECT COUNT(*) FROM pr_runs WHERE risk_level='HIGH'").fetchone()[0]
     labeled = conn.execute("SELECT COUNT(*) FROM pr_labels").fetchone()[0]
-    conn.close()
-    return total, high_risk, labeled
+    return labeled
 
 def load_unlabeled_prs():
     conn = get_db_connection()
@@ -55,26 +75,26 @@ def load_unlabeled_prs():
     ORDER BY r.created_at DESC
     """
     df = pd.read_sql_query(query, conn)
-    conn.close()
     return df
 
 # --- Sidebar Filters ---
 st.sidebar.title("Filters")
-df = load_data()
+_, _, all_repos = load_rollups()
 
-repos = ["All"] + list(df['repo'].unique()) if not df.empty else ["All"]
+repos = ["All"] + all_repos
 selected_repo = st.sidebar.selectbox("Filter by Repository", repos)
+repo_filter = None if selected_repo == "All" else selected_repo
 
-if selected_repo != "All":
-    df = df[df['repo'] == selected_repo]
+daily_df, level_counts, _ = load_rollups(repo_filter)
+df = load_data(repo_filter)
 
 # --- Main Dashboard ---
 st.title("ComplianceBot Dashboard")
 
 # 1. KPI Cards
-total_prs = len(df)
-high_risk_prs = len(df[df['risk_level'] == 'HIGH'])
-avg_score = df['risk_score'].mean() if not df.empty else 0
+total_prs = int(daily_df['runs'].sum()) if not daily_df.empty else 0
+high_risk_prs = int(daily_df['high'].sum()) if not daily_df.empty else 0
+avg_score = daily_df['risk_sum'].sum() / total_prs if total_prs else 0
 
 kpi1, kpi2, kpi3, kpi4 = st.columns(4)
 kpi1.metric("Total Analyzed", total_prs)
@@ -82,7 +102,7 @@ kpi2.metric("High Severity", high_risk_prs, delta_color="inverse")
 kpi3.metric("Avg Severity Score", f"{avg_score:.1f}")
 
 # train Readiness
-_, _, labeled_count = load_stats()
+labeled_count = load_stats()
 ml_target = 5 # Lowered from 50 for testing/demo purposes
 progress = min(labeled_count / ml_target, 1.0)
 kpi4.metric("Labeled Data (ML Ready)", f"{labeled_count} / {ml_target}")
@@ -98,17 +118,17 @@ col_charts1, col_charts2 = st.columns(2)
 
 with col_charts1:
     st.subheader("Severity Level Distribution")
-    if not df.empty:
-        risk_counts = df['risk_level'].value_counts()
+    if level_counts:
+        risk_counts = pd.Series(level_counts, name="count").sort_values(ascending=False)
         st.bar_chart(risk_counts, color="#ff4b4b")
     else:
         st.info("No data yet.")
 
 with col_charts2:
-    st.subheader("Severity Score Trend")
-    if not df.empty:
-        ts_df = df.set_index('created_at').sort_index()
-        st.line_chart(ts_df['risk_score'], color="#00ff00")
+    st.subheader("Severity Score Trend (daily average)")
+    if not daily_df.empty:
+        ts_df = daily_df.set_index('day').sort_index()
+        st.line_chart(ts_df['risk_avg'], color="#00ff00")
     else:
         st.info("No data yet.")
 
@@ -157,6 +177,7 @@ else:
 # 4. Detailed History Table
 st.divider()
 st.subheader(" Analysis History")
+st.caption(f"Most recent {HISTORY_LIMIT} runs")
 
 display_cols = ['created_at', 'repo', 'pr_number', 'risk_level', 'risk_score', 'reason_summary']
 # Note: Column names kept as 'risk_*' for DB compatibility, but displayed as 'Severity'
@@ -1,6 +1,5 @@
-import sqlite3
+from releasegate.storage.database import get_database, read_connection
 from typing import List, Dict, Type
-from releasegate.config import DB_PATH
 from releasegate.enforcement.types import EnforcementAction, EnforcementResult, ActionType
 from releasegate.enforcement.base import Enforcer
 from releasegate.enforcement.actions.github import GitHubEnforcer
@@ -60,17 +59,12 @@ class EnforcementRunner:
             return err_result
 
     def _is_already_executed(self, key: str) -> bool:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM enforcement_events WHERE idempotency_key = ?", (key,))
-        exists = cursor.fetchone() is not None
-        conn.close()
-        return exists
+        conn = read_connection()
+        row = conn.execute("SELECT 1 FROM enforcement_events WHERE idempotency_key = ?", (key,)).fetchone()
+        return row is not None
 
     def _record_execution(self, action: EnforcementAction, result: EnforcementResult):
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("""
+        get_database().execute("""
             INSERT INTO enforcement_events (idempotency_key, decision_id, action_type, target, status, detail)
             VALUES (?, ?, ?, ?, ?, ?)
         """, (
@@ -85,5 +79,3 @@ class EnforcementRunner:
             result.status,
             result.detail
         ))
-        conn.commit()
-        conn.close()
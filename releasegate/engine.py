@@ -1,6 +1,10 @@
-from typing import Dict, Any, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, List, Optional, Iterable, Generator
 from releasegate.policy.policy_types import Policy, ControlSignal
-from releasegate.policy.loader import PolicyLoader
+from releasegate.policy.index import PolicyIndex
+from releasegate.policy.registry import PolicyRegistry, PolicySnapshot
+from releasegate.signals.namespace import SignalNamespace
 from releasegate.enforcement.core_risk import CoreRiskControl
 from releasegate.enforcement.registry import ControlRegistry
 from releasegate.enforcement.types import ControlContext
@@ -20,22 +24,57 @@ class ComplianceRunResult(BaseModel):
     results: List[PolicyResult]
     metadata: Dict[str, Any]
 
+class BatchError(BaseModel):
+    """One evaluate_many() item that raised."""
+    batch_index: int
+    error: str # "<ExceptionType>: <message>"
+
+class BatchSummary(BaseModel):
+    """Timing summary for one evaluate_many() batch."""
+    total: int
+    succeeded: int
+    failed: int
+    errors: List[BatchError] = []
+    wall_time_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    throughput_per_s: float
+
 class ComplianceEngine:
     """
     Deterministic Policy Evaluation Engine.
     """
-    def __init__(self, config: Dict[str, Any]):
+    POLICY_DIR = "releasegate/policy/compiled"
+
+    def __init__(self, config: Dict[str, Any], registry: Optional[PolicyRegistry] = None):
         self.config = config
-        self.loader = PolicyLoader(policy_dir="releasegate/policy/compiled", schema="compiled")
-        self.policies = self.loader.load_all()
+        # Policies are loaded once per process and hot-reloaded in the background;
+        # predicates are compiled and indexed by signal name at load time.
+        self.registry = registry or PolicyRegistry.shared(self.POLICY_DIR, schema="compiled")
         
         # Instantiate Controls
         self.core_risk = CoreRiskControl(config)
         
         # Phase 3: Control Registry (all 5 controls)
         self.control_registry = ControlRegistry(config)
+        
+        # Populated by evaluate_many()
+        self.last_batch_summary: Optional[BatchSummary] = None
+
+    @property
+    def policies(self) -> List[Policy]:
+        return self.registry.current().policies
+
+    @property
+    def index(self) -> PolicyIndex:
+        return self.registry.current().index
 
     def evaluate(self, raw_signals: Dict[str, Any]) -> ComplianceRunResult:
+        # Pin the policy snapshot: a concurrent reload must not change policies mid-run
+        snapshot: PolicySnapshot = self.registry.current()
+        
         # 1. Gather Control Signals from Core Risk (Phase 2)
         core_output = self.core_risk.evaluate(raw_signals)
         
@@ -58,8 +97,9 @@ class ComplianceEngine:
             phase3_signals = registry_result.get("signals", {})
             phase3_findings = registry_result.get("findings", [])
         
-        # 3. Flatten Signals (combine Phase 2 + Phase 3)
-        signal_map = self._flatten_signals({
+        # 3. Signal Namespace (combine Phase 2 + Phase 3)
+        # Lazy dotted-path view: only signals referenced by policies are resolved
+        signal_map = SignalNamespace({
             "core_risk": core_output,
             "features": core_output.get("signals", {}), 
             "raw": raw_signals,
@@ -69,9 +109,10 @@ class ComplianceEngine:
         policy_results = []
         overall_status = "COMPLIANT"
         
-        # 4. Evaluate Each Policy
-        for policy in self.policies:
-            p_res = self._evaluate_policy(policy, signal_map)
+        # 4. Evaluate Each Policy (only policies whose signals are present are checked)
+        triggered = snapshot.index.match(signal_map)
+        for pos, policy in enumerate(snapshot.policies):
+            p_res = self._policy_result(policy, triggered.get(pos))
             policy_results.append(p_res)
             
             if p_res.status == "BLOCK":
@@ -89,6 +130,7 @@ class ComplianceEngine:
         metadata = {
             "core_risk_score": core_output.get("violation_severity"),
             "core_risk_level": core_output.get("severity_level"),
+            "policy_version": snapshot.version,
             "raw_features": core_output.get("raw_features", {}),
             "phase3_findings_count": len(phase3_findings),
             "phase3_findings": [
@@ -120,34 +162,15 @@ class ComplianceEngine:
             metadata=metadata
         )
 
-    def _evaluate_policy(self, policy: Policy, signals: Dict[str, Any]) -> PolicyResult:
-        violations = []
-        triggered = False
-        
-        # AND Logic: All controls in a policy are evaluated
-        # If ANY control matches the trigger condition, the policy triggers? 
-        # Typically policies specify "violations".
-        # Let's assume: If ALL conditions match, then enforcement triggers?
-        # WAIT. "High Severity Changes Require Review". Signal: severity >= HIGH.
-        # This implies "Trigger if severity is HIGH".
-        # What if multiple signals? usually AND logic for the trigger.
-        
-        triggers = []
-        for ctrl in policy.controls:
-            actual_val = signals.get(ctrl.signal)
-            if self._check_condition(actual_val, ctrl.operator, ctrl.value):
-                triggers.append(f"{ctrl.signal} ({actual_val}) {ctrl.operator} {ctrl.value}")
-        
-        # Policy is "violated" (triggered) if ALL control conditions are met? 
-        # Or ANY? 
-        # For SEC-PR-004: "High Risk" AND "Churn > 500".
-        # Yes, usually composite trigger.
-        
-        if len(triggers) == len(policy.controls):
+    def _policy_result(self, policy: Policy, violations: Optional[List[str]]) -> PolicyResult:
+        # Policy is "violated" (triggered) only if ALL control conditions are met
+        # (composite trigger, e.g. SEC-PR-004: "High Risk" AND "Churn > 500").
+        if violations is not None:
             triggered = True
-            violations = triggers
             status = policy.enforcement.result # BLOCK or WARN
         else:
+            triggered = False
+            violations = []
             status = "COMPLIANT"
         
         return PolicyResult(
@@ -161,6 +184,7 @@ class ComplianceEngine:
         )
 
     def _check_condition(self, actual, operator, expected) -> bool:
+        """Reference semantics for a single control; PolicyIndex compiles the same rules."""
         if actual is None: return False
         try:
             if operator == "==": return actual == expected
@@ -181,13 +205,92 @@ class ComplianceEngine:
             return False
         return False
 
-    def _flatten_signals(self, data: Dict[str, Any], prefix="") -> Dict[str, Any]:
-        """Recursive flatten for dot notation."""
-        out = {}
-        for k, v in data.items():
-            key = f"{prefix}.{k}" if prefix else k
-            if isinstance(v, dict) and k != "files_changed": # Don't flatten lists of files
-                out.update(self._flatten_signals(v, key))
-            else:
-                out[key] = v
-        return out
+    def evaluate_many(
+        self,
+        raw_signals_iterable: Iterable[Dict[str, Any]],
+        max_workers: int = 4,
+        max_pending: Optional[int] = None
+    ) -> Generator[ComplianceRunResult, None, BatchSummary]:
+        """
+        Evaluate many signal sets against the already-loaded policies.
+
+        Items are pulled lazily from the iterable and run on a worker pool with
+        at most `max_pending` (default 2 x max_workers) in flight, so large
+        inputs never get queued up front. Results are yielded as they finish;
+        each carries `metadata["batch_index"]` (position in the input) and
+        `metadata["evaluation_ms"]`.
+
+        The batch timing summary is the generator's return value and is also
+        stored on `self.last_batch_summary`. An item that raises is not
+        yielded; the batch carries on and the error is recorded in the
+        summary's `errors` (counted in `failed`).
+        """
+        max_pending = max_pending or max_workers * 2
+        items = iter(raw_signals_iterable)
+        exhausted = object()
+        durations: List[float] = []
+        errors: List[BatchError] = []
+        started = time.perf_counter()
+
+        def timed(index: int, raw: Dict[str, Any]):
+            t0 = time.perf_counter()
+            try:
+                result = self.evaluate(raw)
+            except Exception as e:
+                return index, e, None
+            return index, result, (time.perf_counter() - t0) * 1000
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="releasegate-eval")
+        pending = set()
+        next_index = 0
+        try:
+            while True:
+                # Keep the pool fed, bounded by max_pending
+                while len(pending) < max_pending:
+                    raw = next(items, exhausted)
+                    if raw is exhausted:
+                        break
+                    pending.add(executor.submit(timed, next_index, raw))
+                    next_index += 1
+                
+                if not pending:
+                    break
+                
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, result, elapsed_ms = future.result()
+                    if elapsed_ms is None:
+                        errors.append(BatchError(batch_index=index, error=f"{type(result).__name__}: {result}"))
+                        continue
+                    durations.append(elapsed_ms)
+                    result.metadata["batch_index"] = index
+                    result.metadata["evaluation_ms"] = round(elapsed_ms, 3)
+                    yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.last_batch_summary = self._summarize_batch(durations, errors, time.perf_counter() - started)
+
+        return self.last_batch_summary
+
+    @staticmethod
+    def _summarize_batch(durations: List[float], errors: List[BatchError], wall_time_s: float) -> BatchSummary:
+        ordered = sorted(durations)
+
+        def pct(q: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+        total = len(ordered) + len(errors)
+        return BatchSummary(
+            total=total,
+            succeeded=len(ordered),
+            failed=len(errors),
+            errors=sorted(errors, key=lambda e: e.batch_index),
+            wall_time_ms=round(wall_time_s * 1000, 3),
+            mean_ms=round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+            p50_ms=round(pct(0.50), 3),
+            p95_ms=round(pct(0.95), 3),
+            max_ms=round(ordered[-1], 3) if ordered else 0.0,
+            throughput_per_s=round(len(ordered) / wall_time_s, 2) if wall_time_s > 0 else 0.0
+        )
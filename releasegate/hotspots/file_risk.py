@@ -1,7 +1,7 @@
-import sqlite3
+from releasegate.storage.database import read_connection
+from releasegate.storage.schema import init_db
 from datetime import datetime, timedelta
 from typing import Dict, List
-from releasegate.config import DB_PATH
 from releasegate.signals import normalize
 import math
 
@@ -16,83 +16,49 @@ def aggregate_file_risks(repo: str, window_days: int = 90) -> Dict[str, Dict]:
     Returns:
         Dict mapping file_path -> aggregated signals
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    init_db()
+    conn = read_connection()
     
-    # Calculate cutoff for "recent"
-    cutoff_dt = datetime.now() - timedelta(days=window_days)
+    # Calculate cutoff for "recent" (pr_run_files.created_at is ISO 8601)
+    cutoff = (datetime.now() - timedelta(days=window_days)).isoformat()
     
     file_data = {}
     
-    # Query: Get all commits/PRs with files and labels
-    # We need: file, churn, label, timestamp
-    # Schema: pr_runs has files_json, churn, label_value, timestamp
+    # Per-file totals from the normalized pr_run_files table (repo, file_path index);
+    # labels live on the run: 1 = incident, 0 = safe, NULL = unknown
+    rows = conn.execute("""
+    SELECT f.file_path, COUNT(*), SUM(r.label_value = 1), SUM(f.churn), MAX(f.created_at)
+    FROM pr_run_files f
+    JOIN pr_runs r ON r.run_id = f.run_id
+    WHERE f.repo = ?
+    GROUP BY f.file_path
+    """, (repo,)).fetchall()
     
-    cursor.execute("""
-    SELECT files_json, churn, label_value, created_at
-    FROM pr_runs
-    WHERE repo = ?
-    AND files_json IS NOT NULL
-    """, (repo,))
+    for file_path, changes, incidents, total_churn, last_touched in rows:
+        ts_dt = None
+        if last_touched:
+            try:
+                ts_dt = datetime.fromisoformat(str(last_touched).replace("Z", "+00:00"))
+            except Exception:
+                ts_dt = None
+        file_data[file_path] = {
+            "changes": changes,
+            "incidents": incidents or 0,
+            "total_churn": total_churn or 0,
+            "recent_churn": 0,
+            "last_touched": ts_dt
+        }
     
-    rows = cursor.fetchall()
-    
-    for row in rows:
-        try:
-            import json
-            files_data = json.loads(row['files_json']) if row['files_json'] else []
-            churn = row['churn'] or 0
-            label = row['label_value'] # 1 = incident, 0 = safe, NULL = unknown
-            timestamp = row['created_at']
-            ts_dt = None
-            if timestamp:
-                try:
-                    ts_dt = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
-                except Exception:
-                    ts_dt = None
-            
-            # Parse files (format may vary, handle gracefully)
-            if isinstance(files_data, list):
-                files = files_data
-            elif isinstance(files_data, dict):
-                files = list(files_data.keys())
-            else:
-                continue
-            
-            for file_path in files:
-                if file_path not in file_data:
-                    file_data[file_path] = {
-                        "changes": 0,
-                        "incidents": 0,
-                        "total_churn": 0,
-                        "recent_churn": 0,
-                        "last_touched": ts_dt
-                    }
-                
-                fd = file_data[file_path]
-                fd["changes"] += 1
-                
-                if label == 1:
-                    fd["incidents"] += 1
-                
-                # Churn (distribute evenly across files for simplicity)
-                file_churn = churn / len(files) if files else 0
-                fd["total_churn"] += file_churn
-                
-                if ts_dt and ts_dt >= cutoff_dt:
-                    fd["recent_churn"] += file_churn
-                
-                # Track latest touch
-                if ts_dt:
-                    if not fd["last_touched"] or ts_dt > fd["last_touched"]:
-                        fd["last_touched"] = ts_dt
-        
-        except Exception as e:
-            print(f"Error processing row: {e}")
-            continue
-    
-    conn.close()
+    # Recent churn within the window (repo, created_at index)
+    recent = conn.execute("""
+    SELECT file_path, SUM(churn)
+    FROM pr_run_files
+    WHERE repo = ? AND created_at >= ?
+    GROUP BY file_path
+    """, (repo, cutoff))
+    for file_path, recent_churn in recent:
+        if file_path in file_data:
+            file_data[file_path]["recent_churn"] = recent_churn or 0
     
     # Post-process: Laplace smoothing and normalization
     alpha = 1.0
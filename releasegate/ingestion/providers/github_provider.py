@@ -1,11 +1,10 @@
 import json
-import sqlite3
 import os
 from typing import List, Dict, Any
-from datetime import datetime, timedelta
 from github import Github, Auth
-from releasegate.config import GITHUB_TOKEN, DB_PATH
+from releasegate.config import GITHUB_TOKEN
 from releasegate.ingestion.providers.base import GitProvider
+from releasegate.storage.provider_cache import ProviderCache
 from releasegate.storage.schema import init_db
 
 class GitHubProvider(GitProvider):
@@ -17,7 +16,9 @@ class GitHubProvider(GitProvider):
         self.config = config
         self.repo_name = config.get("github", {}).get("repo")
         self.cache_ttl = config.get("github", {}).get("cache_ttl", 3600)
+        self.cache_ttls = config.get("github", {}).get("cache_ttls", {})
         init_db()
+        self.cache = ProviderCache.for_table("github_cache")
         self.client = self._init_client()
 
     def _init_client(self):
@@ -67,29 +68,23 @@ class GitHubProvider(GitProvider):
         resp.raise_for_status()
         return resp.json()["token"]
 
-    def _get_cache(self, key: str) -> Dict:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT response_json, fetched_at FROM github_cache WHERE cache_key = ?", (key,))
-        row = cursor.fetchone()
-        conn.close()
-        
-        if row:
-            data, fetched_at = row
-            fetched_dt = datetime.fromisoformat(fetched_at)
-            if datetime.utcnow() - fetched_dt < timedelta(seconds=self.cache_ttl):
-                return json.loads(data)
-        return None
+    def _get_cache(self, key: str, namespace: str) -> Dict:
+        return self.cache.get(key, ttl=self._ttl(namespace))
+
+    def _set_cache(self, key: str, data: Dict, namespace: str):
+        self.cache.set(key, data, ttl=self._ttl(namespace))
+
+    def invalidate_issue(self, issue_ref: str):
+        """Drop a cached issue/PR (e.g. on a labeled/unlabeled webhook)."""
+        try:
+            issue_num = int(str(issue_ref).replace("#", ""))
+        except ValueError:
+            return
+        self.cache.invalidate(f"github:{self.repo_name}:issue:{issue_num}")
 
-    def _set_cache(self, key: str, data: Dict):
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("""
-        INSERT OR REPLACE INTO github_cache (cache_key, response_json, fetched_at)
-        VALUES (?, ?, ?)
-        """, (key, json.dumps(data), datetime.utcnow().isoformat()))
-        conn.commit()
-        conn.close()
+    def _ttl(self, namespace: str) -> float:
+        """Per-namespace TTL ("cache_ttls": {"issue": ..., "mr": ...}), else cache_ttl."""
+        return self.cache_ttls.get(namespace, self.cache_ttl)
 
     def fetch_issue_labels(self, issue_ref: str) -> List[str]:
         """
@@ -105,7 +100,7 @@ class GitHubProvider(GitProvider):
             return []
         
         cache_key = f"github:{self.repo_name}:issue:{issue_num}"
-        data = self._get_cache(cache_key)
+        data = self._get_cache(cache_key, "issue")
         
         if not data:
             try:
@@ -117,12 +112,13 @@ class GitHubProvider(GitProvider):
                     "title": issue.title,
                     "is_pr": issue.pull_request is not None
                 }
-                self._set_cache(cache_key, data)
+                self._set_cache(cache_key, data, "issue")
             except Exception as e:
                 print(f"Error fetching GitHub issue {issue_num}: {e}")
                 return []
         
-        return data.get("labels", [])
+        # Cached responses are shared in-process; hand out a copy
+        return list(data.get("labels", []))
 
     def fetch_pr_details(self, pr_number: int) -> Dict[str, Any]:
         # Reuse same logic, PRs are issues
@@ -1,11 +1,9 @@
 import requests
 import json
-import sqlite3
 import re
 from typing import List, Dict, Any
-from datetime import datetime, timedelta
-from releasegate.config import DB_PATH
 from releasegate.ingestion.providers.base import GitProvider
+from releasegate.storage.provider_cache import ProviderCache
 from releasegate.storage.schema import init_db
 
 class GitLabProvider(GitProvider):
@@ -20,7 +18,9 @@ class GitLabProvider(GitProvider):
         self.token = self.gitlab_config.get("token", "")
         self.project_id = self.gitlab_config.get("project", "") # Can be "group/project" string or ID
         self.cache_ttl = self.gitlab_config.get("cache_ttl", 3600)
+        self.cache_ttls = self.gitlab_config.get("cache_ttls", {})
         init_db()
+        self.cache = ProviderCache.for_table("gitlab_cache")
         
         # Determine strict project ID format (URL encoding if it has slashes)
         if "/" in str(self.project_id):
@@ -28,29 +28,26 @@ class GitLabProvider(GitProvider):
         else:
             self.project_id_encoded = str(self.project_id)
 
-    def _get_cache(self, key: str) -> Dict:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT response_json, fetched_at FROM gitlab_cache WHERE cache_key = ?", (key,))
-        row = cursor.fetchone()
-        conn.close()
-        
-        if row:
-            data, fetched_at = row
-            fetched_dt = datetime.fromisoformat(fetched_at)
-            if datetime.utcnow() - fetched_dt < timedelta(seconds=self.cache_ttl):
-                return json.loads(data)
-        return None
+    def _get_cache(self, key: str, namespace: str) -> Dict:
+        return self.cache.get(key, ttl=self._ttl(namespace))
+
+    def _set_cache(self, key: str, data: Dict, namespace: str):
+        self.cache.set(key, data, ttl=self._ttl(namespace))
+
+    def invalidate_issue(self, issue_ref: str):
+        """Drop a cached issue (e.g. on an issue webhook)."""
+        try:
+            iid = int(str(issue_ref).replace("#", ""))
+        except ValueError:
+            return
+        self.cache.invalidate(f"gitlab:{self.project_id}:issue:{iid}")
+
+    def invalidate_mr(self, pr_number: int):
+        self.cache.invalidate(f"gitlab:{self.project_id}:mr:{pr_number}")
 
-    def _set_cache(self, key: str, data: Dict):
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("""
-        INSERT OR REPLACE INTO gitlab_cache (cache_key, response_json, fetched_at)
-        VALUES (?, ?, ?)
-        """, (key, json.dumps(data), datetime.utcnow().isoformat()))
-        conn.commit()
-        conn.close()
+    def _ttl(self, namespace: str) -> float:
+        """Per-namespace TTL ("cache_ttls": {"issue": ..., "mr": ...}), else cache_ttl."""
+        return self.cache_ttls.get(namespace, self.cache_ttl)
         
     def _fetch_api(self, endpoint: str) -> Dict:
         if not self.token:
@@ -84,14 +81,15 @@ class GitLabProvider(GitProvider):
             return []
         
         cache_key = f"gitlab:{self.project_id}:issue:{iid}"
-        data = self._get_cache(cache_key)
+        data = self._get_cache(cache_key, "issue")
         
         if not data:
             data = self._fetch_api(f"projects/{self.project_id_encoded}/issues/{iid}")
             if data:
-                self._set_cache(cache_key, data)
+                self._set_cache(cache_key, data, "issue")
         
-        return data.get("labels", [])
+        # Cached responses are shared in-process; hand out a copy
+        return list(data.get("labels", []))
 
     def fetch_pr_details(self, pr_number: int) -> Dict[str, Any]:
         # GitLab MRs
@@ -99,15 +97,15 @@ class GitLabProvider(GitProvider):
             return {}
         
         cache_key = f"gitlab:{self.project_id}:mr:{pr_number}"
-        data = self._get_cache(cache_key)
+        data = self._get_cache(cache_key, "mr")
         
         if not data:
             data = self._fetch_api(f"projects/{self.project_id_encoded}/merge_requests/{pr_number}")
             if data:
-                self._set_cache(cache_key, data)
+                self._set_cache(cache_key, data, "mr")
         
         return {
-            "labels": data.get("labels", []),
+            "labels": list(data.get("labels", [])),
             "title": data.get("title", ""),
             "state": data.get("state", "unknown")
         }
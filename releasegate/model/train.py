@@ -1,4 +1,3 @@
-import sqlite3
 import pandas as pd
 import json
 import pickle
@@ -7,13 +6,13 @@ from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.impute import SimpleImputer
-from releasegate.config import DB_PATH
+from releasegate.storage.database import read_connection
 
 MODEL_PATH = "data/model.pkl"
 
 def load_data():
     """Load and join runs with labels."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = read_connection()
     
     # Join pr_runs with pr_labels
     # We only want runs that have labels
@@ -26,7 +25,6 @@ def load_data():
     """
     
     df = pd.read_sql_query(query, conn)
-    conn.close()
     
     return df
 
@@ -1,7 +1,8 @@
 import os
 import json
 import hashlib
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple
 from datetime import datetime, timezone
 
 from .dsl.lexer import DSLTokenizer
@@ -10,90 +11,203 @@ from .dsl.validator import DSLValidator
 from .compiler import PolicyCompiler
 from .types import CompiledPolicy
 
+COMPILER_VERSION = "1.0.0"
+
+def compile_source(path: str) -> Tuple[str, str, List[CompiledPolicy]]:
+    """
+    DSL file -> (normalized policy id, version, compiled policies).
+    Module-level so it can run in a worker process.
+    """
+    with open(path, "r") as f:
+        source_text = f.read()
+
+    # Pipeline
+    lexer = DSLTokenizer(source_text)
+    tokens = lexer.tokenize()
+
+    parser = DSLParser(tokens)
+    ast = parser.parse()
+
+    validation_errors = DSLValidator().validate(ast)
+    if validation_errors:
+        raise ValueError(f"Validation failed: {validation_errors}")
+
+    compiled_policies = PolicyCompiler().compile(ast, source_text)
+    normalized_id = ast.policy_id.replace("_", "-")
+    return normalized_id, ast.version, compiled_policies
+
+def hash_source(path: str) -> str:
+    """Same hash the compiler stamps on its output (sha256 of the decoded text)."""
+    with open(path, "r") as f:
+        return hashlib.sha256(f.read().encode('utf-8')).hexdigest()
+
 class PolicyBuilder:
     """
     Orchestrates the build process:
     DSL -> Tokens -> AST -> Validation -> Compilation -> YAML + Manifest
+
+    Builds are incremental. The manifest's "sources" map records, for each DSL
+    file, its source hash and the compiled files it emitted. Unchanged sources
+    are skipped, outputs no longer emitted are removed, and changed sources
+    are recompiled in parallel across a process pool.
     """
-    
-    def __init__(self, source_dir: str, output_dir: str):
+
+    def __init__(self, source_dir: str, output_dir: str, force: bool = False, max_workers: int = None):
         self.source_dir = source_dir
         self.output_dir = output_dir
-        self.compiler = PolicyCompiler()
-        self.validator = DSLValidator()
-        self.manifest: Dict[str, Any] = {
-            "compiled_at": datetime.now(timezone.utc).isoformat(),
-            "compiler_version": "1.0.0",
-            "policies": {}
-        }
-    
+        self.force = force
+        self.max_workers = max_workers
+        self.manifest_path = os.path.join(output_dir, "manifest.json")
+        self.manifest: Dict[str, Any] = self._load_manifest()
+        # Filled by build(): relative source paths per outcome
+        self.compiled: List[str] = []
+        self.skipped: List[str] = []
+        self.removed: List[str] = []
+
     def build(self) -> bool:
         """
         Build all policies in source_dir.
         Returns True if successful, False if errors found.
         """
         print(f"Starting build from {self.source_dir} to {self.output_dir}")
-        
-        # 1. Clean output directory (optional, or just overwrite)
+
         os.makedirs(self.output_dir, exist_ok=True)
-        
+
         errors = []
-        
-        # 2. Walk source directory
+        sources: Dict[str, Dict[str, Any]] = self.manifest["sources"]
+
+        # 1. Walk source directory, hashing each DSL file
+        current: Dict[str, str] = {}
         for root, dirs, files in os.walk(self.source_dir):
             for file in files:
                 if file.endswith(".dsl"):
                     path = os.path.join(root, file)
                     try:
-                        self._process_file(path)
+                        current[os.path.relpath(path, self.source_dir)] = hash_source(path)
                     except Exception as e:
                         errors.append(f"Failed to process {path}: {str(e)}")
-        
-        # 3. Write Manifest
-        manifest_path = os.path.join(self.output_dir, "manifest.json")
-        with open(manifest_path, "w") as f:
-            json.dump(self.manifest, f, indent=2)
-        
+
+        # 2. Sources that were deleted: drop their outputs
+        for rel in sorted(set(sources) - set(current)):
+            self._remove_source(rel)
+            self.removed.append(rel)
+
+        # 3. Decide what needs recompiling
+        changed = []
+        for rel, source_hash in sorted(current.items()):
+            entry = sources.get(rel)
+            if not self.force and entry and entry["source_hash"] == source_hash and all(
+                os.path.exists(os.path.join(self.output_dir, name)) for name in entry["outputs"]
+            ):
+                self.skipped.append(rel)
+            else:
+                changed.append(rel)
+
+        # 4. Compile changed sources (in parallel when there is more than one)
+        for rel, outcome in self._compile_all(changed):
+            path = os.path.join(self.source_dir, rel)
+            if isinstance(outcome, Exception):
+                errors.append(f"Failed to process {path}: {str(outcome)}")
+                continue
+            print(f"Processed {path}")
+            self._write_outputs(rel, current[rel], *outcome)
+            self.compiled.append(rel)
+
+        # 5. Write Manifest (only when something changed)
+        if self.compiled or self.removed:
+            self.manifest["compiled_at"] = datetime.now(timezone.utc).isoformat()
+            with open(self.manifest_path, "w") as f:
+                json.dump(self.manifest, f, indent=2)
+
+        print(f"Compiled {len(self.compiled)}, skipped {len(self.skipped)} unchanged, removed {len(self.removed)}")
+
         if errors:
             print("\nBuild Failed with Errors:")
             for e in errors:
                 print(f" - {e}")
             return False
-        
+
         print("\nBuild Complete")
         return True
 
-    def _process_file(self, path: str):
-        print(f"Processing {path}...")
-        
-        with open(path, "r") as f:
-            source_text = f.read()
-        
-        # Pipeline
-        lexer = DSLTokenizer(source_text)
-        tokens = lexer.tokenize()
-        
-        parser = DSLParser(tokens)
-        ast = parser.parse()
-        
-        validation_errors = self.validator.validate(ast)
-        if validation_errors:
-            raise ValueError(f"Validation failed: {validation_errors}")
-        
-        compiled_policies = self.compiler.compile(ast, source_text)
-        
+    def _compile_all(self, changed: List[str]):
+        paths = [os.path.join(self.source_dir, rel) for rel in changed]
+        if len(paths) <= 1 or self.max_workers == 1:
+            for rel, path in zip(changed, paths):
+                try:
+                    yield rel, compile_source(path)
+                except Exception as e:
+                    yield rel, e
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(compile_source, path) for path in paths]
+            for rel, future in zip(changed, futures):
+                try:
+                    yield rel, future.result()
+                except Exception as e:
+                    yield rel, e
+
+    def _write_outputs(self, rel: str, source_hash: str, normalized_id: str, version: str, compiled_policies: List[CompiledPolicy]):
+        previous = self.manifest["sources"].get(rel, {})
+
         # Write Outputs
         rule_ids = []
+        outputs = []
         for policy in compiled_policies:
             output_path = os.path.join(self.output_dir, policy.filename)
             with open(output_path, "w") as f:
                 json.dump(policy.content, f, indent=2)
             rule_ids.append(policy.policy_id)
-        
+            outputs.append(policy.filename)
+
+        # Stale outputs (e.g. a rule was deleted from the DSL file)
+        for name in set(previous.get("outputs", [])) - set(outputs):
+            self._remove_output(name)
+        if previous.get("policy_id") not in (None, normalized_id):
+            self.manifest["policies"].pop(previous["policy_id"], None)
+
         # Update Manifest
-        normalized_id = ast.policy_id.replace("_", "-")
+        self.manifest["sources"][rel] = {
+            "source_hash": source_hash,
+            "policy_id": normalized_id,
+            "outputs": outputs
+        }
         self.manifest["policies"][normalized_id] = {
-            "source_hash": compiled_policies[0].source_hash,
-            "version": ast.version,
+            "source_hash": source_hash,
+            "version": version,
             "rules": rule_ids
         }
+
+    def _remove_source(self, rel: str):
+        entry = self.manifest["sources"].pop(rel)
+        for name in entry.get("outputs", []):
+            self._remove_output(name)
+        self.manifest["policies"].pop(entry.get("policy_id"), None)
+
+    def _remove_output(self, name: str):
+        path = os.path.join(self.output_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+            print(f"Removed stale {path}")
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        fresh = {
+            "compiled_at": datetime.now(timezone.utc).isoformat(),
+            "compiler_version": COMPILER_VERSION,
+            "policies": {},
+            "sources": {}
+        }
+        if self.force or not os.path.exists(self.manifest_path):
+            return fresh
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except Exception:
+            return fresh
+        # Manifests from older builds have no "sources": everything gets recompiled once
+        if manifest.get("compiler_version") != COMPILER_VERSION or "sources" not in manifest:
+            manifest["sources"] = {}
+            manifest["compiler_version"] = COMPILER_VERSION
+        manifest.setdefault("policies", {})
+        return manifest
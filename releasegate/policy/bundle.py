@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
+
+import pydantic
+
+from releasegate.storage.atomic import atomic_write
+from .policy_types import Policy
+from .types import PolicyDef
+
+# Leading "_" keeps the bundle out of YAML loading and policy dir fingerprints
+BUNDLE_FILENAME = "_bundle.rgb"
+BUNDLE_MAGIC = b"RGPOLICYBUNDLE"
+BUNDLE_FORMAT_VERSION = 2 # 2: JSON payload (1 was pickle and is never loaded)
+# Payload entry kind -> model; entries are plain data, never executed
+_MODELS = {"compiled": Policy, "def": PolicyDef}
+
+
+def _construct(annotation: Any, value: Any) -> Any:
+    """
+    Rebuild a model_dump(mode="json") value as `annotation` without
+    validation (model_construct, recursing into nested models, lists, dicts
+    and Optionals). Only required fields are checked; types are trusted.
+    """
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is Union:
+        for arg in get_args(annotation):
+            arg_origin = get_origin(arg) or arg
+            if isinstance(arg_origin, type) and (
+                (issubclass(arg_origin, pydantic.BaseModel) and isinstance(value, dict))
+                or (arg_origin in (list, dict) and isinstance(value, arg_origin))
+            ):
+                return _construct(arg, value)
+        return value
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        return [_construct(item, v) for v in value]
+    if origin is dict:
+        _, item = get_args(annotation) or (Any, Any)
+        return {k: _construct(item, v) for k, v in value.items()}
+    if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+        fields = annotation.model_fields
+        missing = [name for name, field in fields.items() if field.is_required() and name not in value]
+        if missing:
+            raise ValueError(f"{annotation.__name__} is missing {', '.join(missing)}")
+        return annotation.model_construct(**{
+            name: _construct(field.annotation, value[name]) for name, field in fields.items() if name in value
+        })
+    return value
+
+
+def source_files(policy_dir: str) -> List[str]:
+    """Policy files PolicyLoader would read, as sorted paths relative to policy_dir."""
+    files = []
+    for root, _, names in os.walk(policy_dir):
+        for name in names:
+            if name.startswith("_") or not (name.endswith(".yaml") or name.endswith(".yml")):
+                continue
+            files.append(os.path.relpath(os.path.join(root, name), policy_dir))
+    return sorted(files)
+
+
+def stat_fingerprint(policy_dir: str, files: List[str]) -> str:
+    """Cheap fingerprint from path, size and mtime (no file reads)."""
+    h = hashlib.sha256()
+    for rel in files:
+        st = os.stat(os.path.join(policy_dir, rel))
+        h.update(f"{rel}:{st.st_size}:{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def content_fingerprint(policy_dir: str, files: List[str]) -> str:
+    """Fingerprint from path and file bytes; survives checkouts that reset mtimes."""
+    h = hashlib.sha256()
+    for rel in files:
+        with open(os.path.join(policy_dir, rel), "rb") as f:
+            data = f.read()
+        h.update(f"{rel}:{len(data)}\n".encode("utf-8"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def bundle_path(policy_dir: str) -> str:
+    return os.path.join(policy_dir, BUNDLE_FILENAME)
+
+
+def write_bundle(policy_dir: str, schema: str = "compiled") -> Dict[str, Any]:
+    """
+    Load and validate every policy in policy_dir and write them to one bundle file.
+
+    File layout: magic line, JSON header line, JSON list of validated
+    policies (in PolicyLoader order) as {"kind", "policy"} entries. The header records the payload sha256
+    and both fingerprints of the source files it was built from.
+    Returns the header. Raises ValueError if any policy file fails to load.
+    """
+    from .loader import PolicyLoader
+
+    files = source_files(policy_dir)
+    stat_fp = stat_fingerprint(policy_dir, files)
+    content_fp = content_fingerprint(policy_dir, files)
+
+    loader = PolicyLoader(policy_dir=policy_dir, schema=schema, use_bundle=False)
+    policies = loader.load_policies()
+    if loader.errors:
+        raise ValueError(f"{len(loader.errors)} policy file(s) failed to load: {loader.errors[0][0]}")
+
+    entries = [
+        {"kind": "compiled" if isinstance(p, Policy) else "def", "policy": p.model_dump(mode="json")}
+        for p in policies
+    ]
+    payload = json.dumps(entries, sort_keys=True).encode("utf-8")
+    header = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "schema": schema,
+        "pydantic_version": pydantic.VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "policy_count": len(policies),
+        "source_files": len(files),
+        "stat_fingerprint": stat_fp,
+        "content_fingerprint": content_fp,
+        "payload_sha256": hashlib.sha256(payload).hexdigest(),
+    }
+
+    with atomic_write(bundle_path(policy_dir), "wb") as f:
+        f.write(BUNDLE_MAGIC + b"\n")
+        f.write(json.dumps(header, sort_keys=True).encode("utf-8") + b"\n")
+        f.write(payload)
+    return header
+
+
+def read_bundle(policy_dir: str, schema: str = "compiled") -> Optional[List[Union[Policy, PolicyDef]]]:
+    """
+    Return the bundled policies if a bundle exists, matches `schema`, and is
+    fresh with respect to the YAML files in policy_dir. Otherwise None, and the
+    caller falls back to loading YAML.
+
+    Policies were validated when the bundle was written, so once the format
+    version and payload hash check out they are rebuilt with model_construct
+    (no validation). The payload is plain JSON, so a bundle committed
+    alongside the policies can at most carry policy data, never code.
+    """
+    path = bundle_path(policy_dir)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, header_line, payload = data.split(b"\n", 2)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError("not a policy bundle")
+        header = json.loads(header_line)
+    except Exception as e:
+        print(f"WARN: Ignoring unreadable policy bundle {path}: {e}", file=sys.stderr)
+        return None
+
+    # Incompatible bundles are simply stale: rebuild with `releasegate compile-bundle`
+    if (header.get("format_version") != BUNDLE_FORMAT_VERSION
+            or header.get("schema") != schema
+            or header.get("pydantic_version") != pydantic.VERSION):
+        return None
+
+    try:
+        files = source_files(policy_dir)
+        if header.get("source_files") != len(files):
+            return None
+        if header.get("stat_fingerprint") != stat_fingerprint(policy_dir, files):
+            # mtimes change on fresh checkouts; only contents matter
+            if header.get("content_fingerprint") != content_fingerprint(policy_dir, files):
+                return None
+    except OSError:
+        # Files changed underneath us: treat as stale
+        return None
+
+    if hashlib.sha256(payload).hexdigest() != header.get("payload_sha256"):
+        print(f"WARN: Ignoring corrupt policy bundle {path} (payload hash mismatch)", file=sys.stderr)
+        return None
+
+    try:
+        entries = json.loads(payload)
+        return [_construct(_MODELS[entry["kind"]], entry["policy"]) for entry in entries]
+    except Exception as e:
+        print(f"WARN: Ignoring unreadable policy bundle {path}: {e}", file=sys.stderr)
+        return None
@@ -9,6 +9,9 @@ COMPILED_ROOT = "releasegate/policy/compiled"
 def main():
     print("Phase 4: Compiling Compliance DSL")
     
+    # Builds are incremental; --force recompiles every source
+    force = "--force" in sys.argv[1:]
+    
     # Check source
     if not os.path.exists(DSL_ROOT):
         print(f"Source directory {DSL_ROOT} not found.")
@@ -53,7 +56,7 @@ def main():
         dst_path = os.path.join(COMPILED_ROOT, dst)
         
         if os.path.exists(src_path):
-            builder = PolicyBuilder(src_path, dst_path)
+            builder = PolicyBuilder(src_path, dst_path, force=force)
             if builder.build():
                 # Validated Policies count? 
                 # Builder doesn't return count easily, but we can count output files
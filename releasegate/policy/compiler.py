@@ -1,9 +1,17 @@
 import hashlib
 import json
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from .dsl.ast_types import PolicyNode, RuleNode, BinaryExpr, CompareExpr, Expr
 from .types import CompiledPolicy
 
+# Upper bound on conjunctions a single rule may expand to in DNF
+MAX_DNF_TERMS = 64
+
+def control_key(control: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Identity of a control for deduplication (values may be unhashable lists)."""
+    value = control["value"]
+    return (control["signal"], control["operator"], type(value).__name__, repr(value))
+
 class PolicyCompiler:
     """
     Compiles DSL AST into Phase 2 YAML Policies.
@@ -25,8 +33,11 @@ class PolicyCompiler:
             rule_suffix = f"R{i+1}"
             rule_id = f"{normalized_id}.{rule_suffix}"
             
-            # 1. Convert Condition Expression to Control List
-            controls = self._flatten_condition(rule.condition)
+            # 1. Convert Condition Expression to Controls
+            # AND-only conditions become a plain control list; OR conditions are
+            # expanded to DNF with the predicates shared by every branch factored
+            # into `controls` and the remaining branches listed under `any_of`.
+            controls, any_of = self._compile_condition(rule.condition)
             
             # 2. Add "Require" logic -> Controls
             # Already handled by Parser (Require -> When x < y -> Block)
@@ -67,6 +78,8 @@ class PolicyCompiler:
                     "supersedes": ast.supersedes
                 }
             }
+            if any_of:
+                policy_yaml["any_of"] = any_of
             
             filename = f"{rule_id}.yaml"
             compiled_policies.append(CompiledPolicy(
@@ -78,26 +91,67 @@ class PolicyCompiler:
         
         return compiled_policies
 
-    def _flatten_condition(self, expr: Expr) -> List[Dict[str, Any]]:
+    def _compile_condition(self, expr: Expr) -> Tuple[List[Dict[str, Any]], Optional[List[List[Dict[str, Any]]]]]:
+        """
+        Compile a condition into (controls, any_of).
+        The rule triggers when every control holds and, if any_of is set, every
+        control of at least one any_of group holds.
+        """
+        terms = self._normalize_dnf(self._to_dnf(expr))
+        if len(terms) == 1:
+            return terms[0], None
+        
+        # Predicates present in every conjunction are checked once, up front
+        keysets = [{control_key(c) for c in term} for term in terms]
+        common_keys = set.intersection(*keysets)
+        controls = [c for c in terms[0] if control_key(c) in common_keys]
+        any_of = [[c for c in term if control_key(c) not in common_keys] for term in terms]
+        return controls, any_of
+
+    def _to_dnf(self, expr: Expr) -> List[List[Dict[str, Any]]]:
         """
-        Flatten an Expression Tree into a list of Controls (Implicit AND).
-        Note: Phase 2 engine only supports AND logic between controls in a list.
-        If DSL has OR logic, we technically need multiple policies to represent it properly (DNF).
-        For MVP Sprint 2, we will assume AND-only logic or throw error on OR.
+        Expand an Expression Tree into disjunctive normal form:
+        a list of conjunctions, each a list of Controls (implicit AND).
         """
         if isinstance(expr, BinaryExpr):
+            left = self._to_dnf(expr.left)
+            right = self._to_dnf(expr.right)
             if expr.operator == "and":
-                return self._flatten_condition(expr.left) + self._flatten_condition(expr.right)
+                terms = [l + r for l in left for r in right]
             elif expr.operator == "or":
-                # For Phase 4 MVP, we don't support splitting OR into multiple policies yet.
-                # Complex OR logic should be written as separate rules in DSL.
-                raise ValueError("OR logic is not supported in a single rule condition for MVP. Split into multiple rules.")
+                terms = left + right
+            else:
+                raise ValueError(f"Unsupported logical operator: {expr.operator}")
+            
+            if len(terms) > MAX_DNF_TERMS:
+                raise ValueError(f"Condition expands to more than {MAX_DNF_TERMS} alternatives. Split into multiple rules.")
+            return terms
         
         elif isinstance(expr, CompareExpr):
-            return [{
+            return [[{
                 "signal": expr.left,
                 "operator": expr.operator,
                 "value": expr.right
-            }]
+            }]]
+        
+        return [[]]
+
+    @staticmethod
+    def _normalize_dnf(terms: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Drop repeated predicates within a conjunction, repeated conjunctions,
+        and conjunctions absorbed by a weaker one (A or (A and B) == A).
+        """
+        unique = []
+        seen = set()
+        for term in terms:
+            deduped = list({control_key(c): c for c in term}.values())
+            keys = frozenset(control_key(c) for c in deduped)
+            if keys not in seen:
+                seen.add(keys)
+                unique.append((keys, deduped))
         
-        return []
+        return [
+            term for keys, term in unique
+            if not any(other < keys for other, _ in unique)
+        ]
@@ -53,6 +53,8 @@ class DSLTokenizer:
         ('RBRACE', r'\}'),
         ('LBRACKET', r'\['),
         ('RBRACKET', r'\]'),
+        ('LPAREN', r'\('),
+        ('RPAREN', r'\)'),
         ('COLON', r':'),
         ('COMMA', r','),
         ('DOT', r'\.'),
@@ -64,6 +66,11 @@ class DSLTokenizer:
         ('IDENT', r'[a-zA-Z_][a-zA-Z0-9_]*'),
     ]
     
+    # One alternation of all token patterns, tried in TOKEN_TYPES order.
+    # Alternation picks the first branch that matches at a position, exactly
+    # like trying each pattern in turn, but in a single precompiled regex.
+    MASTER_PATTERN = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_TYPES))
+    
     def __init__(self, text: str):
         self.text = text
         self.tokens: List[Token] = []
@@ -71,38 +78,35 @@ class DSLTokenizer:
         self.line_start = 0 # Index where current line started (for column calc)
 
     def tokenize(self) -> List[Token]:
+        text = self.text
+        match_at = self.MASTER_PATTERN.match
+        append = self.tokens.append
         pos = 0
-        while pos < len(self.text):
-            match = None
-            for token_type, pattern in self.TOKEN_TYPES:
-                regex = re.compile(pattern)
-                match = regex.match(self.text, pos)
-                if match:
-                    value = match.group(0)
-                    
-                    if token_type == 'NEWLINE':
-                        self.line += 1
-                        self.line_start = pos + 1
-                    elif token_type in ('SKIP', 'COMMENT'):
-                        pass
-                    else:
-                        column = match.start() - self.line_start + 1
-                        
-                        # Process literal values
-                        if token_type == 'STRING':
-                            value = value[1:-1] # Strip quotes
-                        
-                        self.tokens.append(Token(token_type, value, self.line, column))
-                    
-                    pos = match.end()
-                    break
-            
+        end = len(text)
+        
+        while pos < end:
+            match = match_at(text, pos)
             if not match:
                 # Error handling
                 column = pos - self.line_start + 1
-                char = self.text[pos]
+                char = text[pos]
                 raise ValueError(f"Illegal character '{char}' at line {self.line}, column {column}")
+            
+            token_type = match.lastgroup
+            if token_type == 'NEWLINE':
+                self.line += 1
+                self.line_start = pos + 1
+            elif token_type != 'SKIP' and token_type != 'COMMENT':
+                value = match.group()
+                column = pos - self.line_start + 1
+                
+                # Process literal values
+                if token_type == 'STRING':
+                    value = value[1:-1] # Strip quotes
+                
+                append(Token(token_type, value, self.line, column))
+            
+            pos = match.end()
         
         self.tokens.append(Token('EOF', '', self.line, 0))
         return self.tokens
-
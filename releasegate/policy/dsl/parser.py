@@ -14,6 +14,9 @@ class DSLParser:
     rules: RULES LBRACE (rule)* RBRACE
     rule: WHEN expr LBRACE ENFORCE IDENT (MESSAGE STRING)? RBRACE
     | REQUIRE IDENT DOT IDENT operator literal
+    expr: and_expr (OR and_expr)*
+    and_expr: primary (AND primary)*
+    primary: LPAREN expr RPAREN | IDENT (DOT IDENT)* operator literal
     """
     
     def __init__(self, tokens: List[Token]):
@@ -203,15 +206,22 @@ class DSLParser:
         return left
 
     def _parse_and(self) -> Expr:
-        left = self._parse_comparison()
+        left = self._parse_primary()
         while self._match('AND'):
             op = self._consume('AND').value
-            right = self._parse_comparison()
+            right = self._parse_primary()
             left = BinaryExpr(left, op, right)
         return left
 
+    def _parse_primary(self) -> Expr:
+        if self._match('LPAREN'):
+            self._consume('LPAREN')
+            expr = self._parse_expression()
+            self._consume('RPAREN')
+            return expr
+        return self._parse_comparison()
+
     def _parse_comparison(self) -> Expr:
-        # TODO: Handle parens
         left_id = self._parse_identifier()
         
         op_token = self._current()
@@ -1,8 +1,12 @@
-from typing import List, Dict, Any, Optional
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from pydantic import BaseModel
-from .types import PolicyDef, Predicate, PolicyAction, Requirement
+from .types import PolicyDef, Predicate, PolicyAction, Requirement, PolicyConditions
 from releasegate.context.types import EvaluationContext
 
+Accessor = Callable[[Any], Any]
+PredicateFn = Callable[[Any], bool]
+
 class PolicyResult(BaseModel):
     decision: str # "ALLOWED", "BLOCKED", "CONDITIONAL"
     matched_policies: List[str]
@@ -10,6 +14,134 @@ class PolicyResult(BaseModel):
     requirements: Optional[Requirement]
     message: Optional[str]
 
+def compile_accessor(path: str) -> Accessor:
+    """
+    Compile a dotted context path ("change.lines_changed") into a getter.
+    Plain attribute chains go through one attrgetter call; anything else
+    (a dict along the way, a missing attribute) falls back to the exact
+    hasattr/getattr/dict.get walk of PolicyEvaluator._get_context_value.
+    """
+    parts = tuple(path.split("."))
+    fast = attrgetter(path)
+
+    def walk(obj: Any) -> Any:
+        curr = obj
+        for part in parts:
+            if hasattr(curr, part):
+                curr = getattr(curr, part)
+            elif isinstance(curr, dict):
+                curr = curr.get(part)
+            else:
+                return None
+        return curr
+
+    def access(obj: Any) -> Any:
+        try:
+            return fast(obj)
+        except AttributeError:
+            return walk(obj)
+    return access
+
+
+def compile_predicate(pred: Predicate) -> PredicateFn:
+    """
+    Compile a Predicate into a closure that only tests the fields that are set,
+    in the same order and with the same semantics as PolicyEvaluator._check_predicate.
+    """
+    checks: List[PredicateFn] = []
+
+    if pred.eq is not None:
+        eq = pred.eq
+        checks.append(lambda value: not (value != eq))
+    if pred.ne is not None:
+        ne = pred.ne
+        checks.append(lambda value: not (value == ne))
+
+    # Numeric bounds only apply to numeric values
+    bounds: List[Tuple[Callable[[Any, Any], bool], Any]] = []
+    if pred.gt is not None: bounds.append((lambda v, b: v > b, pred.gt))
+    if pred.gte is not None: bounds.append((lambda v, b: v >= b, pred.gte))
+    if pred.lt is not None: bounds.append((lambda v, b: v < b, pred.lt))
+    if pred.lte is not None: bounds.append((lambda v, b: v <= b, pred.lte))
+    if bounds:
+        def numeric(value: Any) -> bool:
+            if not isinstance(value, (int, float)):
+                return True
+            for op, bound in bounds:
+                if not op(value, bound):
+                    return False
+            return True
+        checks.append(numeric)
+
+    if pred.is_in is not None:
+        allowed = pred.is_in
+        checks.append(lambda value: value in allowed)
+    if pred.contains is not None:
+        needle = pred.contains
+        checks.append(lambda value: hasattr(value, "__contains__") and needle in value)
+
+    if not checks:
+        return lambda value: value is not None
+    if len(checks) == 1:
+        check = checks[0]
+        return lambda value: value is not None and check(value)
+
+    def test(value: Any) -> bool:
+        # Missing values never match
+        if value is None:
+            return False
+        for check in checks:
+            if not check(value):
+                return False
+        return True
+    return test
+
+
+class CompiledConditions:
+    """
+    PolicyConditions pre-processed into (getter, predicate) pairs, one per
+    predicate that is actually configured.
+    """
+
+    def __init__(self, cond: PolicyConditions):
+        self.checks: List[Tuple[Accessor, PredicateFn]] = []
+
+        # 1. Environment
+        if cond.environment:
+            self.checks.append((attrgetter("environment"), compile_predicate(cond.environment)))
+
+        # 2. Signals
+        if cond.signals:
+            for signal_key, predicate in cond.signals.items():
+                getter = (lambda key: lambda ctx: ctx.signals.get(key))(signal_key)
+                self.checks.append((getter, compile_predicate(predicate)))
+
+        # 3. Context
+        if cond.context:
+            for context_path, predicate in cond.context.items():
+                self.checks.append((compile_accessor(context_path), compile_predicate(predicate)))
+
+    def matches(self, ctx: EvaluationContext) -> bool:
+        for getter, test in self.checks:
+            if not test(getter(ctx)):
+                return False
+        return True
+
+    def __eq__(self, other: Any) -> bool:
+        # Derived state: never makes otherwise equal conditions compare unequal
+        return isinstance(other, CompiledConditions)
+
+    __hash__ = None
+
+
+def compile_conditions(cond: PolicyConditions) -> CompiledConditions:
+    """Compile (once) the conditions of a policy; kept on the conditions object."""
+    compiled = cond._compiled
+    if compiled is None:
+        compiled = cond._compiled = CompiledConditions(cond)
+    return compiled
+
+
 class PolicyEvaluator:
     """
     Deterministic rule engine.
@@ -25,6 +157,11 @@ class PolicyEvaluator:
         return self._aggregate(matches)
 
     def _matches(self, ctx: EvaluationContext, policy: PolicyDef) -> bool:
+        # Policies are normally compiled by PolicyLoader; compile lazily otherwise
+        return compile_conditions(policy.when).matches(ctx)
+
+    def _matches_reference(self, ctx: EvaluationContext, policy: PolicyDef) -> bool:
+        """Uncompiled reference semantics for _matches."""
         cond = policy.when
         
         # 1. Environment
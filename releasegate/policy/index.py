@@ -0,0 +1,224 @@
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+from .policy_types import ControlSignal, Policy
+
+PredicateFn = Callable[[Any], bool]
+
+_MEMBER_TYPES = (list, tuple, set)
+
+
+class CompiledControl(NamedTuple):
+    """A ControlSignal with its operator resolved to a typed predicate."""
+    signal: str
+    operator: str
+    value: Any
+    test: PredicateFn
+
+
+class PolicyMatcher(NamedTuple):
+    """
+    A compiled Policy. Controls are ids into the index's shared predicate
+    table; `any_of` holds the OR alternatives (empty for AND-only policies).
+    """
+    policy: Policy
+    controls: Tuple[int, ...]
+    any_of: Tuple[Tuple[int, ...], ...]
+    signals: Tuple[str, ...] # Distinct signals of `controls`: all required to match
+
+
+def _never(actual: Any) -> bool:
+    return False
+
+
+def _compile_numeric(operator: str, expected: Any) -> PredicateFn:
+    # The expected side is converted once; the actual side still goes through
+    # float() so strings like "12" keep comparing exactly as before.
+    try:
+        bound = float(expected)
+    except (TypeError, ValueError):
+        return _never
+
+    if operator == ">":
+        return lambda actual: float(actual) > bound
+    if operator == ">=":
+        return lambda actual: float(actual) >= bound
+    if operator == "<":
+        return lambda actual: float(actual) < bound
+    return lambda actual: float(actual) <= bound
+
+
+def _compile_membership(expected: Any) -> Callable[[Any], bool]:
+    """
+    Returns a single-value membership test against `expected`.
+    Hashable collections get a frozenset lookup; unhashable probes (or
+    collections) fall back to the original container so semantics match.
+    """
+    lookup = None
+    if isinstance(expected, (list, tuple, set, frozenset)):
+        try:
+            lookup = frozenset(expected)
+        except TypeError:
+            lookup = None
+
+    if lookup is None:
+        return lambda item: item in expected
+
+    def member(item: Any) -> bool:
+        try:
+            return item in lookup
+        except TypeError:
+            return item in expected
+    return member
+
+
+def compile_predicate(operator: str, expected: Any) -> PredicateFn:
+    """
+    Compile an operator/value pair into a predicate over the actual signal value.
+    Mirrors ComplianceEngine._check_condition, except that the None check and
+    exception handling are applied by the caller (PolicyIndex.match).
+    """
+    if operator == "==":
+        return lambda actual: actual == expected
+    if operator == "!=":
+        return lambda actual: actual != expected
+    if operator in (">", ">=", "<", "<="):
+        return _compile_numeric(operator, expected)
+    if operator == "in":
+        member = _compile_membership(expected)
+
+        def is_in(actual: Any) -> bool:
+            if isinstance(actual, _MEMBER_TYPES):
+                return any(member(a) for a in actual)
+            return member(actual)
+        return is_in
+    if operator == "not in":
+        member = _compile_membership(expected)
+
+        def not_in(actual: Any) -> bool:
+            if isinstance(actual, _MEMBER_TYPES):
+                return all(not member(a) for a in actual)
+            return not member(actual)
+        return not_in
+    return _never
+
+
+def predicate_key(ctrl: ControlSignal) -> Tuple[str, str, str, str]:
+    """Identity of a control in the shared predicate table (values may be unhashable)."""
+    return (ctrl.signal, ctrl.operator, type(ctrl.value).__name__, repr(ctrl.value))
+
+
+class PolicyIndex:
+    """
+    Load-time compiled view over a list of compiled (Phase 2) policies.
+
+    Every distinct control (signal, operator, value) across all policies is
+    compiled once into a shared predicate table, so a predicate repeated over
+    many rules (or OR branches) is evaluated at most once per `match` call.
+
+    Policies are indexed by the signals their controls reference. Because a
+    control never matches a missing (None) signal, a policy can only trigger
+    when every one of its signals is present, so `match` skips all other
+    policies without evaluating a single predicate.
+    """
+
+    def __init__(self, policies: Sequence[Policy]):
+        self.policies: List[Policy] = list(policies)
+        self.predicates: List[CompiledControl] = []
+        self._predicate_ids: Dict[Tuple[str, str, str, str], int] = {}
+        self.compiled: List[PolicyMatcher] = [self._compile_policy(p) for p in self.policies]
+
+        # signal name -> positions of policies requiring it
+        self.by_signal: Dict[str, List[int]] = {}
+        # Policies without controls trigger unconditionally (0 == 0 controls met)
+        self.unconditional: List[int] = []
+        # OR-only policies (no common controls): checked on every match
+        self.always_check: List[int] = []
+
+        for pos, compiled in enumerate(self.compiled):
+            if not compiled.signals:
+                if compiled.any_of:
+                    self.always_check.append(pos)
+                else:
+                    self.unconditional.append(pos)
+            for signal in compiled.signals:
+                self.by_signal.setdefault(signal, []).append(pos)
+
+    def __len__(self) -> int:
+        return len(self.policies)
+
+    def _predicate_id(self, ctrl: ControlSignal) -> int:
+        key = predicate_key(ctrl)
+        pid = self._predicate_ids.get(key)
+        if pid is None:
+            pid = len(self.predicates)
+            self.predicates.append(
+                CompiledControl(ctrl.signal, ctrl.operator, ctrl.value, compile_predicate(ctrl.operator, ctrl.value))
+            )
+            self._predicate_ids[key] = pid
+        return pid
+
+    def _compile_policy(self, policy: Policy) -> PolicyMatcher:
+        controls = tuple(self._predicate_id(ctrl) for ctrl in policy.controls)
+        any_of = tuple(
+            tuple(self._predicate_id(ctrl) for ctrl in group)
+            for group in (policy.any_of or [])
+        )
+        signals = tuple(dict.fromkeys(ctrl.signal for ctrl in policy.controls))
+        return PolicyMatcher(policy, controls, any_of, signals)
+
+    def match(self, signals: Mapping[str, Any]) -> Dict[int, List[str]]:
+        """
+        Evaluate all policies against a signal map.
+        Returns {policy position: violation strings} for triggered policies only.
+        """
+        present: Dict[str, Any] = {}
+        hits: Dict[int, int] = {}
+        for signal, positions in self.by_signal.items():
+            actual = signals.get(signal)
+            if actual is None:
+                continue
+            present[signal] = actual
+            for pos in positions:
+                hits[pos] = hits.get(pos, 0) + 1
+
+        candidates = [
+            pos for pos, count in hits.items()
+            if count == len(self.compiled[pos].signals)
+        ] + self.always_check
+
+        # Truth value per predicate id, computed on first use within this call
+        truth: Dict[int, bool] = {}
+
+        def holds(pid: int) -> bool:
+            result = truth.get(pid)
+            if result is None:
+                pred = self.predicates[pid]
+                if pred.signal in present:
+                    actual = present[pred.signal]
+                else:
+                    actual = present[pred.signal] = signals.get(pred.signal)
+                try:
+                    result = actual is not None and bool(pred.test(actual))
+                except Exception:
+                    result = False
+                truth[pid] = result
+            return result
+
+        triggered: Dict[int, List[str]] = {pos: [] for pos in self.unconditional}
+        for pos in candidates:
+            compiled = self.compiled[pos]
+            # AND logic: every control must match for the policy to trigger
+            if not all(holds(pid) for pid in compiled.controls):
+                continue
+            matched = compiled.controls
+            if compiled.any_of:
+                group = next((g for g in compiled.any_of if all(holds(pid) for pid in g)), None)
+                if group is None:
+                    continue
+                matched = matched + group
+            triggered[pos] = [self._violation(self.predicates[pid], present) for pid in matched]
+
+        return triggered
+
+    @staticmethod
+    def _violation(pred: CompiledControl, present: Dict[str, Any]) -> str:
+        return f"{pred.signal} ({present[pred.signal]}) {pred.operator} {pred.value}"
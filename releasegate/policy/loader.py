@@ -1,13 +1,19 @@
 import os
 import yaml
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Tuple
 from .types import PolicyDef
 from .policy_types import Policy
 
 class PolicyLoader:
-    def __init__(self, policy_dir: Optional[str] = None, schema: str = "def"):
+    def __init__(self, policy_dir: Optional[str] = None, schema: str = "def", use_bundle: bool = True):
         # schema: "def" (PolicyDef), "compiled" (Policy), or "auto"
         self.schema = schema
+        # Read a fresh _bundle.rgb (see policy.bundle) instead of parsing YAML
+        self.use_bundle = use_bundle
+        # True if the last load_policies() was served from the bundle
+        self.from_bundle = False
+        # (path, error) for files that failed to load during the last load_policies()
+        self.errors: List[Tuple[str, str]] = []
         if policy_dir:
             self.policy_dir = policy_dir
         else:
@@ -19,10 +25,19 @@ class PolicyLoader:
         Returns validated PolicyDef objects sorted by Priority (asc), then ID.
         """
         policies = []
+        self.errors = []
+        self.from_bundle = False
         
         if not os.path.exists(self.policy_dir):
             return []
 
+        if self.use_bundle:
+            from .bundle import read_bundle
+            bundled = read_bundle(self.policy_dir, self.schema)
+            if bundled is not None:
+                self.from_bundle = True
+                return self._compile(bundled)
+
         for root, _, files in os.walk(self.policy_dir):
             for file in files:
                 if file.startswith("_"):
@@ -43,13 +58,23 @@ class PolicyLoader:
                                 policy.source_file = full_path
                             policies.append(policy)
                     except Exception as e:
+                        self.errors.append((full_path, str(e)))
                         import sys
                         print(f"WARN: Failed to load policy {full_path}: {e}", file=sys.stderr)
         
         # Sort deterministic
         if self.schema == "compiled" or (self.schema == "auto" and policies and isinstance(policies[0], Policy)):
             return sorted(policies, key=lambda p: p.policy_id)
-        return sorted(policies, key=lambda p: (p.priority, p.id))
+        return self._compile(sorted(policies, key=lambda p: (p.priority, p.id)))
+
+    @staticmethod
+    def _compile(policies: List[Union[PolicyDef, Policy]]) -> List[Union[PolicyDef, Policy]]:
+        """Pre-compile PolicyDef conditions so evaluation skips per-call path/predicate parsing."""
+        from .evaluator import compile_conditions
+        for policy in policies:
+            if isinstance(policy, PolicyDef):
+                compile_conditions(policy.when)
+        return policies
 
     def load_all(self) -> List[Union[PolicyDef, Policy]]:
         """Alias for load_policies (legacy compatibility)."""
@@ -28,6 +28,9 @@ class Policy(BaseModel):
     enabled: bool = True
     
     controls: List[ControlSignal]
+    # DNF alternatives from OR conditions: triggers when all controls hold and
+    # all controls of at least one group hold
+    any_of: Optional[List[List[ControlSignal]]] = None
     enforcement: EnforcementConfig
     evidence: Optional[EvidenceConfig] = None
     metadata: Optional[Dict[str, Any]] = None # Traceability: parent_policy, version, compliance, etc.
@@ -0,0 +1,148 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .index import PolicyIndex
+from .loader import PolicyLoader
+from .policy_types import Policy
+from .types import PolicyDef
+
+POLICY_FILE_EXTENSIONS = (".yaml", ".yml", ".json")
+
+# Seconds between directory checks for shared registries (0 disables the watcher)
+DEFAULT_RELOAD_INTERVAL = float(os.getenv("RELEASEGATE_POLICY_RELOAD_INTERVAL", "5"))
+
+
+class PolicySnapshot(NamedTuple):
+    """
+    An immutable, fully built policy set.
+    Evaluations hold on to the snapshot they started with, so a reload never
+    changes the policies underneath an in-flight evaluation.
+    """
+    version: str # Fingerprint of the policy directory it was built from
+    policies: List[Union[Policy, PolicyDef]]
+    index: Optional[PolicyIndex] # Only for compiled (Phase 2) policies
+    loaded_at: float
+
+
+def policy_dir_fingerprint(policy_dir: str) -> str:
+    """
+    Cheap change detector for a policy directory: hashes path, size and mtime
+    of every policy file (and manifest) without reading their contents.
+    """
+    entries = []
+    if os.path.isdir(policy_dir):
+        for root, _, files in os.walk(policy_dir):
+            for name in files:
+                if name.startswith("_") or not name.endswith(POLICY_FILE_EXTENSIONS):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append(f"{os.path.relpath(path, policy_dir)}:{st.st_size}:{st.st_mtime_ns}")
+    entries.sort()
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+class PolicyRegistry:
+    """
+    Loads a policy directory once and keeps it current.
+
+    `current()` is a lock-free read of the active snapshot. `refresh()` checks
+    the directory fingerprint and, if it changed, rebuilds policies and their
+    compiled index off to the side before swapping the snapshot reference in
+    one assignment. A reload that hits unparsable files keeps serving the
+    previous snapshot rather than silently dropping policies.
+    """
+
+    _shared: Dict[Tuple[str, str], "PolicyRegistry"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, policy_dir: str, schema: str = "compiled"):
+        self.policy_dir = policy_dir
+        self.schema = schema
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self._snapshot = self._build(policy_dir_fingerprint(policy_dir))
+
+    @classmethod
+    def shared(cls, policy_dir: str, schema: str = "compiled",
+               reload_interval: float = DEFAULT_RELOAD_INTERVAL) -> "PolicyRegistry":
+        """Process-wide registry per (directory, schema), watched in the background."""
+        key = (os.path.abspath(policy_dir), schema)
+        with cls._shared_lock:
+            registry = cls._shared.get(key)
+            if registry is None:
+                registry = cls(policy_dir, schema)
+                if reload_interval > 0:
+                    registry.start_watching(reload_interval)
+                cls._shared[key] = registry
+        return registry
+
+    def current(self) -> PolicySnapshot:
+        return self._snapshot
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Rebuild the snapshot if the directory changed (or `force`).
+        Returns True if a new snapshot was swapped in.
+        """
+        with self._refresh_lock:
+            version = policy_dir_fingerprint(self.policy_dir)
+            if not force and version == self._snapshot.version:
+                return False
+
+            snapshot = self._build(version)
+            if snapshot is None:
+                return False
+            # Files changed while we were loading: wait for the next check
+            if policy_dir_fingerprint(self.policy_dir) != version:
+                return False
+
+            self._snapshot = snapshot
+            return True
+
+    def start_watching(self, interval: float = DEFAULT_RELOAD_INTERVAL):
+        """Poll the directory fingerprint on a daemon thread."""
+        if self._watcher and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="releasegate-policy-watch", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop.set()
+        if self._watcher:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def _watch(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"WARN: Policy reload failed for {self.policy_dir}: {e}", file=sys.stderr)
+
+    def _build(self, version: str) -> Optional[PolicySnapshot]:
+        loader = PolicyLoader(policy_dir=self.policy_dir, schema=self.schema)
+        policies = loader.load_policies()
+
+        previous = getattr(self, "_snapshot", None)
+        if loader.errors and previous is not None:
+            print(
+                f"WARN: Keeping policy version {previous.version[:12]}; "
+                f"{len(loader.errors)} file(s) failed to load from {self.policy_dir}",
+                file=sys.stderr
+            )
+            return None
+
+        index = PolicyIndex(policies) if self.schema == "compiled" else None
+        return PolicySnapshot(version=version, policies=policies, index=index, loaded_at=time.time())
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import List, Optional, Dict, Any, Union, Literal
 
 class Predicate(BaseModel):
@@ -23,6 +23,9 @@ class PolicyConditions(BaseModel):
     signals: Optional[Dict[str, Predicate]] = None
     context: Optional[Dict[str, Predicate]] = None
 
+    # evaluator.CompiledConditions, set by evaluator.compile_conditions
+    _compiled: Any = PrivateAttr(default=None)
+
 class Requirement(BaseModel):
     """
     What is required if this policy triggers.
@@ -50,3 +53,12 @@ class PolicyDef(BaseModel):
     
     # Metadata for traceability
     source_file: Optional[str] = None
+
+class CompiledPolicy(BaseModel):
+    """
+    One Phase 2 policy emitted by the DSL compiler (one per DSL rule).
+    """
+    filename: str
+    content: Dict[str, Any]
+    source_hash: str # sha256 of the DSL source it was compiled from
+    policy_id: str
@@ -11,11 +11,13 @@ import hmac
 import hashlib
 import json
 import os
+import sqlite3
 import requests
 import yaml
 import base64
 import git
 from fastapi import FastAPI, Header, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
@@ -258,6 +260,22 @@ def ci_score(payload: CIScoreRequest):
     }
 
 
+def _invalidate_cached_issue(data: Dict[str, Any]):
+    """Blocking SQLite write: run it off the event loop."""
+    from releasegate.storage.provider_cache import ProviderCache
+    from releasegate.storage.schema import init_db
+    repo_full_name = data.get("repository", {}).get("full_name")
+    number = (data.get("issue") or data.get("pull_request") or {}).get("number")
+    if not repo_full_name or not number:
+        return
+    try:
+        init_db() # A fresh database has no cache table yet
+        ProviderCache.for_table("github_cache").invalidate(f"github:{repo_full_name}:issue:{number}")
+    except sqlite3.Error as e:
+        # Entries still expire by TTL; never fail the delivery over the cache
+        print(f"Warning: Failed to invalidate cached labels for {repo_full_name}#{number}: {e}")
+
+
 @app.post("/webhooks/github")
 async def github_webhook(
     request: Request,
@@ -284,6 +302,10 @@ async def github_webhook(
 
     data = json.loads(payload)
 
+    # Label changes invalidate the cached issue/PR labels before anything reads them
+    if x_github_event in ("issues", "pull_request") and data.get("action") in ("labeled", "unlabeled", "edited"):
+        await run_in_threadpool(_invalidate_cached_issue, data)
+
     # Process Pull Request Events
     if x_github_event != "pull_request":
         return {"msg": "Ignored non-PR event"}
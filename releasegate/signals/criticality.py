@@ -1,7 +1,7 @@
-import sqlite3
-import json
+from releasegate.storage.database import read_connection
+from releasegate.storage.schema import init_db
 from typing import Dict, Tuple, Any, List
-from releasegate.config import DB_PATH
+from releasegate import config
 from releasegate.signals.types import RawSignals, FeatureExplanation
 from releasegate.signals import normalize
 
@@ -20,34 +20,23 @@ class CriticalityEngine:
         Gracefully handles missing DB (e.g. in CI or fresh install).
         """
         import os
-        if not os.path.exists(DB_PATH):
+        if not os.path.exists(config.DB_PATH):
             return {}
 
-        conn = sqlite3.connect(DB_PATH)
         try:
+            init_db() # Existing databases get pr_run_files via migration
+            conn = read_connection()
+            # Per-file counts over labeled runs, grouped in SQL from pr_run_files
             query = """
-            SELECT files_json, label_value 
-            FROM pr_runs 
-            WHERE label_value IS NOT NULL AND files_json IS NOT NULL
+            SELECT f.file_path, COUNT(*), SUM(r.label_value = 1)
+            FROM pr_run_files f
+            JOIN pr_runs r ON r.run_id = f.run_id
+            WHERE r.label_value IS NOT NULL
+            GROUP BY f.file_path
             """
-            cursor = conn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
             file_counts = {} # file -> {"changes": 0, "incidents": 0}
-            
-            for files_str, label_val in rows:
-                try:
-                    files = json.loads(files_str)
-                    is_incident = 1 if label_val == 1 else 0
-                    
-                    for f in files:
-                        if f not in file_counts:
-                            file_counts[f] = {"changes": 0, "incidents": 0}
-                        file_counts[f]["changes"] += 1
-                        file_counts[f]["incidents"] += is_incident
-                except Exception:
-                    continue
+            for f, changes, incidents in conn.execute(query):
+                file_counts[f] = {"changes": changes, "incidents": incidents or 0}
             
             risk_map = {}
             for f, stats in file_counts.items():
@@ -58,8 +47,6 @@ class CriticalityEngine:
         except Exception as e:
             print(f"Warning: Error building historical risk map: {e}")
             return {}
-        finally:
-            conn.close()
 
     def compute_features(self, raw: RawSignals) -> Tuple[Dict[str, float], FeatureExplanation]:
         files = raw["files_changed"]
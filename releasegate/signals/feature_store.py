@@ -1,5 +1,4 @@
 from typing import Dict, Any, List, Tuple
-from releasegate.config import DB_PATH
 from releasegate.signals.types import RawSignals, FeatureVector, FeatureExplanation
 from releasegate.signals.churn import ChurnEngine
 from releasegate.signals.criticality import CriticalityEngine
@@ -30,7 +29,7 @@ class FeatureStore:
         Load repo stats from DB or return defaults.
         In prod, this queries `repo_baselines` table.
         """
-        import sqlite3
+        from releasegate.storage.database import read_connection
         defaults = {
             "log_churn_mean": 4.5,
             "log_churn_std": 1.5,
@@ -45,13 +44,11 @@ class FeatureStore:
             if not repo:
                 return defaults
 
-            conn = sqlite3.connect(DB_PATH)
-            conn.row_factory = sqlite3.Row
+            conn = read_connection()
             cursor = conn.cursor()
 
             cursor.execute("SELECT * FROM repo_baselines WHERE repo = ? ORDER BY updated_at DESC LIMIT 1", (repo,))
             row = cursor.fetchone()
-            conn.close()
 
             if row:
                 return {
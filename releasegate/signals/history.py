@@ -15,21 +15,18 @@ class HistoryEngine:
         self.repo_base_rate = 0.05 # Default if unknown
 
     def _load_bucket_stats(self) -> Dict[str, Dict[str, int]]:
-        import sqlite3
-        from releasegate.config import DB_PATH
+        from releasegate.storage.database import read_connection
         stats = {}
         
         try:
             repo = self.config.get("repo_slug") or self.config.get("github", {}).get("repo")
             if not repo: return {}
             
-            conn = sqlite3.connect(DB_PATH)
-            conn.row_factory = sqlite3.Row
+            conn = read_connection()
             cursor = conn.cursor()
             
             cursor.execute("SELECT bucket_id, incident_count, total_count FROM bucket_stats WHERE repo = ?", (repo,))
             rows = cursor.fetchall()
-            conn.close()
             
             for r in rows:
                 stats[r["bucket_id"]] = {
@@ -0,0 +1,113 @@
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+# Dicts stored under this key are treated as leaf values, not flattened
+LEAF_KEYS = frozenset({"files_changed"})
+
+_MISSING = object()
+
+
+def flatten_signals(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Recursive flatten for dot notation (eager reference implementation)."""
+    out = {}
+    for k, v in data.items():
+        key = f"{prefix}.{k}" if prefix else k
+        if isinstance(v, dict) and k not in LEAF_KEYS: # Don't flatten lists of files
+            out.update(flatten_signals(v, key))
+        else:
+            out[key] = v
+    return out
+
+
+class SignalNamespace(Mapping):
+    """
+    Lazy dotted-path view over nested signal dicts.
+
+    Behaves like the dict returned by `flatten_signals(data)`, but resolves
+    "a.b.c" only when it is looked up, walking the nested dicts instead of
+    copying them. Resolved lookups (including misses) are memoized, so the
+    work done per evaluation scales with the number of signals policies
+    actually reference rather than with the size of the input.
+
+    Keys containing dots (e.g. Phase 3 signals like "secrets.detected") and
+    colliding paths resolve exactly as in the eager flatten: the entry that
+    would have been written last wins.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._memo: Dict[str, Any] = {}
+        self._flat: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            value = self._memo[key]
+        except KeyError:
+            found = self._resolve(self._data, "", key) if isinstance(key, str) else None
+            value = self._memo[key] = found[1] if found else _MISSING
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the full flat map (only needed for iteration/debugging)."""
+        if self._flat is None:
+            self._flat = flatten_signals(self._data)
+        return self._flat
+
+    def _resolve(self, node: Dict[str, Any], prefix: str, target: str) -> Optional[Tuple[Any, Any]]:
+        """
+        Find the value flattened under `target` within `node`.
+        Returns (key, value) of the winning entry at this level, or None.
+        """
+        if prefix:
+            if not target.startswith(prefix + "."):
+                return None
+            rest = target[len(prefix) + 1:]
+        else:
+            rest = target
+
+        # Candidate keys are the prefixes of `rest` ending at a dot, plus `rest` itself
+        candidates = [rest[:i] for i, ch in enumerate(rest) if ch == "."]
+        candidates.append(rest)
+        if not prefix and "" not in candidates:
+            candidates.append("")
+
+        matches = []
+        for k in candidates:
+            if k not in node:
+                continue
+            v = node[k]
+            key = f"{prefix}.{k}" if prefix else k
+            if isinstance(v, dict) and k not in LEAF_KEYS:
+                found = self._resolve(v, key, target)
+                if found is not None:
+                    matches.append((k, found[1]))
+            elif key == target:
+                matches.append((k, v))
+
+        if not matches:
+            return None
+        if len(matches) > 1:
+            # Same flat key produced by several entries: the last one written wins
+            order = {k: i for i, k in enumerate(node)}
+            matches.sort(key=lambda m: order[m[0]])
+        return matches[-1]
@@ -0,0 +1,239 @@
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from releasegate import config
+from releasegate.storage.group_commit import GroupCommitter
+
+R = TypeVar("R")
+
+# Connection tuning, applied to every connection the storage layer opens
+JOURNAL_MODE = os.getenv("RELEASEGATE_SQLITE_JOURNAL_MODE", "WAL")
+SYNCHRONOUS = os.getenv("RELEASEGATE_SQLITE_SYNCHRONOUS", "NORMAL") # Safe with WAL; FULL for fsync per commit
+CACHE_SIZE_KIB = 16 * 1024
+MMAP_SIZE = 256 * 1024 * 1024
+BUSY_TIMEOUT_MS = 5000
+# Per-connection prepared statement cache (keyed by SQL text)
+CACHED_STATEMENTS = 256
+# Most write jobs committed in one transaction
+MAX_WRITE_BATCH = 256
+
+FileId = Tuple[int, int]
+
+
+def _file_id(path: str) -> Optional[FileId]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def open_connection(path: str, autocommit: bool = False) -> sqlite3.Connection:
+    """A tuned connection. Shared across threads only under the caller's own locking."""
+    db_dir = os.path.dirname(path)
+    if db_dir and not os.path.exists(db_dir):
+        os.makedirs(db_dir, exist_ok=True)
+    conn = sqlite3.connect(
+        path,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        cached_statements=CACHED_STATEMENTS,
+        check_same_thread=False,
+        isolation_level=None if autocommit else "",
+    )
+    # Only takes effect for a new (empty) database; lets free pages be returned incrementally
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute(f"PRAGMA journal_mode={JOURNAL_MODE}")
+    conn.execute(f"PRAGMA synchronous={SYNCHRONOUS}")
+    conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+class _Outcome:
+    __slots__ = ("value", "error")
+
+    def __init__(self, value: Any = None, error: Optional[BaseException] = None):
+        self.value = value
+        self.error = error
+
+
+class Database:
+    """
+    Single access point for one SQLite file.
+
+    Reads use a pooled connection per thread (`reader()`). Writes are jobs,
+    `fn(conn) -> result`, routed through one writer connection: concurrent
+    jobs are group-committed in a single transaction, each inside its own
+    SAVEPOINT, so a failing job is rolled back alone and raises only in its
+    caller. Jobs must not commit, roll back, or call write() themselves.
+
+    If the file is removed or replaced (tests, restores), every connection to
+    the old file is closed before the new one is opened. Read connections of
+    threads that have exited are closed whenever another thread opens one.
+    """
+
+    _instances: Dict[str, "Database"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock() # Guards connection bookkeeping
+        self._readers: Dict[int, sqlite3.Connection] = {} # thread ident -> connection
+        self._file: Optional[FileId] = None # File all open connections belong to
+        self._writer: Optional[sqlite3.Connection] = None
+        self._batch_conn: Optional[sqlite3.Connection] = None # Writer in use by the running batch
+        self._ensured: Set[str] = set() # ensure() keys applied to self._file
+        self.committer: GroupCommitter[Callable[[sqlite3.Connection], Any], _Outcome] = GroupCommitter(
+            self._run_batch, max_batch=MAX_WRITE_BATCH
+        )
+
+    @classmethod
+    def for_path(cls, path: Optional[str] = None) -> "Database":
+        """Shared instance for `path` (default: config.DB_PATH)."""
+        path = path or config.DB_PATH
+        key = os.path.abspath(path)
+        with cls._instances_lock:
+            db = cls._instances.get(key)
+            if db is None:
+                db = cls._instances[key] = cls(path)
+        return db
+
+    # --- connections ---
+
+    def _check_file(self):
+        """Drop all connections if the file changed under us. Caller holds self._lock."""
+        current = _file_id(self.path)
+        if self._file is not None and current != self._file:
+            self._close_all()
+        return current
+
+    def _close_all(self):
+        for conn in self._readers.values():
+            conn.close()
+        self._readers.clear()
+        if self._writer is not None:
+            # A running batch closes its own connection once it finishes
+            if self._writer is not self._batch_conn:
+                self._writer.close()
+            self._writer = None
+        self._file = None
+        self._ensured.clear()
+
+    def _opened(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        # An open connection pins its inode, so a replacement always has a different one
+        if self._file is None:
+            self._file = _file_id(self.path)
+        return conn
+
+    def reader(self) -> sqlite3.Connection:
+        """This thread's read connection. Do not close it; do not write through it."""
+        ident = threading.get_ident()
+        with self._lock:
+            self._check_file()
+            conn = self._readers.get(ident)
+            if conn is None:
+                self._close_dead_readers()
+                conn = self._readers[ident] = self._opened(open_connection(self.path))
+        # Callers may have swapped it (e.g. to tuples); restore the default
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _close_dead_readers(self):
+        """Close connections of exited threads (e.g. short-lived pool workers). Caller holds self._lock."""
+        alive = {thread.ident for thread in threading.enumerate()}
+        for ident in [ident for ident in self._readers if ident not in alive]:
+            self._readers.pop(ident).close()
+
+    def close(self):
+        """Close every connection (e.g. before deleting the database file)."""
+        with self._lock:
+            self._close_all()
+
+    # --- writes ---
+
+    def write(self, fn: Callable[[sqlite3.Connection], R]) -> R:
+        """Run `fn` on the writer connection in a (group-)committed transaction; returns its result."""
+        outcome = self.committer.commit_one(fn)
+        if outcome.error is not None:
+            raise outcome.error
+        return outcome.value
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Single write statement; returns the affected row count."""
+        return self.write(lambda conn: conn.execute(sql, params).rowcount)
+
+    def executemany(self, sql: str, seq: Iterable[Sequence[Any]]) -> int:
+        rows = list(seq)
+        return self.write(lambda conn: conn.executemany(sql, rows).rowcount)
+
+    def ensure(self, key: str, fn: Callable[[sqlite3.Connection], Any]):
+        """Run a setup job (e.g. schema DDL) once per database file."""
+        with self._lock:
+            self._check_file()
+            if key in self._ensured:
+                return
+        self.write(fn)
+        with self._lock:
+            if self._file == _file_id(self.path):
+                self._ensured.add(key)
+
+    def _run_batch(self, jobs: List[Callable[[sqlite3.Connection], Any]]) -> List[_Outcome]:
+        # The group committer runs one batch at a time; the lock only guards
+        # connection bookkeeping so readers are never blocked by a write.
+        # _close_all() leaves the batch's connection open until it finishes.
+        with self._lock:
+            self._check_file()
+            if self._writer is None:
+                # Explicit transaction control (BEGIN / SAVEPOINT / COMMIT)
+                self._writer = self._opened(open_connection(self.path, autocommit=True))
+            conn = self._batch_conn = self._writer
+
+        try:
+            return self._run_jobs(conn, jobs)
+        finally:
+            with self._lock:
+                self._batch_conn = None
+                if self._writer is not conn:
+                    conn.close()
+
+    @staticmethod
+    def _run_jobs(conn: sqlite3.Connection, jobs: List[Callable[[sqlite3.Connection], Any]]) -> List[_Outcome]:
+        outcomes = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for job in jobs:
+                conn.execute("SAVEPOINT job")
+                try:
+                    value = job(conn)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO job")
+                    conn.execute("RELEASE job")
+                    outcomes.append(_Outcome(error=e))
+                else:
+                    conn.execute("RELEASE job")
+                    outcomes.append(_Outcome(value))
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return outcomes
+
+
+def get_database(path: Optional[str] = None) -> Database:
+    return Database.for_path(path)
+
+
+def read_connection(path: Optional[str] = None) -> sqlite3.Connection:
+    """Pooled per-thread read connection to the main database."""
+    return Database.for_path(path).reader()
+
+
+def write(fn: Callable[[sqlite3.Connection], R], path: Optional[str] = None) -> R:
+    """Run a write job on the main database's single writer."""
+    return Database.for_path(path).write(fn)
@@ -0,0 +1,109 @@
+import threading
+import time
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Ticket(Generic[T, R]):
+    __slots__ = ("items", "results", "error", "done")
+
+    def __init__(self, items: Sequence[T]):
+        self.items = items
+        self.results: Optional[List[R]] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class GroupCommitter(Generic[T, R]):
+    """
+    Leader/follower group commit.
+
+    Callers hand items to `commit()` and block until they are durable. The
+    first caller to arrive while no flush is running becomes the leader and
+    flushes everything queued so far (up to `max_batch` items) in one call to
+    `flush`; callers arriving meanwhile queue up and are committed together in
+    the leader's next round. No background thread is involved.
+
+    `flush(items)` must return one result per item, in order. If it raises,
+    every caller in that batch gets the exception.
+    """
+
+    def __init__(self, flush: Callable[[List[T]], List[R]], max_batch: int = 1024, max_wait_s: float = 0.0):
+        self._flush = flush
+        self.max_batch = max_batch
+        # Optional linger before a flush so more callers can join the batch
+        self.max_wait_s = max_wait_s
+        self._cond = threading.Condition()
+        self._queue: List[_Ticket[T, R]] = []
+        self._flushing = False
+        # Counters for tests/diagnostics
+        self.batches = 0
+        self.items = 0
+
+    def commit(self, items: Sequence[T]) -> List[R]:
+        """Commit items as one contiguous run; returns their results."""
+        ticket: _Ticket[T, R] = _Ticket(list(items))
+        if not ticket.items:
+            return []
+
+        with self._cond:
+            self._queue.append(ticket)
+            while not ticket.done and self._flushing:
+                self._cond.wait()
+            if ticket.done:
+                return self._result(ticket)
+            self._flushing = True
+
+        # Leader: flush rounds until our own ticket is committed
+        try:
+            while not ticket.done:
+                if self.max_wait_s > 0:
+                    time.sleep(self.max_wait_s)
+                with self._cond:
+                    batch = self._take_batch()
+                self._run(batch)
+        finally:
+            with self._cond:
+                self._flushing = False
+                self._cond.notify_all()
+        return self._result(ticket)
+
+    def commit_one(self, item: T) -> R:
+        return self.commit([item])[0]
+
+    def _take_batch(self) -> List[_Ticket[T, R]]:
+        batch, count = [], 0
+        while self._queue and (not batch or count + len(self._queue[0].items) <= self.max_batch):
+            ticket = self._queue.pop(0)
+            batch.append(ticket)
+            count += len(ticket.items)
+        return batch
+
+    def _run(self, batch: List[_Ticket[T, R]]):
+        items = [item for ticket in batch for item in ticket.items]
+        try:
+            results = self._flush(items)
+            error = None
+        except BaseException as e:
+            results, error = None, e
+
+        with self._cond:
+            pos = 0
+            for ticket in batch:
+                if error is None:
+                    ticket.results = results[pos:pos + len(ticket.items)]
+                    pos += len(ticket.items)
+                else:
+                    ticket.error = error
+                ticket.done = True
+            self.batches += 1
+            self.items += len(items)
+            self._cond.notify_all()
+
+    @staticmethod
+    def _result(ticket: _Ticket[T, R]) -> List[R]:
+        if ticket.error is not None:
+            raise ticket.error
+        return ticket.results
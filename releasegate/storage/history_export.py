@@ -0,0 +1,249 @@
+import json
+import os
+import re
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError: # Optional: pip install "releasegate[parquet]"
+    pa = None
+    pq = None
+
+from releasegate.storage.atomic import atomic_write
+
+WATERMARK_FILE = "_watermark.json"
+EXPORT_BATCH_SIZE = 50000
+FEATURE_PREFIX = "features."
+
+_PART_RE = re.compile(r"^part-(\d+)-(\d+)\.parquet$")
+
+# Fixed run columns; flattened features_json keys follow as typed "features.*" columns
+_RUN_QUERY = """
+SELECT r.run_id, r.repo, substr(r.created_at, 1, 7) AS month, r.pr_number, r.base_sha, r.head_sha,
+       r.risk_score, r.risk_level, r.risk_probability, r.created_at,
+       r.label_value, r.label_source, r.features_json,
+       l.label_types, l.label_severity
+FROM pr_runs r
+LEFT JOIN (
+    SELECT repo, pr_number, group_concat(label_type, ',') AS label_types, MAX(severity) AS label_severity
+    FROM pr_labels GROUP BY repo, pr_number
+) l ON l.repo = r.repo AND l.pr_number = r.pr_number
+WHERE r.run_id > ?{repo_filter}
+ORDER BY r.run_id
+LIMIT ?
+"""
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError('Parquet export requires pyarrow: pip install "releasegate[parquet]"')
+
+
+def _base_fields():
+    return [
+        ("run_id", pa.int64()),
+        ("pr_number", pa.int64()),
+        ("base_sha", pa.string()),
+        ("head_sha", pa.string()),
+        ("risk_score", pa.int64()),
+        ("risk_level", pa.string()),
+        ("risk_probability", pa.float64()),
+        ("created_at", pa.string()),
+        ("label_value", pa.int64()),
+        ("label_source", pa.string()),
+        ("labels", pa.list_(pa.string())),
+        ("label_severity", pa.int64()),
+    ]
+
+
+def flatten_features(features: Any, prefix: str = FEATURE_PREFIX) -> Dict[str, Any]:
+    """
+    Flatten a features dict into scalar columns: numbers and booleans stay
+    numeric, strings stay strings, lists become "<key>.count".
+    """
+    flat: Dict[str, Any] = {}
+    if not isinstance(features, dict):
+        return flat
+    for key, value in features.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_features(value, name + "."))
+        elif isinstance(value, (list, tuple)):
+            flat[name + ".count"] = len(value)
+        elif value is not None:
+            flat[name] = value
+    return flat
+
+
+def _feature_type(value: Any) -> str:
+    return "double" if isinstance(value, (bool, int, float)) else "string"
+
+
+def _coerce(value: Any, type_name: str) -> Any:
+    if value is None:
+        return None
+    if type_name == "double":
+        return float(value) if isinstance(value, (bool, int, float)) else None
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def read_watermark(out_dir: str) -> Dict[str, Any]:
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return {"last_run_id": 0, "feature_types": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _remove_orphans(out_dir: str, last_run_id: int):
+    """Drop part files past the watermark (left by an export that crashed before committing)."""
+    for root, _, files in os.walk(out_dir):
+        for name in files:
+            match = _PART_RE.match(name)
+            if match and int(match.group(1)) > last_run_id:
+                os.remove(os.path.join(root, name))
+
+
+def _batches(conn, after: int, repo: Optional[str], batch_size: int) -> Iterator[List[Any]]:
+    query = _RUN_QUERY.format(repo_filter=" AND r.repo = ?" if repo else "")
+    while True:
+        params = [after, repo, batch_size] if repo else [after, batch_size]
+        rows = conn.execute(query, params).fetchall()
+        if not rows:
+            return
+        yield rows
+        after = rows[-1]["run_id"]
+
+
+def _partition_dir(out_dir: str, repo: str, month: Optional[str]) -> str:
+    # Hive-style, URI-encoded values (repo slugs contain "/")
+    return os.path.join(out_dir, f"repo={quote(repo, safe='')}", f"month={quote(month or 'unknown', safe='')}")
+
+
+def _write_part(directory: str, rows: List[Tuple[Any, Dict[str, Any]]], feature_types: Dict[str, str]):
+    """Write (run row, flattened features) pairs as one part file."""
+    columns: Dict[str, list] = defaultdict(list)
+    for row, flat in rows:
+        for name, _ in _base_fields():
+            if name == "labels":
+                columns[name].append(row["label_types"].split(",") if row["label_types"] else [])
+            else:
+                columns[name].append(row[name])
+        for name, type_name in feature_types.items():
+            columns[name].append(_coerce(flat.get(name), type_name))
+
+    fields = _base_fields() + [
+        (name, pa.float64() if type_name == "double" else pa.string()) for name, type_name in feature_types.items()
+    ]
+    schema = pa.schema(fields)
+    table = pa.table({name: pa.array(columns[name], type=type_) for name, type_ in fields}, schema=schema)
+
+    os.makedirs(directory, exist_ok=True)
+    first, last = rows[0][0]["run_id"], rows[-1][0]["run_id"]
+    path = os.path.join(directory, f"part-{first:012d}-{last:012d}.parquet")
+    tmp = path + ".tmp"
+    pq.write_table(table, tmp, compression="zstd")
+    os.replace(tmp, path)
+
+
+def export_history(
+    out_dir: str,
+    repo: Optional[str] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    full: bool = False,
+) -> Dict[str, Any]:
+    """
+    Export pr_runs (with pr_labels joined in) to Parquet under `out_dir`,
+    partitioned by repo and month, with features_json flattened into typed
+    "features.*" columns.
+
+    Incremental: only runs past the watermark (last exported run_id) are
+    written, as new part files; the watermark is committed after the files.
+    Labels are as of the export that wrote a run; use `full` to rebuild.
+    A feature column keeps the type it was first exported with.
+    """
+    _require_pyarrow()
+    from releasegate.storage.database import read_connection
+    from releasegate.storage.schema import init_db
+
+    if full and os.path.isdir(out_dir):
+        import shutil
+        shutil.rmtree(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    watermark = read_watermark(out_dir)
+    if watermark["last_run_id"] and watermark.get("repo") != repo:
+        raise ValueError(f"{out_dir} holds an export for repo {watermark.get('repo') or '(all)'}; use another directory or full=True")
+    _remove_orphans(out_dir, watermark["last_run_id"])
+
+    init_db()
+    conn = read_connection()
+    feature_types: Dict[str, str] = dict(watermark.get("feature_types", {}))
+    exported = files = 0
+    last_run_id = watermark["last_run_id"]
+
+    for rows in _batches(conn, last_run_id, repo, batch_size):
+        groups: Dict[Tuple[str, Optional[str]], List[Tuple[Any, Dict[str, Any]]]] = defaultdict(list)
+        for row in rows:
+            flat = flatten_features(json.loads(row["features_json"] or "{}"))
+            for name, value in flat.items():
+                feature_types.setdefault(name, _feature_type(value))
+            groups[(row["repo"], row["month"])].append((row, flat))
+        for (run_repo, month), group in groups.items():
+            _write_part(_partition_dir(out_dir, run_repo, month), group, feature_types)
+            files += 1
+        exported += len(rows)
+        last_run_id = rows[-1]["run_id"]
+
+        state = {
+            "last_run_id": last_run_id,
+            "feature_types": feature_types,
+            "repo": repo,
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with atomic_write(os.path.join(out_dir, WATERMARK_FILE)) as f:
+            json.dump(state, f, indent=2)
+
+    return {"runs_exported": exported, "files_written": files, "last_run_id": last_run_id,
+            "feature_columns": len(feature_types)}
+
+
+def read_history(
+    out_dir: str,
+    columns: Optional[Sequence[str]] = None,
+    repo: Optional[str] = None,
+    since_month: Optional[str] = None,
+):
+    """
+    Read exported history as a pyarrow Table: files are memory-mapped, only
+    `columns` are decoded, and repo/month partitions outside the filters are
+    skipped. Columns missing from older parts read as null.
+    """
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    paths = [
+        os.path.join(root, name)
+        for root, _, names in os.walk(out_dir) for name in names if _PART_RE.match(name)
+    ]
+    if not paths:
+        return pa.table({})
+    partitioning = ds.partitioning(pa.schema([("repo", pa.string()), ("month", pa.string())]), flavor="hive")
+    schema = pa.unify_schemas([pq.read_schema(path, memory_map=True) for path in paths])
+    schema = schema.append(pa.field("repo", pa.string())).append(pa.field("month", pa.string()))
+    dataset = ds.dataset(
+        paths, schema=schema, format="parquet", partitioning=partitioning, partition_base_dir=out_dir,
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+
+    expression = None
+    if repo:
+        expression = ds.field("repo") == repo
+    if since_month:
+        month_filter = ds.field("month") >= since_month
+        expression = month_filter if expression is None else expression & month_filter
+    return dataset.to_table(columns=list(columns) if columns else None, filter=expression)
@@ -0,0 +1,103 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from releasegate.storage.group_commit import GroupCommitter
+
+# fsync each committed batch that contains a durable append (one fsync per group)
+JSONL_FSYNC = os.getenv("RELEASEGATE_JSONL_FSYNC", "1") == "1"
+# Batch bounds: most records per write, and how long a leader lingers for followers
+JSONL_MAX_BATCH = int(os.getenv("RELEASEGATE_JSONL_MAX_BATCH", "512"))
+JSONL_GROUP_WINDOW_MS = float(os.getenv("RELEASEGATE_JSONL_GROUP_WINDOW_MS", "2"))
+
+
+@dataclass(frozen=True)
+class JsonlReceipt:
+    """Where an appended record landed, and whether its batch was fsynced."""
+    batch: int # Sequence number of the batch it was committed in
+    offset: int # Byte offset of the line in the file
+    length: int # Line length in bytes, including the newline
+    durable: bool
+
+
+class JsonlWriter:
+    """
+    Group-committed appender for one JSONL file.
+
+    Appends from all threads are queued; each batch is written with one
+    write and at most one fsync. Lines land in the file in commit order, and
+    every caller gets a receipt for its own line once its batch is written.
+    """
+
+    _writers: Dict[str, "JsonlWriter"] = {}
+    _writers_lock = threading.Lock()
+
+    def __init__(self, path: str, max_batch: int = JSONL_MAX_BATCH, window_ms: float = JSONL_GROUP_WINDOW_MS):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._ino: Optional[int] = None
+        self._batches = 0
+        self.committer: GroupCommitter[Tuple[str, bool], JsonlReceipt] = GroupCommitter(
+            self._write_batch, max_batch=max_batch, max_wait_s=window_ms / 1000
+        )
+
+    @classmethod
+    def for_path(cls, path: str) -> "JsonlWriter":
+        key = os.path.abspath(path)
+        with cls._writers_lock:
+            writer = cls._writers.get(key)
+            if writer is None:
+                writer = cls._writers[key] = cls(path)
+        return writer
+
+    def append(self, record: Dict[str, Any], fsync: Optional[bool] = None) -> JsonlReceipt:
+        """Append one record; returns once its batch is written (and fsynced if durable)."""
+        return self.append_many([record], fsync=fsync)[0]
+
+    def append_many(self, records: List[Dict[str, Any]], fsync: Optional[bool] = None) -> List[JsonlReceipt]:
+        """Append records as one contiguous run of lines."""
+        durable = JSONL_FSYNC if fsync is None else fsync
+        return self.committer.commit([(json.dumps(record) + "\n", durable) for record in records])
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _open(self) -> int:
+        # Reopen if the file was removed or rotated underneath us
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            st = None
+        if self._fd is not None and (st is None or st.st_ino != self._ino):
+            self.close()
+        if self._fd is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._ino = os.fstat(self._fd).st_ino
+        return self._fd
+
+    def _write_batch(self, items: List[Tuple[str, bool]]) -> List[JsonlReceipt]:
+        fd = self._open()
+        encoded = [line.encode("utf-8") for line, _ in items]
+        data = b"".join(encoded)
+        offset = os.fstat(fd).st_size
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        durable = any(d for _, d in items)
+        if durable:
+            os.fsync(fd)
+
+        self._batches += 1
+        receipts = []
+        for line in encoded:
+            receipts.append(JsonlReceipt(self._batches, offset, len(line), durable))
+            offset += len(line)
+        return receipts
@@ -0,0 +1,339 @@
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from releasegate.storage.database import Database
+
+CACHE_TABLES = ("github_cache", "gitlab_cache")
+
+DEFAULT_TTL_S = 3600
+# Most rows kept per cache table; least recently accessed rows are evicted beyond it
+MAX_ENTRIES = int(os.getenv("RELEASEGATE_PROVIDER_CACHE_MAX_ENTRIES", "50000"))
+# Rows deleted per write transaction, so maintenance never holds the writer for long
+DELETE_BATCH = 500
+# Buffered last-access updates flushed in one executemany
+TOUCH_FLUSH = 256
+# Seconds between background maintenance passes (0 disables the thread)
+MAINTENANCE_INTERVAL_S = float(os.getenv("RELEASEGATE_PROVIDER_CACHE_MAINTENANCE_S", "300"))
+# Free pages returned to the OS per maintenance pass (auto_vacuum=INCREMENTAL databases)
+VACUUM_PAGES = 1000
+# In-process tier in front of SQLite, per cache table (0 disables it)
+MEMORY_MAX_ENTRIES = int(os.getenv("RELEASEGATE_PROVIDER_CACHE_MEMORY_ENTRIES", "2048"))
+MEMORY_MAX_BYTES = int(os.getenv("RELEASEGATE_PROVIDER_CACHE_MEMORY_BYTES", str(16 * 1024 * 1024)))
+
+
+def namespace_of(key: str) -> str:
+    """'github:org/repo:issue:12' -> 'issue'."""
+    parts = key.rsplit(":", 2)
+    return parts[1] if len(parts) == 3 else ""
+
+
+def upgrade_cache_tables(conn):
+    """Schema migration: expiry / last-access columns and their indexes."""
+    for table in CACHE_TABLES:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN namespace TEXT")
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN expires_at REAL") # Unix time
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN last_accessed REAL") # Unix time
+        rows = conn.execute(f"SELECT cache_key FROM {table}").fetchall()
+        conn.executemany(f"UPDATE {table} SET namespace = ? WHERE cache_key = ?", [(namespace_of(r[0]), r[0]) for r in rows])
+        # Existing rows: the providers' default TTL from when they were fetched
+        conn.execute(f"""
+            UPDATE {table} SET
+                last_accessed = CAST(strftime('%s', fetched_at) AS REAL),
+                expires_at = CAST(strftime('%s', fetched_at) AS REAL) + {DEFAULT_TTL_S}
+        """)
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_expires ON {table}(expires_at)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_accessed ON {table}(last_accessed)")
+
+
+class MemoryLRU:
+    """
+    Bounded in-process LRU of decoded responses (by entry count and by JSON
+    size). Entries keep the SQLite row's fetch time and expiry, so they
+    expire exactly as the SQLite tier does. Not thread-safe on its own.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_MAX_ENTRIES, max_bytes: int = MEMORY_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        # key -> (data, fetched_epoch, expires_at, size)
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float, Optional[float], int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, now: float, ttl: Optional[float]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """(data, found); found with data None means the entry expired (and was dropped)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, False
+        data, fetched, expires_at, _ = entry
+        if (expires_at is not None and expires_at <= now) or (ttl is not None and now - fetched >= ttl):
+            self.pop(key)
+            return None, True
+        self._entries.move_to_end(key)
+        return data, True
+
+    def put(self, key: str, data: Dict[str, Any], fetched: float, expires_at: Optional[float], size: int):
+        self.pop(key)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        self._entries[key] = (data, fetched, expires_at, size)
+        self.bytes += size
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, (_, _, _, evicted_size) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+
+    def pop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[3]
+
+    def pop_prefix(self, prefix: str) -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            self.pop(key)
+        return len(keys)
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+
+def _epoch(fetched_at: str) -> float:
+    # fetched_at is naive UTC (datetime.utcnow().isoformat())
+    return datetime.fromisoformat(fetched_at).replace(tzinfo=timezone.utc).timestamp()
+
+
+class ProviderCache:
+    """
+    TTL + LRU cache of provider API responses in one SQLite table.
+
+    Entries carry an absolute expiry (per-namespace TTLs are chosen by the
+    caller) and a last-access time; access times are buffered in memory and
+    written in batches, so reads never write. maintain() deletes expired
+    rows, evicts the least recently used rows beyond max_entries (both in
+    bounded batches, one transaction each) and runs an incremental vacuum. It
+    runs in a background thread every MAINTENANCE_INTERVAL_S seconds.
+
+    A MemoryLRU tier in front of SQLite, shared by every provider in the
+    process, serves repeated lookups without a query or JSON decode; writes
+    go through both tiers. Returned dicts are shared with the memory tier:
+    do not mutate them.
+    """
+
+    _instances: Dict[Tuple[str, str], "ProviderCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, table: str, path: Optional[str] = None, max_entries: int = MAX_ENTRIES,
+                 interval_s: float = MAINTENANCE_INTERVAL_S, memory: Optional[MemoryLRU] = None):
+        if table not in CACHE_TABLES:
+            raise ValueError(f"Unknown provider cache table: {table}")
+        self.table = table
+        self.path = path
+        self.max_entries = max_entries
+        self.interval_s = interval_s
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self.memory = memory if memory is not None else MemoryLRU()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.hits = self.misses = self.expired = self.memory_hits = 0
+        self.evicted = self.expired_deleted = 0
+
+    @classmethod
+    def for_table(cls, table: str, path: Optional[str] = None) -> "ProviderCache":
+        """Shared instance per database file and table; starts background maintenance."""
+        db = Database.for_path(path)
+        key = (os.path.abspath(db.path), table)
+        with cls._instances_lock:
+            cache = cls._instances.get(key)
+            if cache is None:
+                cache = cls._instances[key] = cls(table, db.path)
+                cache.start()
+        return cache
+
+    @property
+    def db(self) -> Database:
+        return Database.for_path(self.path)
+
+    # --- reads / writes ---
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Cached response, or None if missing, expired, or older than `ttl` seconds."""
+        now = time.time()
+        with self._lock:
+            # An expired memory entry is dropped; SQLite may hold a newer one
+            data, _ = self.memory.get(key, now, ttl)
+            if data is not None:
+                self.hits += 1
+                self.memory_hits += 1
+                self._touched[key] = now
+                flush = len(self._touched) >= TOUCH_FLUSH
+        if data is not None:
+            if flush:
+                self.flush_access_times()
+            return data
+
+        row = self.db.reader().execute(
+            f"SELECT response_json, fetched_at, expires_at FROM {self.table} WHERE cache_key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        text, fetched_at, expires_at = row
+        fetched = _epoch(fetched_at)
+        if (expires_at is not None and expires_at <= now) or (ttl is not None and now - fetched >= ttl):
+            with self._lock:
+                self.expired += 1
+            return None
+        data = json.loads(text)
+        with self._lock:
+            self.hits += 1
+            self.memory.put(key, data, fetched, expires_at, len(text))
+            self._touched[key] = now
+            flush = len(self._touched) >= TOUCH_FLUSH
+        if flush:
+            self.flush_access_times()
+        return data
+
+    def set(self, key: str, data: Dict[str, Any], ttl: float = DEFAULT_TTL_S):
+        """Write-through: SQLite first, then the memory tier."""
+        fetched_at = datetime.utcnow()
+        now = time.time()
+        text = json.dumps(data)
+        self.db.execute(f"""
+        INSERT OR REPLACE INTO {self.table} (cache_key, response_json, fetched_at, namespace, expires_at, last_accessed)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """, (key, text, fetched_at.isoformat(), namespace_of(key), now + ttl, now))
+        with self._lock:
+            self.memory.put(key, data, _epoch(fetched_at.isoformat()), now + ttl, len(text))
+
+    def invalidate(self, key: str):
+        """Drop one entry from both tiers (e.g. an issue's labels changed)."""
+        with self._lock:
+            self._touched.pop(key, None)
+            self.memory.pop(key)
+        self.db.execute(f"DELETE FROM {self.table} WHERE cache_key = ?", (key,))
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every entry whose key starts with `prefix` (e.g. "github:org/repo:") from both tiers."""
+        with self._lock:
+            for key in [k for k in self._touched if k.startswith(prefix)]:
+                del self._touched[key]
+            self.memory.pop_prefix(prefix)
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self.db.execute(f"DELETE FROM {self.table} WHERE cache_key LIKE ? ESCAPE '\\'", (escaped + "%",))
+
+    def clear_memory(self):
+        """Drop the in-process tier only (SQLite entries stay)."""
+        with self._lock:
+            self.memory.clear()
+
+    # --- maintenance ---
+
+    def flush_access_times(self) -> int:
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            self.db.executemany(
+                f"UPDATE {self.table} SET last_accessed = ? WHERE cache_key = ?",
+                [(ts, key) for key, ts in touched.items()]
+            )
+        return len(touched)
+
+    def _delete_batches(self, select_rowids: str, params: Tuple, limit: Optional[int] = None) -> int:
+        deleted = 0
+        while limit is None or deleted < limit:
+            size = DELETE_BATCH if limit is None else min(DELETE_BATCH, limit - deleted)
+            n = self.db.execute(
+                f"DELETE FROM {self.table} WHERE rowid IN ({select_rowids} LIMIT ?)", (*params, size)
+            )
+            deleted += n
+            if n < size:
+                break
+        return deleted
+
+    def maintain(self) -> Dict[str, int]:
+        """One maintenance pass: flush access times, expire, evict, incremental vacuum."""
+        touched = self.flush_access_times()
+        expired = self._delete_batches(
+            f"SELECT rowid FROM {self.table} WHERE expires_at <= ?", (time.time(),)
+        )
+        count = self.db.reader().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        evicted = 0
+        if count > self.max_entries:
+            evicted = self._delete_batches(
+                f"SELECT rowid FROM {self.table} ORDER BY last_accessed", (), limit=count - self.max_entries
+            )
+        # No-op unless the database uses auto_vacuum=INCREMENTAL (new databases do)
+        self.db.write(lambda conn: conn.execute(f"PRAGMA incremental_vacuum({VACUUM_PAGES})").fetchall())
+        with self._lock:
+            self.expired_deleted += expired
+            self.evicted += evicted
+            # Rows deleted from SQLite must not be served from memory either
+            if evicted:
+                self.memory.clear()
+        return {"touched": touched, "expired_deleted": expired, "evicted": evicted}
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self.db.reader()
+        now = time.time()
+        entries, size_bytes, expired_rows = conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(length(response_json)), 0), "
+            f"COALESCE(SUM(expires_at <= ?), 0) FROM {self.table}", (now,)
+        ).fetchone()
+        namespaces = {
+            r[0] or "": r[1]
+            for r in conn.execute(f"SELECT namespace, COUNT(*) FROM {self.table} GROUP BY namespace")
+        }
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        with self._lock:
+            lookups = self.hits + self.misses + self.expired
+            return {
+                "table": self.table,
+                "entries": entries,
+                "expired_entries": expired_rows,
+                "response_bytes": size_bytes,
+                "namespaces": namespaces,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "memory_hits": self.memory_hits,
+                "memory_entries": len(self.memory),
+                "memory_bytes": self.memory.bytes,
+                "expired_deleted": self.expired_deleted,
+                "evicted": self.evicted,
+                "db_bytes": conn.execute("PRAGMA page_count").fetchone()[0] * page_size,
+                "free_bytes": conn.execute("PRAGMA freelist_count").fetchone()[0] * page_size,
+                "auto_vacuum": {0: "none", 1: "full", 2: "incremental"}.get(conn.execute("PRAGMA auto_vacuum").fetchone()[0]),
+            }
+
+    def start(self):
+        """Start the background maintenance thread (daemon; no-op if interval_s <= 0)."""
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name=f"{self.table}-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.maintain()
+            except Exception as e:
+                print(f"WARN: provider cache maintenance failed for {self.table}: {e}", file=sys.stderr)
@@ -0,0 +1,195 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Statuses counted as policy violations in the top-violations rollup
+VIOLATION_STATUSES = ("BLOCKED", "CONDITIONAL")
+
+
+def ensure_rollup_schema(conn):
+    """
+    Daily rollups maintained incrementally by save_run and AuditRecorder, so
+    analytics read O(days) rows instead of the full run/decision history.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS run_daily_rollups (
+            repo TEXT NOT NULL,
+            day TEXT NOT NULL, -- YYYY-MM-DD (UTC)
+            risk_level TEXT NOT NULL,
+            run_count INTEGER NOT NULL DEFAULT 0,
+            risk_sum INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (repo, day, risk_level)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS decision_daily_rollups (
+            repo TEXT NOT NULL,
+            day TEXT NOT NULL,
+            release_status TEXT NOT NULL,
+            decision_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (repo, day, release_status)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS policy_daily_rollups (
+            repo TEXT NOT NULL,
+            day TEXT NOT NULL,
+            policy_id TEXT NOT NULL,
+            release_status TEXT NOT NULL,
+            trigger_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (repo, day, policy_id, release_status)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_rollups_day ON run_daily_rollups(day)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_decision_rollups_day ON decision_daily_rollups(day)")
+
+
+def today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def record_run(conn, repo: str, day: str, risk_level: str, risk_score: int):
+    """Count one newly inserted pr_runs row. Runs inside the caller's transaction."""
+    conn.execute("""
+        INSERT INTO run_daily_rollups (repo, day, risk_level, run_count, risk_sum) VALUES (?, ?, ?, 1, ?)
+        ON CONFLICT (repo, day, risk_level) DO UPDATE SET
+            run_count = run_count + 1,
+            risk_sum = risk_sum + excluded.risk_sum
+    """, (repo, day, risk_level or "UNKNOWN", risk_score or 0))
+
+
+def record_runs_after(conn, last_run_id: int):
+    """Count every pr_runs row with run_id > last_run_id (a bulk insert). Runs inside the caller's transaction."""
+    conn.execute("""
+        INSERT INTO run_daily_rollups (repo, day, risk_level, run_count, risk_sum)
+        SELECT repo, substr(created_at, 1, 10), COALESCE(risk_level, 'UNKNOWN'), COUNT(*), COALESCE(SUM(risk_score), 0)
+        FROM pr_runs WHERE run_id > ?
+        GROUP BY 1, 2, 3
+        ON CONFLICT (repo, day, risk_level) DO UPDATE SET
+            run_count = run_count + excluded.run_count,
+            risk_sum = risk_sum + excluded.risk_sum
+    """, (last_run_id,))
+
+
+def record_decision(conn, repo: str, day: str, release_status: str, policy_ids: Iterable[str]):
+    """Count one newly recorded audit decision. Runs inside the caller's transaction."""
+    conn.execute("""
+        INSERT INTO decision_daily_rollups (repo, day, release_status, decision_count) VALUES (?, ?, ?, 1)
+        ON CONFLICT (repo, day, release_status) DO UPDATE SET decision_count = decision_count + 1
+    """, (repo, day, release_status))
+    conn.executemany("""
+        INSERT INTO policy_daily_rollups (repo, day, policy_id, release_status, trigger_count) VALUES (?, ?, ?, ?, 1)
+        ON CONFLICT (repo, day, policy_id, release_status) DO UPDATE SET trigger_count = trigger_count + 1
+    """, [(repo, day, policy_id, release_status) for policy_id in sorted(set(policy_ids))])
+
+
+def backfill(conn) -> Dict[str, int]:
+    """
+    Rebuild all rollups from pr_runs and audit_decisions (for existing
+    history). A write job: run it with Database.write(backfill).
+    """
+    from releasegate.audit.compression import decode_payload
+
+    ensure_rollup_schema(conn)
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for table in ("run_daily_rollups", "decision_daily_rollups", "policy_daily_rollups"):
+        conn.execute(f"DELETE FROM {table}")
+
+    if "pr_runs" in tables:
+        conn.execute("""
+            INSERT INTO run_daily_rollups (repo, day, risk_level, run_count, risk_sum)
+            SELECT repo, substr(created_at, 1, 10), COALESCE(risk_level, 'UNKNOWN'), COUNT(*), COALESCE(SUM(risk_score), 0)
+            FROM pr_runs
+            GROUP BY 1, 2, 3
+        """)
+    if "audit_decisions" in tables:
+        conn.execute("""
+            INSERT INTO decision_daily_rollups (repo, day, release_status, decision_count)
+            SELECT repo, substr(created_at, 1, 10), release_status, COUNT(*)
+            FROM audit_decisions
+            GROUP BY 1, 2, 3
+        """)
+        # Matched policies only exist inside the decision JSON
+        cursor = conn.execute("SELECT repo, substr(created_at, 1, 10), release_status, full_decision_json FROM audit_decisions")
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            for repo, day, status, stored_json in rows:
+                policies = json.loads(decode_payload(conn, stored_json)).get("matched_policies") or []
+                conn.executemany("""
+                    INSERT INTO policy_daily_rollups (repo, day, policy_id, release_status, trigger_count) VALUES (?, ?, ?, ?, 1)
+                    ON CONFLICT (repo, day, policy_id, release_status) DO UPDATE SET trigger_count = trigger_count + 1
+                """, [(repo, day, policy_id, status) for policy_id in sorted(set(policies))])
+
+    return {
+        table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ("run_daily_rollups", "decision_daily_rollups", "policy_daily_rollups")
+    }
+
+
+def _where(repo: Optional[str], since: Optional[str]):
+    clauses, params = [], []
+    if repo:
+        clauses.append("repo = ?")
+        params.append(repo)
+    if since:
+        clauses.append("day >= ?")
+        params.append(since)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def daily_run_stats(conn, repo: Optional[str] = None, since: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Per day: run count, HIGH-risk count and summed risk (oldest day first)."""
+    where, params = _where(repo, since)
+    rows = conn.execute(f"""
+        SELECT day, SUM(run_count), SUM(CASE WHEN risk_level = 'HIGH' THEN run_count ELSE 0 END), SUM(risk_sum)
+        FROM run_daily_rollups{where}
+        GROUP BY day ORDER BY day
+    """, params).fetchall()
+    return [{"day": r[0], "runs": r[1], "high": r[2], "risk_sum": r[3]} for r in rows]
+
+
+def run_level_counts(conn, repo: Optional[str] = None, since: Optional[str] = None) -> Dict[str, int]:
+    where, params = _where(repo, since)
+    rows = conn.execute(f"SELECT risk_level, SUM(run_count) FROM run_daily_rollups{where} GROUP BY risk_level", params)
+    return {r[0]: r[1] for r in rows}
+
+
+def daily_decision_stats(conn, repo: Optional[str] = None, since: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+    """{day: {release_status: count}}"""
+    where, params = _where(repo, since)
+    rows = conn.execute(f"""
+        SELECT day, release_status, SUM(decision_count)
+        FROM decision_daily_rollups{where}
+        GROUP BY day, release_status
+    """, params)
+    stats: Dict[str, Dict[str, int]] = {}
+    for day, status, count in rows:
+        stats.setdefault(day, {})[status] = count
+    return stats
+
+
+def top_policies(
+    conn,
+    repo: Optional[str] = None,
+    since: Optional[str] = None,
+    statuses: Sequence[str] = VIOLATION_STATUSES,
+    top_n: int = 5,
+) -> List[Dict[str, Any]]:
+    where, params = _where(repo, since)
+    placeholders = ", ".join("?" for _ in statuses)
+    where += (" AND " if where else " WHERE ") + f"release_status IN ({placeholders})"
+    rows = conn.execute(f"""
+        SELECT policy_id, SUM(trigger_count) AS n
+        FROM policy_daily_rollups{where}
+        GROUP BY policy_id ORDER BY n DESC, policy_id LIMIT ?
+    """, [*params, *statuses, top_n])
+    return [{"policy": r[0], "count": r[1]} for r in rows]
+
+
+def rollup_repos(conn) -> List[str]:
+    rows = conn.execute("""
+        SELECT repo FROM run_daily_rollups UNION SELECT repo FROM decision_daily_rollups ORDER BY repo
+    """)
+    return [r[0] for r in rows]
@@ -0,0 +1,57 @@
+def ensure_run_files_schema(conn):
+    """
+    One row per (run, file), so per-file history is a GROUP BY over an index
+    instead of JSON-decoding files_json for every pr_runs row.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS pr_run_files (
+            run_id INTEGER NOT NULL, -- pr_runs.run_id
+            repo TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            churn REAL NOT NULL DEFAULT 0, -- The run's churn split evenly across its distinct files
+            created_at TEXT, -- The run's created_at, ISO 8601 ('T' separator)
+            PRIMARY KEY (run_id, file_path)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_files_repo_path ON pr_run_files(repo, file_path)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_run_files_repo_created ON pr_run_files(repo, created_at)")
+
+
+# File list of a run: files_json, else the "files" list save_run keeps in
+# features_json. Lists and {path: ...} objects are accepted; anything else
+# yields no files. A path listed twice counts once.
+_FILES = "COALESCE(files_json, json_extract(features_json, '$.files'))"
+_SAFE_FILES = f"""
+    CASE WHEN json_valid({_FILES}) THEN
+        CASE WHEN json_type({_FILES}) IN ('array', 'object') THEN {_FILES} ELSE '[]' END
+    ELSE '[]' END
+"""
+# File paths of a run's list (object keys, or the list's strings)
+_PATH = "CASE WHEN json_type(r.files) = 'object' THEN f.key ELSE f.value END"
+_IS_PATH = "(f.type = 'text' OR json_type(r.files) = 'object')"
+
+
+def index_run_files(conn, after_run_id: int = 0) -> int:
+    """
+    Add pr_run_files rows for runs with run_id > after_run_id. Runs inside the
+    caller's transaction; returns the number of rows added.
+    """
+    cursor = conn.execute(f"""
+        INSERT OR IGNORE INTO pr_run_files (run_id, repo, file_path, churn, created_at)
+        SELECT
+            r.run_id,
+            r.repo,
+            {_PATH},
+            COALESCE(r.churn, 0) * 1.0 / (SELECT COUNT(DISTINCT {_PATH}) FROM json_each(r.files) AS f WHERE {_IS_PATH}),
+            replace(r.created_at, ' ', 'T')
+        FROM (SELECT run_id, repo, churn, created_at, {_SAFE_FILES} AS files FROM pr_runs WHERE run_id > ?) AS r,
+             json_each(r.files) AS f
+        WHERE {_IS_PATH}
+    """, (after_run_id,))
+    return cursor.rowcount
+
+
+def backfill(conn) -> int:
+    """Index every existing run (one-time, from the schema migration)."""
+    ensure_run_files_schema(conn)
+    return index_run_files(conn)
@@ -1,16 +1,66 @@
-import sqlite3
-import os
-from releasegate.config import DB_PATH
+import sys
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable # fn(conn); runs inside the migration transaction
 
-# Production Schema Version
-# Increment this if you change columns to force re-ingestion compatibility checks
-SCHEMA_VERSION = "v1"
 
 def init_db():
     """
-    Initialize the SQLite database with the production-grade schema.
+    Bring the database up to SCHEMA_VERSION.
+    Pending migrations run once per database file per process (through the
+    writer); later calls are an in-memory check. The path is config.DB_PATH
+    as of the call.
+    """
+    from releasegate.storage.database import Database
+    Database.for_path().ensure("schema", migrate)
+
+
+def schema_version(conn) -> int:
+    """Highest migration applied to this database (0 if none)."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_migrations'"
+    ).fetchone()
+    if not exists:
+        return 0
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations").fetchone()[0]
+
+
+def migrate(conn) -> int:
     """
-    conn = sqlite3.connect(DB_PATH)
+    Apply pending migrations in order, recording each in schema_migrations.
+    A write job: the whole run is one transaction (BEGIN IMMEDIATE), so
+    concurrent processes apply each migration exactly once.
+    """
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TEXT NOT NULL
+    )
+    """)
+    current = schema_version(conn)
+    if current > SCHEMA_VERSION:
+        print(f"WARN: Database schema version {current} is newer than this release ({SCHEMA_VERSION})", file=sys.stderr)
+        return current
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+        migration.apply(conn)
+        conn.execute(
+            "INSERT INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)",
+            (migration.version, migration.name, datetime.now(timezone.utc).isoformat())
+        )
+    return SCHEMA_VERSION
+
+
+# Migrations use IF NOT EXISTS so databases created before versioning adopt it in place
+def create_schema(conn):
+    """Migration 1: the original tables, indexes and audit immutability triggers."""
     cursor = conn.cursor()
     
     # 1. PR Runs Table (The centralized feature store)
@@ -202,5 +252,49 @@ def init_db():
     END;
     """)
 
-    conn.commit()
-    conn.close()
+
+def _audit_keyset_indexes(conn):
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_created_at ON audit_decisions(created_at)")
+    # Keyset pagination on (created_at, decision_id), optionally per repo
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_created_id ON audit_decisions(created_at, decision_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_repo_created_id ON audit_decisions(repo, created_at, decision_id)")
+
+
+def _audit_merkle(conn):
+    from releasegate.audit.merkle import ensure_merkle_schema
+    ensure_merkle_schema(conn)
+
+
+def _audit_compression(conn):
+    from releasegate.audit.compression import ensure_compression_schema
+    ensure_compression_schema(conn)
+
+
+def _daily_rollups(conn):
+    # Backfill so existing history is counted from the start
+    from releasegate.storage.rollups import backfill
+    backfill(conn)
+
+
+def _run_files(conn):
+    from releasegate.storage.run_files import backfill
+    backfill(conn)
+
+
+def _provider_cache_expiry(conn):
+    from releasegate.storage.provider_cache import upgrade_cache_tables
+    upgrade_cache_tables(conn)
+
+
+MIGRATIONS = [
+    Migration(1, "core_tables", create_schema),
+    Migration(2, "audit_keyset_indexes", _audit_keyset_indexes),
+    Migration(3, "audit_merkle_tree", _audit_merkle),
+    Migration(4, "audit_compression_dicts", _audit_compression),
+    Migration(5, "daily_rollups", _daily_rollups),
+    Migration(6, "pr_run_files", _run_files),
+    Migration(7, "provider_cache_expiry", _provider_cache_expiry),
+]
+
+# Production Schema Version: the latest migration. Add a Migration to change the schema.
+SCHEMA_VERSION = MIGRATIONS[-1].version
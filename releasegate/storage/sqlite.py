@@ -1,8 +1,15 @@
-import sqlite3
 import json
 import os
-from releasegate.config import DB_PATH, JSONL_PATH
+import sys
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from releasegate import config
+from releasegate.config import JSONL_PATH
 from releasegate.storage.schema import init_db
+from releasegate.storage.rollups import record_run, record_runs_after, today
+from releasegate.storage.database import get_database
+from releasegate.storage.jsonl import JsonlWriter
+from releasegate.storage.run_files import index_run_files
 
 def save_run(repo, pr_number, base_sha, head_sha, score_data, features):
     init_db()
@@ -14,22 +21,24 @@ def save_run(repo, pr_number, base_sha, head_sha, score_data, features):
     
     # 2. Writes to SQLite
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
         # Metadata from Environment
         github_run_id = os.getenv("GITHUB_RUN_ID")
         github_run_attempt = os.getenv("GITHUB_RUN_ATTEMPT")
         
-        cursor.execute("""
-        INSERT OR IGNORE INTO pr_runs 
-        (repo, pr_number, base_sha, head_sha, risk_score, risk_level, reasons_json, features_json, github_run_id, github_run_attempt, schema_version)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 2)
-        """, (repo, pr_number, base_sha, head_sha, risk_score, risk_level, reasons_json, features_json, github_run_id, github_run_attempt))
+        def insert_run(conn):
+            cursor = conn.execute("""
+            INSERT OR IGNORE INTO pr_runs 
+            (repo, pr_number, base_sha, head_sha, risk_score, risk_level, reasons_json, features_json, github_run_id, github_run_attempt, schema_version)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 2)
+            """, (repo, pr_number, base_sha, head_sha, risk_score, risk_level, reasons_json, features_json, github_run_id, github_run_attempt))
+            
+            # Only count runs that were actually inserted (not ignored duplicates)
+            if cursor.rowcount == 1:
+                record_run(conn, repo, today(), risk_level, risk_score)
+                index_run_files(conn, after_run_id=cursor.lastrowid - 1)
         
-        conn.commit()
-        conn.close()
-        print(f"Saved run to DB: {DB_PATH}")
+        get_database().write(insert_run)
+        print(f"Saved run to DB: {config.DB_PATH}")
     except Exception as e:
         print(f"Error saving to SQLite: {e}")
 
@@ -48,26 +57,113 @@ def save_run(repo, pr_number, base_sha, head_sha, score_data, features):
             "attempt": os.getenv("GITHUB_RUN_ATTEMPT")
         }
         
-        with open(JSONL_PATH, "a") as f:
-            f.write(json.dumps(run_data) + "\n")
-            f.flush()
-            os.fsync(f.fileno())
+        # Group-committed with concurrent runs: one write + fsync per batch
+        JsonlWriter.for_path(JSONL_PATH).append(run_data)
         
         print(f"Appended run to JSONL: {JSONL_PATH}")
     except Exception as e:
         print(f"Error saving to JSONL: {e}")
 
+# Rows per executemany / transaction in save_runs_bulk
+BULK_CHUNK_SIZE = 5000
+
+_BULK_INSERT = """
+INSERT OR IGNORE INTO pr_runs
+(repo, pr_number, base_sha, head_sha, risk_score, risk_level, reasons_json, features_json, created_at, schema_version)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), 2)
+"""
+
+
+def _bulk_row(run: Dict[str, Any]) -> Tuple:
+    return (
+        run["repo"], run["pr_number"], run.get("base_sha"), run.get("head_sha"),
+        run.get("risk_score", 0), run.get("risk_level", "UNKNOWN"),
+        json.dumps(run.get("reasons", [])), json.dumps(run.get("features", {})),
+        run.get("created_at"),
+    )
+
+
+def _insert_chunk(rows: List[Tuple]) -> Callable:
+    def job(conn) -> int:
+        last_id = conn.execute("SELECT COALESCE(MAX(run_id), 0) FROM pr_runs").fetchone()[0]
+        inserted = conn.executemany(_BULK_INSERT, rows).rowcount
+        # Count only rows actually inserted (run_id is AUTOINCREMENT, so they are the new ids)
+        record_runs_after(conn, last_id)
+        index_run_files(conn, after_run_id=last_id)
+        return inserted
+    return job
+
+
+def _drop_indexes(conn) -> List[str]:
+    """Drop secondary pr_runs indexes; returns their DDL for recreation."""
+    rows = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'pr_runs' AND sql IS NOT NULL"
+    ).fetchall()
+    for name, _ in rows:
+        conn.execute(f'DROP INDEX "{name}"')
+    return [sql for _, sql in rows]
+
+
+def _create_indexes(index_sql: List[str]) -> Callable:
+    """Write job recreating the indexes _drop_indexes dropped."""
+    def job(conn):
+        for sql in index_sql:
+            conn.execute(sql)
+    return job
+
+
+def save_runs_bulk(
+    runs: Iterable[Dict[str, Any]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+    defer_indexes: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Insert many runs (e.g. seeding or backfilling history) in large transactions.
+
+    Each run is a dict with repo, pr_number and optionally base_sha, head_sha,
+    risk_score, risk_level, reasons, features and created_at (default: now).
+    `runs` is consumed lazily, `chunk_size` rows per executemany and
+    transaction; duplicates of existing (repo, pr_number, head_sha) are
+    skipped; daily rollups and pr_run_files are updated per chunk. With `defer_indexes`,
+    secondary pr_runs indexes are dropped for the load and rebuilt once at the
+    end (for initial loads). `progress(processed, inserted)` is called after
+    every chunk. Returns the number of runs inserted. The JSONL run log is not
+    written.
+    """
+    init_db()
+    db = get_database()
+    index_sql = db.write(_drop_indexes) if defer_indexes else []
+    processed = inserted = 0
+    try:
+        rows = map(_bulk_row, runs)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            inserted += db.write(_insert_chunk(chunk))
+            processed += len(chunk)
+            if progress:
+                progress(processed, inserted)
+    except BaseException:
+        # Restore the indexes, but keep the load's error as the one raised
+        if index_sql:
+            try:
+                db.write(_create_indexes(index_sql))
+            except Exception as e:
+                print(f"WARN: pr_runs indexes were not recreated after a failed bulk load ({e}); "
+                      f"run: {'; '.join(index_sql)}", file=sys.stderr)
+        raise
+    if index_sql:
+        db.write(_create_indexes(index_sql))
+    return inserted
+
+
 def add_label(repo: str, pr_number: int, label_type: str, severity: int = None):
     """Add a label to a PR."""
     init_db()
     
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
+    get_database().execute("""
     INSERT INTO pr_labels (repo, pr_number, label_type, severity)
     VALUES (?, ?, ?, ?)
     """, (repo, pr_number, label_type, severity))
-    
-    conn.commit()
-    conn.close()
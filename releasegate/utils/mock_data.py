@@ -1,9 +1,10 @@
-import sqlite3
 import json
 import random
 import uuid
 from datetime import datetime, timedelta
-from releasegate.config import DB_PATH
+from releasegate import config
+from releasegate.storage.database import get_database
+from releasegate.storage.sqlite import save_runs_bulk
 import os
 
 def generate_mock_data(n=60):
@@ -14,47 +15,17 @@ def generate_mock_data(n=60):
     print(f"Generating {n} mock PR runs...")
     
     # Ensure DB exists
-    if not os.path.exists(DB_PATH):
+    if not os.path.exists(config.DB_PATH):
         # Fallback if config path isn't absolute or initialized
-        print(f"Warning: DB at {DB_PATH} not found. Creating new...")
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    # Create tables if they don't exist (just in case this runs before app)
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS pr_runs (
-        repo TEXT,
-        pr_number INTEGER,
-        base_sha TEXT,
-        head_sha TEXT,
-        risk_score INTEGER,
-        risk_level TEXT,
-        features_json TEXT,
-        created_at TEXT,
-        PRIMARY KEY (repo, pr_number)
-    )
-    """)
-    
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS pr_labels (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        repo TEXT,
-        pr_number INTEGER,
-        label_type TEXT,
-        severity INTEGER,
-        created_at TEXT
-    )
-    """)
+        print(f"Warning: DB at {config.DB_PATH} not found. Creating new...")
     
     # Repos to simulate
     repos = ["myorg/payment-service", "myorg/auth-service", "myorg/frontend-monorepo"]
+    runs, labels = [], []
     
     for i in range(n):
         repo = random.choice(repos)
         pr_number = 1000 + i
-        base_sha = f"base{i}"
-        head_sha = f"head{i}"
         
         # Simulate features
         # We want some correlation so the model actually "learns"
@@ -80,23 +51,17 @@ def generate_mock_data(n=60):
             "tests": has_tests
         }
         
-        # Insert Run
-        cursor.execute("""
-        INSERT OR IGNORE INTO pr_runs 
-        (repo, pr_number, base_sha, head_sha, risk_score, risk_level, features_json, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            repo, 
-            pr_number, 
-            base_sha, 
-            head_sha, 
-            80 if is_risky else 10, 
-            "HIGH" if is_risky else "LOW",
-            json.dumps(features),
-            (datetime.now() - timedelta(days=random.randint(0, 30))).isoformat()
-        ))
+        runs.append({
+            "repo": repo,
+            "pr_number": pr_number,
+            "base_sha": f"base{i}",
+            "head_sha": f"head{i}",
+            "risk_score": 80 if is_risky else 10,
+            "risk_level": "HIGH" if is_risky else "LOW",
+            "features": features,
+            "created_at": (datetime.now() - timedelta(days=random.randint(0, 30))).isoformat()
+        })
         
-        # Insert Label
         # Label types: safe, hotfix, incident, rollback
         if is_risky:
             label_type = "incident" if random.random() < 0.7 else "rollback"
@@ -104,15 +69,15 @@ def generate_mock_data(n=60):
         else:
             label_type = "safe"
             severity = 0
-        
-        cursor.execute("""
-        INSERT OR IGNORE INTO pr_labels (repo, pr_number, label_type, severity, created_at)
-        VALUES (?, ?, ?, ?, ?)
-        """, (repo, pr_number, label_type, severity, datetime.now().isoformat()))
+        labels.append((repo, pr_number, label_type, severity, datetime.now().isoformat()))
     
-    conn.commit()
-    conn.close()
-    print(f"Successfully added {n} mock records to {DB_PATH}")
+    # Bulk insert: one executemany per chunk instead of a statement per row
+    save_runs_bulk(runs)
+    get_database().executemany("""
+    INSERT OR IGNORE INTO pr_labels (repo, pr_number, label_type, severity, created_at)
+    VALUES (?, ?, ?, ?, ?)
+    """, labels)
+    print(f"Successfully added {n} mock records to {config.DB_PATH}")
 
 if __name__ == "__main__":
     generate_mock_data()
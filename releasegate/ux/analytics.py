@@ -1,11 +1,18 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 from collections import defaultdict
 from releasegate.ux.types import DecisionRecord
+from releasegate.storage import rollups
+
+# Audit release_status -> DecisionRecord.decision buckets
+STATUS_BUCKETS = {"BLOCKED": "block", "CONDITIONAL": "warn", "ALLOWED": "pass"}
 
 class ComplianceAnalytics:
     """
     Aggregates historical DecisionRecords into trusted metrics.
+
+    The *_from_rollups methods read the daily rollup tables instead of a list
+    of records, so their cost depends on the number of days, not decisions.
     """
     
     def aggregate_daily_stats(self, records: List[DecisionRecord]) -> Dict[str, Dict]:
@@ -52,3 +59,31 @@ class ComplianceAnalytics:
         sorted_policies = sorted(policy_counts.items(), key=lambda x: x[1], reverse=True)
         return [{"policy": k, "count": v} for k,v in sorted_policies[:top_n]]
 
+    def daily_stats_from_rollups(self, conn=None, repo: Optional[str] = None, since: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Same shape as aggregate_daily_stats. Counts come from recorded audit
+        decisions; risk_avg from the PR runs analyzed that day.
+        """
+        conn = conn or self._connection()
+        decisions = rollups.daily_decision_stats(conn, repo=repo, since=since)
+        runs = {r["day"]: r for r in rollups.daily_run_stats(conn, repo=repo, since=since)}
+
+        results = {}
+        for date in set(decisions) | set(runs):
+            stats = {"total": 0, "block": 0, "warn": 0, "pass": 0}
+            for status, count in decisions.get(date, {}).items():
+                stats["total"] += count
+                stats[STATUS_BUCKETS.get(status, "pass")] += count
+            run = runs.get(date)
+            stats["risk_avg"] = round(run["risk_sum"] / run["runs"], 2) if run and run["runs"] else 0
+            results[date] = stats
+        return results
+
+    def get_top_violations_from_rollups(self, conn=None, repo: Optional[str] = None, since: Optional[str] = None, top_n: int = 5) -> List[Dict]:
+        conn = conn or self._connection()
+        return rollups.top_policies(conn, repo=repo, since=since, top_n=top_n)
+
+    @staticmethod
+    def _connection():
+        from releasegate.audit.db import get_connection
+        return get_connection()
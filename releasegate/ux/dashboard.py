@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 from releasegate.ux.analytics import ComplianceAnalytics
 from releasegate.ux.types import DecisionRecord
 import json
@@ -14,11 +14,23 @@ class DashboardGenerator:
         daily_stats = self.analytics.aggregate_daily_stats(records)
         top_violations = self.analytics.get_top_violations(records)
         
+        total_deploys = len(records)
+        blocks = sum(1 for r in records if r.decision == "BLOCK")
+        return self._render(title, total_deploys, blocks, daily_stats, top_violations)
+    
+    def generate_markdown_from_rollups(self, conn=None, repo: Optional[str] = None, since: Optional[str] = None, title: str = "Compliance Posture") -> str:
+        """Same report, read from the daily rollup tables instead of records."""
+        daily_stats = self.analytics.daily_stats_from_rollups(conn, repo=repo, since=since)
+        top_violations = self.analytics.get_top_violations_from_rollups(conn, repo=repo, since=since)
+        
+        total_deploys = sum(s["total"] for s in daily_stats.values())
+        blocks = sum(s["block"] for s in daily_stats.values())
+        return self._render(title, total_deploys, blocks, daily_stats, top_violations)
+    
+    def _render(self, title: str, total_deploys: int, blocks: int, daily_stats: Dict[str, Dict], top_violations: List[Dict]) -> str:
         lines = [f"# {title}", ""]
         
         # 1. Executive Summary
-        total_deploys = len(records)
-        blocks = sum(1 for r in records if r.decision == "BLOCK")
         block_rate = (blocks / total_deploys * 100) if total_deploys else 0
         
         lines.append("## Executive Summary")
@@ -47,4 +59,3 @@ class DashboardGenerator:
             lines.append(f"| `{v['policy']}` | {v['count']} |")
         
         return "\n".join(lines)
-
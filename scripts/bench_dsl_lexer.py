@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark the policy DSL lexer on a large generated policy pack.
+
+Compares the master-regex DSLTokenizer against the previous approach
+(compile and try every token pattern at every position), checks both
+produce the same token stream, and times lexing + parsing every policy in the pack.
+
+Usage: python scripts/bench_dsl_lexer.py [--copies N] [--repeat N]
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+# Add project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from releasegate.policy.dsl.lexer import DSLTokenizer, Token
+from releasegate.policy.dsl.parser import DSLParser
+
+DSL_ROOT = os.path.join("releasegate", "policy", "dsl", "standards")
+
+
+def legacy_tokenize(text):
+    """The pre-master-regex lexer loop, kept here for comparison only."""
+    tokens = []
+    line, line_start, pos = 1, 0, 0
+    while pos < len(text):
+        match = None
+        for token_type, pattern in DSLTokenizer.TOKEN_TYPES:
+            match = re.compile(pattern).match(text, pos)
+            if match:
+                value = match.group(0)
+                if token_type == 'NEWLINE':
+                    line += 1
+                    line_start = pos + 1
+                elif token_type not in ('SKIP', 'COMMENT'):
+                    if token_type == 'STRING':
+                        value = value[1:-1]
+                    tokens.append(Token(token_type, value, line, match.start() - line_start + 1))
+                pos = match.end()
+                break
+        if not match:
+            raise ValueError(f"Illegal character '{text[pos]}' at line {line}, column {pos - line_start + 1}")
+    tokens.append(Token('EOF', '', line, 0))
+    return tokens
+
+
+def build_pack(copies):
+    """The standard packs repeated `copies` times, renaming policies to stay unique."""
+    sources = []
+    for path in sorted(glob.glob(os.path.join(DSL_ROOT, "**", "*.dsl"), recursive=True)):
+        with open(path, "r") as f:
+            sources.append(f.read())
+    if not sources:
+        print(f"No DSL files found under {DSL_ROOT}", file=sys.stderr)
+        sys.exit(1)
+    chunks = []
+    for i in range(copies):
+        for src in sources:
+            chunks.append(re.sub(r"^policy (\w+)", rf"policy \1_{i}", src, flags=re.M))
+    return chunks
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the policy DSL lexer")
+    parser.add_argument("--copies", type=int, default=50, help="Copies of the standard packs to lex")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    policies = build_pack(args.copies)
+    text = "\n".join(policies)
+    new_tokens = DSLTokenizer(text).tokenize()
+    if legacy_tokenize(text) != new_tokens:
+        print("❌ Token streams differ", file=sys.stderr)
+        sys.exit(1)
+
+    legacy_s = best_of(lambda: legacy_tokenize(text), args.repeat)
+    master_s = best_of(lambda: DSLTokenizer(text).tokenize(), args.repeat)
+    parse_s = best_of(lambda: [DSLParser(DSLTokenizer(src).tokenize()).parse() for src in policies], args.repeat)
+
+    print(f"Pack: {len(policies)} policies, {len(text) / 1024:.0f} KiB, {len(new_tokens)} tokens")
+    print(f"  legacy lexer : {legacy_s * 1000:9.1f} ms")
+    print(f"  master regex : {master_s * 1000:9.1f} ms  ({legacy_s / master_s:.1f}x faster)")
+    print(f"  lex + parse  : {parse_s * 1000:9.1f} ms")
+    print("✅ Token streams identical")
+
+
+if __name__ == "__main__":
+    main()
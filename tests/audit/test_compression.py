@@ -0,0 +1,75 @@
+import json
+import os
+import sqlite3
+import pytest
+from datetime import datetime, timezone
+from releasegate.audit.compression import (
+    MAGIC, compress, decode_payload, ensure_compression_schema, store_dictionary, train_dictionary,
+    train_from_decisions,
+)
+from releasegate.audit.db import close_connection, get_connection
+from releasegate.audit.reader import AuditReader
+from releasegate.audit.recorder import AuditRecorder
+from releasegate.audit.verify import verify_decisions
+from releasegate.config import DB_PATH
+from releasegate.decision.types import Decision, EnforcementTargets
+from releasegate.storage.schema import init_db
+
+def _payload(i):
+    return json.dumps({
+        "decision_id": f"id-{i}", "message": "Blocked by policy SEC-PR-001: missing approvals",
+        "matched_policies": ["SEC-PR-001", "SEC-PR-002"], "release_status": "BLOCKED",
+        "enforcement_targets": {"repository": "org/service", "ref": "HEAD", "pr_number": i},
+    }, sort_keys=True, ensure_ascii=False)
+
+def test_dictionary_roundtrip_and_gain():
+    conn = sqlite3.connect(":memory:")
+    ensure_compression_schema(conn)
+    samples = [_payload(i) for i in range(50)]
+    dictionary = train_dictionary(samples)
+    assert 0 < len(dictionary) <= 32 * 1024
+    dict_id = store_dictionary(conn, dictionary, len(samples))
+
+    text = _payload(999)
+    with_dict = compress(text, dict_id, dictionary)
+    assert with_dict.startswith(MAGIC)
+    assert len(with_dict) < len(compress(text, 0, b""))
+    assert decode_payload(conn, with_dict) == text
+    assert decode_payload(conn, text) == text
+
+    with pytest.raises(sqlite3.DatabaseError):
+        conn.execute("DELETE FROM audit_compression_dicts")
+
+def _record(i):
+    d = Decision(
+        timestamp=datetime.now(timezone.utc), release_status="ALLOWED", context_id=f"c{i}", message="OK",
+        policy_bundle_hash="hash1", enforcement_targets=EnforcementTargets(repository="repo1", ref="HEAD"),
+        evaluation_key=f"key{i}",
+    )
+    return AuditRecorder.record_with_context(d, repo="repo1", pr_number=i)
+
+def test_compressed_storage_is_transparent(monkeypatch):
+    close_connection()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    init_db()
+    plain = [_record(i) for i in range(3)]
+    assert train_from_decisions(get_connection())["dict_id"] == 1
+
+    monkeypatch.setenv("RELEASEGATE_AUDIT_COMPRESS", "1")
+    compressed = _record(3)
+    stored = get_connection().execute(
+        "SELECT full_decision_json FROM audit_decisions WHERE decision_id = ?", (compressed.decision_id,)
+    ).fetchone()[0]
+    assert isinstance(stored, bytes) and stored.startswith(MAGIC)
+
+    row = AuditReader.get_decision(compressed.decision_id)
+    assert json.loads(row["full_decision_json"])["decision_id"] == compressed.decision_id
+    # Idempotent re-record returns the stored (decompressed) decision
+    assert _record(3).decision_id == compressed.decision_id
+    assert _record(0).decision_id == plain[0].decision_id
+
+    result = verify_decisions()
+    assert result.ok and result.checked == 4
+    close_connection()
+    os.remove(DB_PATH)
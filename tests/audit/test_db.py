@@ -0,0 +1,40 @@
+import os
+import threading
+from releasegate.audit.db import get_connection, close_connection
+from releasegate.config import DB_PATH
+from releasegate.storage.database import write
+
+def _fresh_db():
+    close_connection()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+
+def test_connection_reused_per_thread_and_tuned():
+    _fresh_db()
+    conn = get_connection()
+    assert get_connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1 # NORMAL
+    conn.execute("SELECT 1 FROM audit_decisions LIMIT 1") # Schema exists
+
+    others = []
+    thread = threading.Thread(target=lambda: others.append(get_connection()))
+    thread.start()
+    thread.join()
+    assert others[0] is not conn
+    _fresh_db()
+
+def test_reopens_when_db_file_replaced():
+    _fresh_db()
+    conn = get_connection()
+    write(lambda wconn: wconn.execute(
+        "INSERT INTO audit_decisions (decision_id, context_id, repo, release_status, policy_bundle_hash, engine_version, "
+        "decision_hash, full_decision_json, created_at) VALUES ('a', 'c', 'r', 'ALLOWED', 'b', 'e', 'h', '{}', 't')"
+    ))
+    assert conn.execute("SELECT COUNT(*) FROM audit_decisions").fetchone()[0] == 1
+
+    os.remove(DB_PATH)
+    fresh = get_connection()
+    assert fresh is not conn
+    assert fresh.execute("SELECT COUNT(*) FROM audit_decisions").fetchone()[0] == 0
+    _fresh_db()
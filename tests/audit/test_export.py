@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+import os
+import pytest
+from datetime import datetime, timezone, timedelta
+from releasegate.audit.db import close_connection
+from releasegate.audit.export import export_decisions
+from releasegate.audit.reader import AuditReader, SUMMARY_COLUMNS
+from releasegate.audit.recorder import AuditRecorder
+from releasegate.config import DB_PATH
+from releasegate.decision.types import Decision, EnforcementTargets
+from releasegate.storage.schema import init_db
+
+@pytest.fixture
+def decision_ids():
+    close_connection()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    init_db()
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    ids = []
+    for i in range(7):
+        # Pairs share a timestamp so the decision_id tie-breaker matters
+        d = Decision(
+            timestamp=base + timedelta(minutes=i // 2), release_status="BLOCKED" if i % 3 == 0 else "ALLOWED",
+            context_id=f"c{i}", message="msg", policy_bundle_hash="h",
+            enforcement_targets=EnforcementTargets(repository="repo1", ref="HEAD"),
+        )
+        AuditRecorder.record_with_context(d, repo="repo1" if i < 6 else "repo2", pr_number=i)
+        ids.append(d.decision_id)
+    yield ids
+    close_connection()
+    os.remove(DB_PATH)
+
+def test_iter_decisions_keyset_pages(decision_ids):
+    rows = list(AuditReader.iter_decisions(page_size=2))
+    assert len(rows) == 7
+    keys = [(r["created_at"], r["decision_id"]) for r in rows]
+    assert keys == sorted(keys) and len(set(keys)) == 7
+    assert "full_decision_json" not in rows[0]
+
+    repo1 = list(AuditReader.iter_decisions(repo="repo1", status="BLOCKED", page_size=1))
+    assert {r["pr_number"] for r in repo1} == {0, 3}
+
+    projected = list(AuditReader.iter_decisions(columns=["pr_number"], page_size=3))
+    assert set(projected[0]) == {"pr_number"}
+    assert sorted(r["pr_number"] for r in projected) == list(range(7))
+
+    with pytest.raises(ValueError):
+        list(AuditReader.iter_decisions(columns=["pr_number; DROP TABLE audit_decisions"]))
+
+def test_list_decisions_before_cursor(decision_ids):
+    first = AuditReader.list_decisions(repo="repo1", limit=4, columns=["decision_id", "created_at"])
+    assert set(first[0]) == {"decision_id", "created_at"}
+    rest = AuditReader.list_decisions(repo="repo1", limit=4, before=(first[-1]["created_at"], first[-1]["decision_id"]))
+    assert len(rest) == 2
+    assert not {r["decision_id"] for r in first} & {r["decision_id"] for r in rest}
+
+def test_export_ndjson_and_csv(decision_ids):
+    out = io.StringIO()
+    assert export_decisions(out, fmt="ndjson", include_json=True, page_size=3) == 7
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert json.loads(lines[0]["full_decision_json"])["decision_id"] == lines[0]["decision_id"]
+
+    out = io.StringIO()
+    assert export_decisions(out, fmt="csv", repo="repo2") == 1
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert list(rows[0]) == SUMMARY_COLUMNS
+    assert rows[0]["decision_id"] == decision_ids[6]
@@ -0,0 +1,84 @@
+import json
+import threading
+import time
+import uuid
+import pytest
+from releasegate.audit.log import AuditLogger, AuditLogWriter, GENESIS_HASH, compute_event_hash
+from releasegate.audit.types import AuditEvent
+
+@pytest.fixture
+def audit_root(tmp_path, monkeypatch):
+    monkeypatch.setattr("releasegate.storage.paths.AUDIT_ROOT", str(tmp_path))
+    return tmp_path
+
+def _event(n):
+    return AuditEvent(
+        audit_id=str(uuid.uuid4()), timestamp="2026-01-01T00:00:00+00:00", actor="test",
+        repo="o/r", pr_number=n, head_sha=f"sha{n}", overall_status="PASS", risk_score=n,
+        bundle_manifest_hash="h", previous_event_hash=None,
+    )
+
+def _assert_chain(path, expected_len):
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == expected_len
+    prev = GENESIS_HASH
+    for line in lines:
+        assert line["previous_event_hash"] == prev
+        assert compute_event_hash(line) == line["event_hash"]
+        prev = line["event_hash"]
+    return lines
+
+def test_concurrent_appends_keep_chain_exact(audit_root):
+    logger = AuditLogger("o/r")
+    committer = logger.writer.committer
+    flush = committer._flush
+
+    # Hold the first write until every other thread has queued an append
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_flush(items):
+        if not started.is_set():
+            started.set()
+            release.wait(5)
+        return flush(items)
+
+    committer._flush = blocking_flush
+    threads = [
+        threading.Thread(target=lambda i=i: [logger.append_event(_event(i * 100 + j)) for j in range(50)])
+        for i in range(8)
+    ]
+    threads[0].start()
+    assert started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    deadline = time.monotonic() + 5
+    while len(committer._queue) < 7 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+
+    lines = _assert_chain(logger.log_path, 400)
+    assert logger._get_last_hash() == lines[-1]["event_hash"]
+    # Concurrent callers were grouped into fewer writes than events
+    assert committer.items == 400
+    assert committer.batches < committer.items
+
+def test_append_events_returns_hashes_in_order(audit_root):
+    logger = AuditLogger("o/r")
+    first = logger.append_event(_event(0))
+    events = [_event(i) for i in range(1, 4)]
+    hashes = logger.append_events(events)
+
+    assert events[0].previous_event_hash == first
+    assert [e.event_hash for e in events] == hashes
+    _assert_chain(logger.log_path, 4)
+
+def test_external_append_is_picked_up(audit_root):
+    logger = AuditLogger("o/r")
+    logger.append_event(_event(0))
+    # A different writer (as another process would) extends the chain
+    AuditLogWriter(logger.log_path).append([_event(1)])
+    logger.append_event(_event(2))
+    _assert_chain(logger.log_path, 3)
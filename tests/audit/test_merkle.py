@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import sqlite3
+import pytest
+from datetime import datetime, timezone
+from releasegate.audit import merkle
+from releasegate.audit.merkle import (
+    MerkleLog, ensure_merkle_schema, leaf_hash, node_hash, verify_inclusion, verify_consistency,
+    build_inclusion_proof, build_consistency_proof, verify_proof,
+)
+from releasegate.audit.recorder import AuditRecorder
+from releasegate.cli import main
+from releasegate.config import DB_PATH
+from releasegate.decision.types import Decision, EnforcementTargets
+from releasegate.storage.schema import init_db
+
+def _reference_root(leaves):
+    # MTH from RFC 6962, computed directly
+    if len(leaves) == 1:
+        return leaves[0]
+    k = 1
+    while k * 2 < len(leaves):
+        k *= 2
+    return node_hash(_reference_root(leaves[:k]), _reference_root(leaves[k:]))
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE audit_decisions (decision_id TEXT PRIMARY KEY, decision_hash TEXT)")
+    ensure_merkle_schema(conn)
+    yield conn
+    conn.close()
+
+def _insert(conn, start, count):
+    for n in range(start, start + count):
+        conn.execute("INSERT INTO audit_decisions VALUES (?, ?)", (f"d{n}", hashlib.sha256(str(n).encode()).hexdigest()))
+
+def test_roots_and_proofs_match_reference(conn):
+    _insert(conn, 0, 21)
+    log = MerkleLog(conn)
+    assert log.sync() == 21
+    leaves = [leaf_hash(hashlib.sha256(str(n).encode()).hexdigest()) for n in range(21)]
+
+    for size in range(1, 22):
+        root = log.root(size)
+        assert root == _reference_root(leaves[:size])
+        for index in range(size):
+            assert verify_inclusion(leaves[index], index, size, log.inclusion_proof(index, size), root)
+        for first in range(1, size + 1):
+            proof = log.consistency_proof(first, size)
+            assert verify_consistency(first, size, proof, log.root(first), root)
+
+def test_sync_is_incremental(conn):
+    _insert(conn, 0, 5)
+    MerkleLog(conn).sync()
+    _insert(conn, 5, 6)
+    log = MerkleLog(conn)
+    assert log.sync() == 11
+    assert log.sync() == 11
+    assert log.leaf("d7")[0] == 7
+
+def test_tampered_proofs_rejected(conn):
+    _insert(conn, 0, 13)
+    MerkleLog(conn).sync()
+    proof = build_inclusion_proof(conn, "d6")
+    assert verify_proof(proof)
+    assert not verify_proof(proof, trusted_root="00" * 32)
+
+    forged = dict(proof, decision_hash=hashlib.sha256(b"forged").hexdigest())
+    assert not verify_proof(forged)
+    assert not verify_proof(dict(proof, leaf_index=5))
+    assert not verify_proof(dict(proof, path=proof["path"][:-1]))
+
+    consistency = build_consistency_proof(conn, 5)
+    assert verify_proof(consistency)
+    assert not verify_proof(dict(consistency, first_root=proof["root_hash"]))
+
+def test_stored_roots_and_append_only(conn, monkeypatch):
+    monkeypatch.setattr(merkle, "ROOT_INTERVAL", 4)
+    _insert(conn, 0, 10)
+    log = MerkleLog(conn)
+    log.sync()
+    assert [r["tree_size"] for r in log.stored_roots()] == [4, 8]
+    assert log.stored_roots()[0]["root_hash"] == log.root(4)
+    with pytest.raises(sqlite3.DatabaseError):
+        conn.execute("UPDATE audit_merkle_leaves SET leaf_hash = 'x' WHERE leaf_index = 0")
+    with pytest.raises(sqlite3.DatabaseError):
+        conn.execute("DELETE FROM audit_merkle_nodes")
+
+def _cli(monkeypatch, *argv):
+    monkeypatch.setattr("sys.argv", ["releasegate", *argv])
+    return main()
+
+def test_recorder_extends_tree_and_cli_proof(tmp_path, capsys, monkeypatch):
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    init_db()
+    ids = []
+    for n in range(3):
+        decision = Decision(
+            timestamp=datetime.now(timezone.utc), release_status="ALLOWED", context_id=f"c{n}", message="OK",
+            policy_bundle_hash="hash1", enforcement_targets=EnforcementTargets(repository="repo1", ref="HEAD")
+        )
+        ids.append(AuditRecorder.record_with_context(decision, repo="repo1", pr_number=n).decision_id)
+
+    proof_file = str(tmp_path / "proof.json")
+    assert _cli(monkeypatch, "audit", "prove", "--decision-id", ids[1], "--output", proof_file) == 0
+    with open(proof_file) as f:
+        proof = json.load(f)
+    assert proof["leaf_index"] == 1 and proof["tree_size"] == 3
+    assert proof["valid"] and proof["decision_hash_matches_record"]
+
+    capsys.readouterr()
+    assert _cli(monkeypatch, "audit", "verify-proof", "--proof", proof_file, "--root", proof["root_hash"]) == 0
+    assert json.loads(capsys.readouterr().out)["valid"]
+    assert _cli(monkeypatch, "audit", "verify-proof", "--proof", proof_file, "--root", "00" * 32) == 1
+
+    assert _cli(monkeypatch, "audit", "consistency", "--first", "2") == 0
+
+    # Sizes past the end of the log are usage errors, not missing-node tracebacks
+    capsys.readouterr()
+    assert _cli(monkeypatch, "audit", "prove", "--decision-id", ids[1], "--tree-size", "9") == 1
+    assert _cli(monkeypatch, "audit", "prove", "--decision-id", ids[2], "--tree-size", "2") == 1
+    assert _cli(monkeypatch, "audit", "consistency", "--first", "2", "--second", "9") == 1
+    assert _cli(monkeypatch, "audit", "consistency", "--first", "4") == 1
+    assert capsys.readouterr().err.count("Error:") == 4
+    os.remove(DB_PATH)
@@ -0,0 +1,39 @@
+import json
+import os
+from releasegate.audit.traceability import CompiledPolicyIndex, TraceabilityInjector
+from releasegate.engine import PolicyResult
+
+def _write(path, policy_id, version="1.0.0"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "policy_id": policy_id,
+            "metadata": {"parent_policy": policy_id.split(".")[0], "version": version, "compliance": {"SOC2": "CC6.1"}},
+        }, f, indent=2)
+
+def _result(policy_id):
+    return PolicyResult(policy_id=policy_id, name=policy_id, status="BLOCK", triggered=True, violations=["x"], evidence={})
+
+def test_injector_resolves_nested_policies(tmp_path):
+    _write(tmp_path / "standards" / "soc2" / "SOC2-CC6.R1.yaml", "SOC2-CC6.R1")
+    injector = TraceabilityInjector(str(tmp_path))
+
+    finding = injector.inject(_result("SOC2-CC6.R1"))
+    assert finding.parent_policy == "SOC2-CC6"
+    assert finding.rule_id == "R1"
+    assert finding.compliance == {"SOC2": "CC6.1"}
+
+    unknown = injector.inject(_result("MISSING.R9"))
+    assert unknown.parent_policy == "UNKNOWN"
+    assert unknown.policy_version == "0.0.0"
+
+def test_index_is_shared_until_directory_changes(tmp_path):
+    _write(tmp_path / "A.R1.yaml", "A.R1")
+    first = TraceabilityInjector(str(tmp_path)).index
+    assert TraceabilityInjector(str(tmp_path)).index is first
+
+    _write(tmp_path / "sub" / "A.R2.yaml", "A.R2", version="2.0.0")
+    index = CompiledPolicyIndex.shared(str(tmp_path))
+    assert index is not first
+    assert index.get("A.R2").data["metadata"]["version"] == "2.0.0"
+    assert index.get("A.R2").path.endswith(os.path.join("sub", "A.R2.yaml"))
@@ -0,0 +1,100 @@
+import json
+import os
+import uuid
+import pytest
+from datetime import datetime, timezone
+from releasegate.audit.log import AuditLogger
+from releasegate.audit.types import AuditEvent
+from releasegate.audit.verify import verify_log, verify_decisions, checkpoint_path
+from releasegate.audit.recorder import AuditRecorder
+from releasegate.decision.types import Decision, EnforcementTargets
+from releasegate.config import DB_PATH
+from releasegate.storage.schema import init_db
+
+KEY = b"test-checkpoint-key"
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    monkeypatch.setattr("releasegate.storage.paths.AUDIT_ROOT", str(tmp_path))
+    monkeypatch.delenv("RELEASEGATE_AUDIT_CHECKPOINT_KEY", raising=False)
+    logger = AuditLogger("o/r")
+    logger.append_events([
+        AuditEvent(
+            audit_id=str(uuid.uuid4()), timestamp="2026-01-01T00:00:00+00:00", actor="test",
+            repo="o/r", pr_number=n, head_sha=f"sha{n}", overall_status="PASS", risk_score=n,
+            bundle_manifest_hash="h", previous_event_hash=None,
+        ) for n in range(40)
+    ])
+    return logger.log_path
+
+def _offsets(path):
+    offsets, pos = [], 0
+    with open(path, "rb") as f:
+        for line in f:
+            offsets.append(pos)
+            pos += len(line)
+    return offsets
+
+def test_parallel_chunks_verify_clean_log(log_path):
+    result = verify_log(log_path, workers=2, chunk_bytes=2048)
+    assert result.ok
+    assert result.entries_verified == result.total_entries == 40
+    assert not result.checkpoint_written # No key configured
+
+def test_reports_first_broken_link_with_offset(log_path):
+    with open(log_path) as f:
+        lines = f.readlines()
+    entry = json.loads(lines[25])
+    entry["risk_score"] = 999
+    lines[25] = json.dumps(entry) + "\n"
+    with open(log_path, "w") as f:
+        f.writelines(lines)
+
+    for workers in (1, 3):
+        result = verify_log(log_path, workers=workers, chunk_bytes=1024)
+        assert not result.ok
+        assert result.broken_entry == 25
+        assert result.broken_at_offset == _offsets(log_path)[25]
+
+def test_dropped_entry_breaks_linkage(log_path):
+    with open(log_path) as f:
+        lines = f.readlines()
+    del lines[10]
+    with open(log_path, "w") as f:
+        f.writelines(lines)
+
+    result = verify_log(log_path, workers=1)
+    assert not result.ok and result.broken_entry == 10
+    assert "link" in result.error
+
+def test_signed_checkpoint_resume(log_path):
+    first = verify_log(log_path, key=KEY)
+    assert first.ok and first.checkpoint_written
+
+    AuditLogger("o/r").append_event(AuditEvent(
+        audit_id="last", timestamp="2026-01-02T00:00:00+00:00", actor="test", repo="o/r", pr_number=99,
+        head_sha="sha", overall_status="PASS", risk_score=1, bundle_manifest_hash="h", previous_event_hash=None,
+    ))
+    second = verify_log(log_path, key=KEY)
+    assert second.ok and second.resumed_from_checkpoint
+    assert second.entries_verified == 1
+    assert second.total_entries == 41
+
+    # A checkpoint signed with another key is not trusted
+    third = verify_log(log_path, key=b"other")
+    assert third.ok and not third.resumed_from_checkpoint
+    assert third.entries_verified == 41
+    assert os.path.exists(checkpoint_path(log_path))
+
+def test_verify_decisions():
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    init_db()
+    decision = Decision(
+        timestamp=datetime.now(timezone.utc), release_status="ALLOWED", context_id="c1", message="OK",
+        policy_bundle_hash="hash1", enforcement_targets=EnforcementTargets(repository="repo1", ref="HEAD")
+    )
+    AuditRecorder.record_with_context(decision, repo="repo1", pr_number=1)
+    result = verify_decisions()
+    assert result.ok and result.checked == 1
+    os.remove(DB_PATH)
@@ -0,0 +1,66 @@
+import json
+import os
+from releasegate.policy.builder import PolicyBuilder
+
+POLICY = """
+policy {pid} {{
+    version: "1.0.0"
+    name: "{pid}"
+    rules {{
+{rules}
+    }}
+}}
+"""
+
+RULE = """        when secrets.detected == true {{
+            enforce {result}
+        }}
+"""
+
+def _write(src, name, pid, results):
+    rules = "".join(RULE.format(result=r) for r in results)
+    with open(os.path.join(src, name), "w") as f:
+        f.write(POLICY.format(pid=pid, rules=rules))
+
+def _build(src, out, **kwargs):
+    builder = PolicyBuilder(str(src), str(out), **kwargs)
+    assert builder.build()
+    return builder
+
+def test_incremental_build_skips_unchanged_and_removes_stale(tmp_path):
+    src, out = tmp_path / "dsl", tmp_path / "compiled"
+    src.mkdir()
+    _write(src, "a.dsl", "PA", ["BLOCK", "WARN"])
+    _write(src, "b.dsl", "PB", ["WARN"])
+
+    first = _build(src, out)
+    assert sorted(first.compiled) == ["a.dsl", "b.dsl"]
+    assert sorted(os.listdir(out)) == ["PA.R1.yaml", "PA.R2.yaml", "PB.R1.yaml", "manifest.json"]
+
+    manifest_mtime = os.stat(out / "manifest.json").st_mtime_ns
+    second = _build(src, out)
+    assert second.compiled == [] and sorted(second.skipped) == ["a.dsl", "b.dsl"]
+    assert os.stat(out / "manifest.json").st_mtime_ns == manifest_mtime
+
+    # Drop a rule from a.dsl and delete b.dsl
+    _write(src, "a.dsl", "PA", ["BLOCK"])
+    os.remove(src / "b.dsl")
+    third = _build(src, out)
+    assert third.compiled == ["a.dsl"] and third.removed == ["b.dsl"]
+    assert sorted(os.listdir(out)) == ["PA.R1.yaml", "manifest.json"]
+
+    with open(out / "manifest.json") as f:
+        manifest = json.load(f)
+    assert list(manifest["policies"]) == ["PA"]
+    assert manifest["policies"]["PA"]["rules"] == ["PA.R1"]
+    assert manifest["sources"]["a.dsl"]["outputs"] == ["PA.R1.yaml"]
+
+def test_missing_output_and_force_trigger_recompile(tmp_path):
+    src, out = tmp_path / "dsl", tmp_path / "compiled"
+    src.mkdir()
+    _write(src, "a.dsl", "PA", ["BLOCK"])
+    _build(src, out)
+
+    os.remove(out / "PA.R1.yaml")
+    assert _build(src, out).compiled == ["a.dsl"]
+    assert _build(src, out, force=True).compiled == ["a.dsl"]
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+import pickle
+from releasegate.policy.bundle import BUNDLE_FILENAME, write_bundle
+from releasegate.policy.loader import PolicyLoader
+
+def _write_policy(policy_dir, policy_id, result="BLOCK"):
+    with open(os.path.join(policy_dir, f"{policy_id}.yaml"), "w") as f:
+        json.dump({
+            "policy_id": policy_id,
+            "name": policy_id,
+            "controls": [{"signal": "secrets.detected", "operator": "==", "value": True}],
+            "enforcement": {"result": result},
+        }, f)
+
+def _load(policy_dir):
+    loader = PolicyLoader(policy_dir=str(policy_dir), schema="compiled")
+    return loader, loader.load_policies()
+
+def test_loader_reads_fresh_bundle(tmp_path):
+    _write_policy(tmp_path, "P2", result="WARN")
+    _write_policy(tmp_path, "P1")
+    header = write_bundle(str(tmp_path), schema="compiled")
+    assert header["policy_count"] == 2
+    assert os.path.exists(tmp_path / BUNDLE_FILENAME)
+
+    loader, policies = _load(tmp_path)
+    assert loader.from_bundle
+    yaml_policies = PolicyLoader(policy_dir=str(tmp_path), schema="compiled", use_bundle=False).load_policies()
+    assert policies == yaml_policies
+    assert [p.policy_id for p in policies] == ["P1", "P2"]
+
+    # Other schemas never use this bundle
+    auto = PolicyLoader(policy_dir=str(tmp_path), schema="auto")
+    assert auto.load_policies() == yaml_policies
+    assert not auto.from_bundle
+
+def test_stale_bundle_falls_back_to_yaml(tmp_path):
+    _write_policy(tmp_path, "P1")
+    write_bundle(str(tmp_path), schema="compiled")
+
+    _write_policy(tmp_path, "P2")
+    loader, policies = _load(tmp_path)
+    assert not loader.from_bundle
+    assert [p.policy_id for p in policies] == ["P1", "P2"]
+
+def test_touched_but_unchanged_sources_keep_bundle(tmp_path):
+    _write_policy(tmp_path, "P1")
+    write_bundle(str(tmp_path), schema="compiled")
+    path = tmp_path / "P1.yaml"
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    loader, _ = _load(tmp_path)
+    assert loader.from_bundle
+
+def test_corrupt_bundle_is_ignored(tmp_path):
+    _write_policy(tmp_path, "P1")
+    write_bundle(str(tmp_path), schema="compiled")
+    with open(tmp_path / BUNDLE_FILENAME, "r+b") as f:
+        f.seek(-4, os.SEEK_END)
+        f.write(b"XXXX")
+
+    loader, policies = _load(tmp_path)
+    assert not loader.from_bundle
+    assert [p.policy_id for p in policies] == ["P1"]
+
+def _rewrite_payload(path, payload):
+    with open(path, "rb") as f:
+        magic, header_line, _ = f.read().split(b"\n", 2)
+    header = json.loads(header_line)
+    header["payload_sha256"] = hashlib.sha256(payload).hexdigest()
+    with open(path, "wb") as f:
+        f.write(magic + b"\n" + json.dumps(header, sort_keys=True).encode("utf-8") + b"\n" + payload)
+
+class _Exploit:
+    def __reduce__(self):
+        return (os.system, ("touch pwned",))
+
+def test_tampered_bundle_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_policy(tmp_path, "P1")
+    write_bundle(str(tmp_path), schema="compiled")
+    path = tmp_path / BUNDLE_FILENAME
+
+    # Fresh header with a consistent hash, but a pickle payload: never unpickled
+    _rewrite_payload(path, pickle.dumps(_Exploit()))
+    loader, policies = _load(tmp_path)
+    assert not loader.from_bundle
+    assert not (tmp_path / "pwned").exists()
+    assert [p.policy_id for p in policies] == ["P1"]
+
+    # Well-formed JSON that is not a valid policy is rejected too
+    _rewrite_payload(path, json.dumps([{"kind": "compiled", "policy": {"policy_id": "EVIL"}}]).encode("utf-8"))
+    loader, policies = _load(tmp_path)
+    assert not loader.from_bundle
+    assert [p.policy_id for p in policies] == ["P1"]
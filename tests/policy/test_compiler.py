@@ -0,0 +1,42 @@
+from releasegate.policy.compiler import PolicyCompiler
+from releasegate.policy.dsl.lexer import DSLTokenizer
+from releasegate.policy.dsl.parser import DSLParser
+
+def _compile(condition):
+    source = f"""
+    policy P {{
+        version: "1.0.0"
+        name: "P"
+        rules {{
+            when {condition} {{ enforce BLOCK }}
+        }}
+    }}
+    """
+    ast = DSLParser(DSLTokenizer(source).tokenize()).parse()
+    return PolicyCompiler().compile(ast, source)[0].content
+
+def _signals(controls):
+    return [c["signal"] for c in controls]
+
+def test_and_only_condition_stays_a_control_list():
+    content = _compile("a == 1 and b == 2")
+    assert _signals(content["controls"]) == ["a", "b"]
+    assert "any_of" not in content
+
+def test_or_expands_to_dnf_with_common_predicates_factored():
+    content = _compile("a == 1 and (b == 2 or c == 3)")
+    assert _signals(content["controls"]) == ["a"]
+    assert [_signals(g) for g in content["any_of"]] == [["b"], ["c"]]
+
+    content = _compile("(a == 1 or b == 2) and (c == 3 or d == 4)")
+    assert content["controls"] == []
+    assert [_signals(g) for g in content["any_of"]] == [["a", "c"], ["a", "d"], ["b", "c"], ["b", "d"]]
+
+def test_absorbed_and_duplicate_branches_are_dropped():
+    # a or (a and b) == a
+    content = _compile("a == 1 or (a == 1 and b == 2)")
+    assert _signals(content["controls"]) == ["a"]
+    assert "any_of" not in content
+
+    content = _compile("(a == 1 or b == 2) or b == 2")
+    assert [_signals(g) for g in content["any_of"]] == [["a"], ["b"]]
@@ -0,0 +1,33 @@
+import pytest
+from releasegate.policy.dsl.lexer import DSLTokenizer
+
+def _types(text):
+    return [(t.type, t.value) for t in DSLTokenizer(text).tokenize()]
+
+def test_keywords_operators_and_literals():
+    assert _types('when risk.score >= -1.5 and lang not in ["go"] { enforce BLOCK }') == [
+        ("WHEN", "when"), ("IDENT", "risk"), ("DOT", "."), ("IDENT", "score"),
+        ("GTE", ">="), ("NUMBER", "-1.5"), ("AND", "and"), ("IDENT", "lang"),
+        ("NOT_IN", "not in"), ("LBRACKET", "["), ("STRING", "go"), ("RBRACKET", "]"),
+        ("LBRACE", "{"), ("ENFORCE", "enforce"), ("IDENT", "BLOCK"), ("RBRACE", "}"),
+        ("EOF", ""),
+    ]
+
+def test_keyword_prefix_is_identifier():
+    # Word boundaries keep "policy_id" / "trueish" from splitting into keywords
+    assert _types("policy_id trueish true") == [
+        ("IDENT", "policy_id"), ("IDENT", "trueish"), ("BOOL", "true"), ("EOF", "")
+    ]
+
+def test_line_and_column_tracking():
+    tokens = DSLTokenizer('policy P {\n  # comment\n    version: "1"\n}').tokenize()
+    positions = [(t.type, t.line, t.column) for t in tokens]
+    assert positions == [
+        ("POLICY", 1, 1), ("IDENT", 1, 8), ("LBRACE", 1, 10),
+        ("VERSION", 3, 5), ("COLON", 3, 12), ("STRING", 3, 14),
+        ("RBRACE", 4, 1), ("EOF", 4, 0),
+    ]
+
+def test_illegal_character_reports_position():
+    with pytest.raises(ValueError, match=r"Illegal character '\$' at line 2, column 3"):
+        DSLTokenizer("rules\n  $x").tokenize()
@@ -83,3 +83,38 @@ def test_dot_path_lookup(evaluator):
     # Manually check helper
     assert evaluator._get_context_value(ctx, "change.change_type") == "PR"
     assert evaluator._get_context_value(ctx, "actor.login") == "l"
+
+def test_compiled_predicates_match_reference(evaluator):
+    from releasegate.policy.evaluator import compile_predicate
+    predicates = [
+        Predicate(eq="PRODUCTION"), Predicate(ne=1), Predicate(gt=60, lte=100),
+        Predicate(**{"in": ["a", 1]}), Predicate(contains="x"), Predicate(gte=1, contains=1), Predicate(),
+    ]
+    values = [None, 0, 1, 60, 61, 100.5, True, "a", "x-ray", "PRODUCTION", ["x"], {"x": 1}]
+    for pred in predicates:
+        test = compile_predicate(pred)
+        for value in values:
+            try:
+                expected = evaluator._check_predicate(value, pred)
+            except TypeError:
+                continue
+            assert test(value) == expected, (pred, value)
+
+def test_compiled_accessor_falls_back_to_dict_walk(evaluator):
+    from releasegate.policy.evaluator import compile_accessor
+    ctx = ContextBuilder().with_actor("u", "l").with_change("r", "1", [], lines_changed=7).build()
+    ctx.signals["nested"] = {"depth": {"level": 3}}
+    for path in ["change.lines_changed", "signals.nested.depth.level", "signals.nested.missing", "actor.nope.x"]:
+        assert compile_accessor(path)(ctx) == evaluator._get_context_value(ctx, path)
+    assert compile_accessor("signals.nested.depth.level")(ctx) == 3
+
+def test_compiled_conditions_kept_on_the_conditions():
+    from releasegate.policy.evaluator import compile_conditions
+    cond = PolicyConditions(environment=Predicate(eq="PRODUCTION"))
+    compiled = compile_conditions(cond)
+    assert compile_conditions(cond) is compiled
+    # A fresh copy compiles separately and still compares equal
+    other = PolicyConditions(environment=Predicate(eq="PRODUCTION"))
+    assert compile_conditions(other) is not compiled
+    assert other == cond
+    assert "_compiled" not in cond.model_dump()
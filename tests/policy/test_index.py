@@ -0,0 +1,83 @@
+import pytest
+from releasegate.policy.index import PolicyIndex, compile_predicate
+from releasegate.policy.policy_types import Policy
+from releasegate.engine import ComplianceEngine
+
+def _policy(pid, controls, result="BLOCK"):
+    return Policy(policy_id=pid, name=pid, controls=controls, enforcement={"result": result})
+
+VALUES = [None, True, False, 0, 1, 5, 80.5, "5", "HIGH", "abc", [1], ["HIGH", "LOW"], [[2]], {"k": 1}]
+CASES = [
+    ("==", True), ("!=", "HIGH"), (">", 5), (">=", "5"), ("<", 80), ("<=", "zz"),
+    ("in", ["HIGH", "CRITICAL", [2]]), ("in", "HIGH-LOW"), ("not in", ["LOW", 1]), ("not in", "abc"),
+]
+
+@pytest.mark.parametrize("operator,expected", CASES)
+def test_predicates_match_check_condition(operator, expected):
+    test = compile_predicate(operator, expected)
+    for actual in VALUES:
+        reference = ComplianceEngine._check_condition(None, actual, operator, expected)
+        if actual is None:
+            compiled = False
+        else:
+            try:
+                compiled = bool(test(actual))
+            except Exception:
+                compiled = False
+        assert compiled == reference, (operator, expected, actual)
+
+def test_index_skips_policies_with_missing_signals():
+    index = PolicyIndex([
+        _policy("P1", [{"signal": "secrets.detected", "operator": "==", "value": True}]),
+        _policy("P2", [
+            {"signal": "core_risk.severity_level", "operator": "in", "value": ["HIGH"]},
+            {"signal": "features.churn", "operator": ">", "value": 500},
+        ], result="WARN"),
+    ])
+
+    assert index.match({"secrets.detected": True}) == {0: ["secrets.detected (True) == True"]}
+    # P2 needs both signals; a missing one means no trigger
+    assert index.match({"core_risk.severity_level": "HIGH"}) == {}
+    assert index.match({"core_risk.severity_level": "HIGH", "features.churn": 900}) == {
+        1: ["core_risk.severity_level (HIGH) in ['HIGH']", "features.churn (900) > 500"]
+    }
+
+def test_policy_without_controls_always_triggers():
+    index = PolicyIndex([_policy("ALWAYS", [])])
+    assert index.match({}) == {0: []}
+
+def test_any_of_groups_and_shared_predicates():
+    shared = {"signal": "secrets.detected", "operator": "==", "value": True}
+    index = PolicyIndex([
+        Policy(policy_id="OR", name="OR", controls=[shared], enforcement={"result": "BLOCK"}, any_of=[
+            [{"signal": "features.churn", "operator": ">", "value": 500}],
+            [{"signal": "core_risk.severity_level", "operator": "==", "value": "HIGH"}],
+        ]),
+        _policy("AND", [shared]),
+    ])
+    # The repeated control is compiled once and shared by both policies
+    assert len(index.predicates) == 3
+
+    assert index.match({"secrets.detected": True}) == {1: ["secrets.detected (True) == True"]}
+    assert index.match({"secrets.detected": True, "core_risk.severity_level": "HIGH"}) == {
+        0: ["secrets.detected (True) == True", "core_risk.severity_level (HIGH) == HIGH"],
+        1: ["secrets.detected (True) == True"],
+    }
+
+def test_each_predicate_evaluated_once_per_match():
+    calls = []
+
+    class Counting(dict):
+        def get(self, key, default=None):
+            calls.append(key)
+            return super().get(key, default)
+
+    controls = [{"signal": "features.churn", "operator": ">", "value": 500}]
+    index = PolicyIndex([_policy(f"P{i}", controls) for i in range(5)])
+    tests = []
+    original = index.predicates[0].test
+    index.predicates[0] = index.predicates[0]._replace(test=lambda v: tests.append(v) or original(v))
+
+    assert index.match(Counting({"features.churn": 900})).keys() == {0, 1, 2, 3, 4}
+    assert calls == ["features.churn"]
+    assert tests == [900]
@@ -0,0 +1,43 @@
+import json
+import os
+from releasegate.policy.registry import PolicyRegistry
+
+def _write_policy(policy_dir, policy_id, result="BLOCK", value=True):
+    path = os.path.join(policy_dir, f"{policy_id}.yaml")
+    with open(path, "w") as f:
+        json.dump({
+            "policy_id": policy_id,
+            "name": policy_id,
+            "controls": [{"signal": "secrets.detected", "operator": "==", "value": value}],
+            "enforcement": {"result": result},
+        }, f)
+    return path
+
+def test_refresh_swaps_snapshot_atomically(tmp_path):
+    _write_policy(tmp_path, "P1")
+    registry = PolicyRegistry(str(tmp_path))
+    old = registry.current()
+    assert [p.policy_id for p in old.policies] == ["P1"]
+    assert registry.refresh() is False # Nothing changed
+
+    _write_policy(tmp_path, "P2", result="WARN")
+    assert registry.refresh() is True
+
+    new = registry.current()
+    assert new.version != old.version
+    assert [p.policy_id for p in new.policies] == ["P1", "P2"]
+    assert new.index.match({"secrets.detected": True}).keys() == {0, 1}
+    # A snapshot held by an in-flight evaluation is untouched
+    assert [p.policy_id for p in old.policies] == ["P1"]
+    assert old.index.match({"secrets.detected": True}).keys() == {0}
+
+def test_broken_reload_keeps_previous_snapshot(tmp_path):
+    _write_policy(tmp_path, "P1")
+    registry = PolicyRegistry(str(tmp_path))
+    before = registry.current()
+
+    with open(os.path.join(tmp_path, "P2.yaml"), "w") as f:
+        f.write("policy_id: P2\ncontrols: not-a-list\n")
+
+    assert registry.refresh() is False
+    assert registry.current() is before
@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import pytest
+from releasegate.audit.db import close_connection, get_connection
+from releasegate.config import DB_PATH
+from releasegate.storage import rollups
+from releasegate.storage.database import write
+from releasegate.storage.schema import init_db
+from releasegate.storage import sqlite as run_store
+from releasegate.storage.sqlite import save_run, save_runs_bulk
+
+def _fresh_db():
+    close_connection()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    init_db()
+
+def _runs(n):
+    for i in range(n):
+        yield {
+            "repo": f"org/r{i % 3}", "pr_number": i, "head_sha": f"h{i}",
+            "risk_score": i % 100, "risk_level": "HIGH" if i % 4 == 0 else "LOW",
+            "features": {"i": i}, "created_at": f"2026-01-0{1 + i % 5}T00:00:00",
+        }
+
+def _rollup_rows(conn):
+    return sorted(tuple(r) for r in conn.execute("SELECT * FROM run_daily_rollups"))
+
+def test_bulk_insert_chunks_skips_duplicates_and_updates_rollups():
+    _fresh_db()
+    save_run("org/r0", 0, "b", "h0", {"risk_score": 0, "risk_level": "HIGH", "reasons": []}, {})
+    calls = []
+    inserted = save_runs_bulk(_runs(250), chunk_size=100, progress=lambda done, new: calls.append((done, new)))
+
+    assert inserted == 249 # (org/r0, 0, h0) already existed
+    assert calls == [(100, 99), (200, 199), (250, 249)]
+    conn = get_connection()
+    assert conn.execute("SELECT COUNT(*) FROM pr_runs").fetchone()[0] == 250
+    assert conn.execute("SELECT features_json FROM pr_runs WHERE pr_number = 7").fetchone()[0] == '{"i": 7}'
+
+    incremental = _rollup_rows(conn)
+    write(rollups.backfill)
+    assert _rollup_rows(conn) == incremental
+    close_connection()
+
+def test_deferred_indexes_are_rebuilt():
+    _fresh_db()
+    write(lambda conn: conn.execute("CREATE INDEX idx_test_runs_level ON pr_runs(risk_level)"))
+    assert save_runs_bulk(_runs(10), defer_indexes=True) == 10
+    conn = get_connection()
+    names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'pr_runs'")}
+    assert "idx_test_runs_level" in names
+    close_connection()
+
+def _index_names(conn):
+    return {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'pr_runs'")}
+
+def _failing_runs():
+    yield from _runs(5)
+    yield {"pr_number": 99} # No repo
+
+def test_failed_load_restores_indexes_and_keeps_its_error(monkeypatch, capsys):
+    _fresh_db()
+    write(lambda conn: conn.execute("CREATE INDEX idx_test_runs_level ON pr_runs(risk_level)"))
+    with pytest.raises(KeyError):
+        save_runs_bulk(_failing_runs(), chunk_size=2, defer_indexes=True)
+    conn = get_connection()
+    assert "idx_test_runs_level" in _index_names(conn)
+    assert conn.execute("SELECT COUNT(*) FROM pr_runs").fetchone()[0] == 4 # Chunks committed before the failure
+
+    # Recreation failing too is reported, and the load's error still surfaces
+    def broken(index_sql):
+        def job(conn):
+            raise sqlite3.OperationalError("disk I/O error")
+        return job
+    monkeypatch.setattr(run_store, "_create_indexes", broken)
+    with pytest.raises(KeyError):
+        save_runs_bulk(_failing_runs(), chunk_size=2, defer_indexes=True)
+    err = capsys.readouterr().err
+    assert "indexes were not recreated" in err and "idx_test_runs_level" in err
+    close_connection()
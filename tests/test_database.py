@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from releasegate.storage.database import Database
+
+
+def _db(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    db.execute("CREATE TABLE t (k INTEGER PRIMARY KEY, v TEXT)")
+    return db
+
+
+def test_reader_pooled_per_thread(tmp_path):
+    db = _db(tmp_path)
+    conn = db.reader()
+    assert db.reader() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    others = []
+    thread = threading.Thread(target=lambda: others.append(db.reader()))
+    thread.start()
+    thread.join()
+    assert others[0] is not conn
+    db.close()
+
+
+def test_exited_threads_readers_closed(tmp_path):
+    db = _db(tmp_path)
+    conns = []
+    for _ in range(3):
+        thread = threading.Thread(target=lambda: conns.append(db.reader()))
+        thread.start()
+        thread.join()
+
+    # Opening a connection for a new thread closes those of exited threads
+    db.reader()
+    assert list(db._readers) == [threading.get_ident()]
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    db.close()
+
+
+def test_close_during_batch_keeps_writer_open(tmp_path):
+    db = _db(tmp_path)
+    started, release = threading.Event(), threading.Event()
+    used = []
+
+    def job(conn):
+        started.set()
+        release.wait(5)
+        used.append(conn)
+        return conn.execute("INSERT INTO t VALUES (1, 'a')").rowcount
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(db.write(job)))
+    thread.start()
+    started.wait(5)
+    db.close() # E.g. another thread noticed a replaced file
+    release.set()
+    thread.join()
+
+    assert results == [1]
+    assert db.reader().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+    # Closed once the batch finished; the next write opens a new writer
+    with pytest.raises(sqlite3.ProgrammingError):
+        used[0].execute("SELECT 1")
+    db.execute("INSERT INTO t VALUES (2, 'b')")
+    db.close()
+
+
+def test_failing_job_rolls_back_alone(tmp_path):
+    db = _db(tmp_path)
+    results, errors = [], []
+
+    # Hold the writer so the next jobs are committed as one batch
+    started, release = threading.Event(), threading.Event()
+
+    def blocker(conn):
+        started.set()
+        release.wait(5)
+        conn.execute("INSERT INTO t VALUES (0, 'first')")
+
+    def run(fn):
+        try:
+            results.append(db.write(fn))
+        except sqlite3.IntegrityError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(blocker,))]
+    threads[0].start()
+    started.wait(5)
+    for k in (1, 1, 2): # Duplicate key fails only its own job
+        threads.append(threading.Thread(target=run, args=(lambda conn, k=k: conn.execute("INSERT INTO t VALUES (?, 'x')", (k,)).rowcount,)))
+        threads[-1].start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 1
+    keys = [r[0] for r in db.reader().execute("SELECT k FROM t ORDER BY k")]
+    assert keys == [0, 1, 2]
+    db.close()
+
+
+def test_concurrent_writes_all_committed(tmp_path):
+    db = _db(tmp_path)
+
+    def worker(base):
+        for i in range(50):
+            db.execute("INSERT INTO t VALUES (?, 'v')", (base + i,))
+
+    threads = [threading.Thread(target=worker, args=(n * 1000,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert db.reader().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 400
+    db.close()
+
+
+def test_reconnects_when_file_replaced(tmp_path):
+    db = _db(tmp_path)
+    db.ensure("seed", lambda conn: conn.execute("INSERT INTO t VALUES (1, 'a')"))
+    old = db.reader()
+
+    os.remove(db.path)
+    with pytest.raises(sqlite3.OperationalError):
+        db.reader().execute("SELECT * FROM t")
+    assert db.reader() is not old
+    db.execute("CREATE TABLE t (k INTEGER PRIMARY KEY, v TEXT)")
+    ran = []
+    db.ensure("seed", lambda conn: ran.append(1))
+    assert ran == [1] # ensure() runs again for the new file
+    db.close()
+
+
+def test_migrations_applied_once_and_recorded(tmp_path):
+    from releasegate.storage.schema import MIGRATIONS, SCHEMA_VERSION, migrate, schema_version
+
+    db = Database(str(tmp_path / "test.db"))
+    assert db.write(migrate) == SCHEMA_VERSION
+    conn = db.reader()
+    assert schema_version(conn) == SCHEMA_VERSION
+    applied = [r[0] for r in conn.execute("SELECT version FROM schema_migrations ORDER BY version")]
+    assert applied == [m.version for m in MIGRATIONS]
+
+    # Already current: nothing re-runs
+    calls = []
+    db.ensure("schema", lambda wconn: calls.append(migrate(wconn)))
+    db.ensure("schema", lambda wconn: calls.append(migrate(wconn)))
+    assert calls == [SCHEMA_VERSION]
+    assert conn.execute("SELECT COUNT(*) FROM schema_migrations").fetchone()[0] == len(MIGRATIONS)
+    db.close()
+
+
+def test_migrations_adopt_unversioned_database(tmp_path):
+    from releasegate.storage.schema import SCHEMA_VERSION, create_schema, migrate, schema_version
+
+    db = Database(str(tmp_path / "test.db"))
+    db.write(create_schema) # Created before schema versioning
+    db.execute("INSERT INTO pr_runs (repo, pr_number, head_sha, risk_score, risk_level, created_at) VALUES ('r', 1, 'h', 10, 'LOW', '2024-01-02 00:00:00')")
+    assert schema_version(db.reader()) == 0
+
+    db.write(migrate)
+    conn = db.reader()
+    assert schema_version(conn) == SCHEMA_VERSION
+    # The rollup migration counts existing history
+    assert conn.execute("SELECT run_count FROM run_daily_rollups WHERE repo = 'r'").fetchone()[0] == 1
+    db.close()
+
+
+def test_call_sites_follow_configured_path(tmp_path, monkeypatch):
+    from releasegate.audit.db import close_connection, get_connection
+    from releasegate.hotspots.file_risk import aggregate_file_risks
+    from releasegate.storage.schema import SCHEMA_VERSION, schema_version
+    from releasegate.storage.sqlite import save_runs_bulk
+
+    path = str(tmp_path / "configured.db")
+    monkeypatch.setattr("releasegate.config.DB_PATH", path)
+    # Migrated, written and read all on the configured file
+    assert save_runs_bulk([{"repo": "org/a", "pr_number": 1, "head_sha": "h", "features": {"files": ["a.py"]}}]) == 1
+    assert schema_version(get_connection()) == SCHEMA_VERSION
+    assert aggregate_file_risks("org/a")["a.py"]["changes"] == 1
+    assert Database.for_path().path == path
+    close_connection()
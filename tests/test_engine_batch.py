@@ -0,0 +1,61 @@
+import threading
+import time
+from releasegate.engine import ComplianceEngine, ComplianceRunResult
+
+def _engine(evaluate):
+    # Skip policy/model loading: the batch mechanics only need evaluate()
+    engine = ComplianceEngine.__new__(ComplianceEngine)
+    engine.last_batch_summary = None
+    engine.evaluate = evaluate
+    return engine
+
+def _fake_evaluate(raw):
+    time.sleep(0.001 * (raw["n"] % 3))
+    return ComplianceRunResult(overall_status="COMPLIANT", results=[], metadata={"n": raw["n"]})
+
+def test_evaluate_many_yields_every_item_with_index():
+    engine = _engine(_fake_evaluate)
+    results = list(engine.evaluate_many(({"n": i} for i in range(25)), max_workers=3))
+
+    assert sorted(r.metadata["batch_index"] for r in results) == list(range(25))
+    assert all(r.metadata["batch_index"] == r.metadata["n"] for r in results)
+    summary = engine.last_batch_summary
+    assert summary.total == summary.succeeded == 25
+    assert summary.failed == 0
+    assert summary.max_ms >= summary.p50_ms >= 0
+
+def test_evaluate_many_bounds_items_in_flight():
+    pulled = []
+    in_flight = []
+    lock = threading.Lock()
+
+    def source():
+        for i in range(20):
+            pulled.append(i)
+            yield {"n": i}
+
+    def evaluate(raw):
+        with lock:
+            in_flight.append(len(pulled) - raw["n"])
+        return _fake_evaluate(raw)
+
+    engine = _engine(evaluate)
+    for _ in engine.evaluate_many(source(), max_workers=2, max_pending=3):
+        pass
+    # Never more than max_pending items pulled ahead of the one being evaluated
+    assert max(in_flight) <= 3
+
+def test_evaluate_many_records_item_errors_and_continues():
+    def evaluate(raw):
+        if raw["n"] in (2, 5):
+            raise ValueError(f"bad item {raw['n']}")
+        return _fake_evaluate(raw)
+
+    engine = _engine(evaluate)
+    results = list(engine.evaluate_many(({"n": i} for i in range(8)), max_workers=2))
+    assert sorted(r.metadata["batch_index"] for r in results) == [0, 1, 3, 4, 6, 7]
+    summary = engine.last_batch_summary
+    assert (summary.total, summary.succeeded, summary.failed) == (8, 6, 2)
+    assert [(e.batch_index, e.error) for e in summary.errors] == [
+        (2, "ValueError: bad item 2"), (5, "ValueError: bad item 5")
+    ]
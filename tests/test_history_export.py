@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from releasegate.audit.db import close_connection
+from releasegate.cli import main
+from releasegate.config import DB_PATH
+from releasegate.storage.history_export import export_history, read_history, read_watermark
+from releasegate.storage.schema import init_db
+from releasegate.storage.sqlite import add_label, save_runs_bulk
+
+def _fresh_db():
+    close_connection()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    init_db()
+
+def _runs(start, n, features=None):
+    return [
+        {"repo": f"org/r{i % 2}", "pr_number": i, "head_sha": f"h{i}", "risk_score": i,
+         "features": features or {"diff": {"loc_added": i}, "files": ["a"] * (i % 3), "tests": bool(i % 2)},
+         "created_at": f"2026-0{1 + i % 2}-10T00:00:00"}
+        for i in range(start, start + n)
+    ]
+
+def test_incremental_partitioned_export(tmp_path):
+    _fresh_db()
+    out = str(tmp_path / "history")
+    save_runs_bulk(_runs(0, 20))
+    add_label("org/r0", 0, "incident", 5)
+
+    stats = export_history(out, batch_size=7)
+    assert stats["runs_exported"] == 20
+    assert os.path.isdir(os.path.join(out, "repo=org%2Fr0", "month=2026-01"))
+    assert export_history(out)["runs_exported"] == 0 # Nothing new
+
+    save_runs_bulk(_runs(20, 2, features={"new_flag": "x"}))
+    assert export_history(out)["runs_exported"] == 2
+    assert read_watermark(out)["last_run_id"] == 22
+
+    table = read_history(out, columns=["run_id", "features.diff.loc_added", "features.files.count",
+                                       "features.tests", "features.new_flag", "labels"])
+    rows = {r["run_id"]: r for r in table.to_pylist()}
+    assert len(rows) == 22
+    assert table.schema.field("features.diff.loc_added").type == pa.float64()
+    assert rows[1] == {"run_id": 1, "features.diff.loc_added": 0.0, "features.files.count": 0.0,
+                       "features.tests": 0.0, "features.new_flag": None, "labels": ["incident"]}
+    assert rows[22]["features.new_flag"] == "x" and rows[22]["features.diff.loc_added"] is None
+
+    # Partition pruning by repo and month
+    pruned = read_history(out, columns=["run_id"], repo="org/r1", since_month="2026-02")
+    assert sorted(pruned["run_id"].to_pylist()) == list(range(2, 23, 2))
+    close_connection()
+
+def test_orphaned_parts_removed_and_cli(tmp_path, monkeypatch, capsys):
+    _fresh_db()
+    out = str(tmp_path / "history")
+    save_runs_bulk(_runs(0, 4))
+    export_history(out)
+
+    orphan = os.path.join(out, "repo=org%2Fr0", "month=2026-01", "part-000000000099-000000000100.parquet")
+    open(orphan, "w").close()
+    monkeypatch.setattr("sys.argv", ["releasegate", "export-history", "--out", out])
+    assert main() == 0
+    assert json.loads(capsys.readouterr().out)["runs_exported"] == 0
+    assert not os.path.exists(orphan) # Past the watermark: left by a crashed export
+
+    with pytest.raises(ValueError):
+        export_history(out, repo="org/r0") # Directory holds an all-repo export
+    close_connection()
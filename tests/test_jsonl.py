@@ -0,0 +1,51 @@
+import json
+import os
+import threading
+
+from releasegate.storage.jsonl import JsonlWriter
+
+
+def test_appends_group_committed_in_order(tmp_path):
+    path = str(tmp_path / "runs.jsonl")
+    writer = JsonlWriter(path, window_ms=5)
+    receipts = {}
+
+    def worker(n):
+        for i in range(20):
+            receipts[(n, i)] = writer.append({"worker": n, "i": i})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+    with open(path, "rb") as f:
+        data = f.read()
+    lines = [json.loads(line) for line in data.splitlines()]
+    assert len(lines) == 160
+    # Fewer batches (and fsyncs) than appends
+    assert writer.committer.batches < 160
+
+    # Each receipt points at its own line; file order follows batch order
+    for (n, i), receipt in receipts.items():
+        assert receipt.durable
+        assert json.loads(data[receipt.offset:receipt.offset + receipt.length]) == {"worker": n, "i": i}
+    by_offset = sorted(receipts.values(), key=lambda r: r.offset)
+    assert [r.batch for r in by_offset] == sorted(r.batch for r in by_offset)
+    # Per-worker order preserved
+    for n in range(8):
+        assert [l["i"] for l in lines if l["worker"] == n] == list(range(20))
+
+
+def test_reopens_after_rotation(tmp_path):
+    path = str(tmp_path / "runs.jsonl")
+    writer = JsonlWriter(path)
+    writer.append({"a": 1}, fsync=False)
+    os.rename(path, path + ".1")
+    receipt = writer.append({"b": 2}, fsync=False)
+    writer.close()
+    assert receipt.offset == 0 and not receipt.durable
+    with open(path) as f:
+        assert [json.loads(line) for line in f] == [{"b": 2}]
@@ -0,0 +1,112 @@
+import json
+import time
+
+from releasegate.cli import main
+from releasegate.storage import provider_cache
+from releasegate.storage.database import Database
+from releasegate.storage.provider_cache import ProviderCache, namespace_of
+from releasegate.storage.schema import SCHEMA_VERSION, migrate, schema_version
+
+
+def _cache(tmp_path, **kwargs):
+    path = str(tmp_path / "cache.db")
+    Database.for_path(path).write(migrate)
+    return ProviderCache("github_cache", path, interval_s=0, **kwargs)
+
+
+def test_ttl_and_hit_ratio(tmp_path):
+    cache = _cache(tmp_path)
+    assert namespace_of("github:org/a:issue:12") == "issue"
+    cache.set("github:org/a:issue:1", {"labels": ["bug"]}, ttl=60)
+    cache.set("github:org/a:mr:2", {"labels": []}, ttl=-1) # Already expired
+
+    assert cache.get("github:org/a:issue:1") == {"labels": ["bug"]}
+    assert cache.get("github:org/a:issue:1", ttl=0) is None # Caller's TTL is stricter
+    assert cache.get("github:org/a:mr:2") is None
+    assert cache.get("github:org/a:issue:404") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["expired"], stats["misses"]) == (1, 2, 1)
+    assert stats["hit_ratio"] == 0.25
+    assert stats["namespaces"] == {"issue": 1, "mr": 1}
+    assert stats["auto_vacuum"] == "incremental"
+
+    result = cache.maintain()
+    assert result["expired_deleted"] == 1
+    assert cache.stats()["entries"] == 1
+    cache.db.close()
+
+
+def test_lru_eviction_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(provider_cache, "DELETE_BATCH", 3)
+    cache = _cache(tmp_path, max_entries=5)
+    for i in range(10):
+        cache.set(f"github:org/a:issue:{i}", {"i": i, "pad": "x" * 5000})
+    # Recently read entries survive eviction
+    time.sleep(0.01)
+    for i in (0, 1):
+        assert cache.get(f"github:org/a:issue:{i}")["i"] == i
+
+    before = cache.stats()["db_bytes"]
+    result = cache.maintain()
+    assert result == {"touched": 2, "expired_deleted": 0, "evicted": 5}
+    keys = {r[0] for r in cache.db.reader().execute("SELECT cache_key FROM github_cache")}
+    assert keys == {f"github:org/a:issue:{i}" for i in (0, 1, 7, 8, 9)}
+    # Freed pages are returned to the filesystem
+    assert cache.stats()["db_bytes"] < before
+    cache.db.close()
+
+
+def test_invalidate_and_cli(tmp_path, monkeypatch, capsys):
+    cache = _cache(tmp_path)
+    cache.set("github:org/a:issue:1", {"labels": []})
+    cache.invalidate("github:org/a:issue:1")
+    assert cache.get("github:org/a:issue:1") is None
+
+    cache.db.close()
+
+    # The CLI migrates and reads the configured database, here a new, empty one
+    path = str(tmp_path / "cli.db")
+    monkeypatch.setattr("releasegate.config.DB_PATH", path)
+    monkeypatch.setattr("sys.argv", ["releasegate", "provider-cache", "stats", "--table", "github_cache"])
+    assert main() == 0
+    assert json.loads(capsys.readouterr().out)["github_cache"]["entries"] == 0
+    assert schema_version(Database.for_path(path).reader()) == SCHEMA_VERSION
+    Database.for_path(path).close()
+
+
+def test_memory_tier_serves_repeats_and_respects_ttl(tmp_path):
+    cache = _cache(tmp_path)
+    cache.set("github:org/a:issue:1", {"labels": ["bug"]}, ttl=60)
+    # Served from memory: the row can vanish from SQLite behind its back
+    cache.db.execute("DELETE FROM github_cache")
+    assert cache.get("github:org/a:issue:1") == {"labels": ["bug"]}
+    assert cache.stats()["memory_hits"] == 1
+    # Same TTL rules as the SQLite tier
+    assert cache.get("github:org/a:issue:1", ttl=0) is None
+    assert cache.stats()["memory_entries"] == 0
+
+    # Write-through: another process (instance) sees the row; its first read promotes it
+    cache.set("github:org/a:issue:2", {"labels": []})
+    other = ProviderCache("github_cache", cache.path, interval_s=0)
+    assert other.get("github:org/a:issue:2") == {"labels": []}
+    assert other.get("github:org/a:issue:2") == {"labels": []}
+    assert (other.hits, other.memory_hits) == (2, 1)
+    cache.db.close()
+
+
+def test_memory_tier_bounds_and_invalidation(tmp_path):
+    cache = _cache(tmp_path, memory=provider_cache.MemoryLRU(max_entries=3, max_bytes=200))
+    for i in range(4):
+        cache.set(f"github:org/a:issue:{i}", {"i": i})
+    assert len(cache.memory) == 3 # Oldest entry evicted
+    cache.set("github:org/a:issue:big", {"pad": "x" * 500}) # Larger than the byte bound: SQLite only
+    assert cache.memory.bytes <= 200 and "github:org/a:issue:big" not in cache.memory._entries
+
+    cache.invalidate("github:org/a:issue:3")
+    assert cache.get("github:org/a:issue:3") is None
+    cache.set("github:org/b:issue:1", {"i": 1})
+    assert cache.invalidate_prefix("github:org/a:") == 4
+    assert cache.get("github:org/a:issue:1") is None
+    assert cache.get("github:org/b:issue:1") == {"i": 1}
+    cache.db.close()
@@ -0,0 +1,72 @@
+import os
+from datetime import datetime, timezone
+from releasegate.audit.db import close_connection, get_connection
+from releasegate.audit.recorder import AuditRecorder
+from releasegate.config import DB_PATH
+from releasegate.decision.types import Decision, EnforcementTargets
+from releasegate.storage import rollups
+from releasegate.storage.schema import init_db
+from releasegate.storage.sqlite import save_run
+from releasegate.ux.analytics import ComplianceAnalytics
+from releasegate.ux.dashboard import DashboardGenerator
+
+def _fresh_db():
+    close_connection()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    init_db()
+
+def _decide(i, status, policies):
+    d = Decision(
+        timestamp=datetime(2026, 3, 1 + i % 2, tzinfo=timezone.utc), release_status=status, context_id=f"c{i}",
+        message="msg", matched_policies=policies, policy_bundle_hash="h",
+        enforcement_targets=EnforcementTargets(repository="org/a", ref="HEAD"),
+    )
+    AuditRecorder.record_with_context(d, repo="org/a", pr_number=i)
+
+def _snapshot(conn):
+    return {
+        table: sorted(tuple(r) for r in conn.execute(f"SELECT * FROM {table}"))
+        for table in ("run_daily_rollups", "decision_daily_rollups", "policy_daily_rollups")
+    }
+
+def test_rollups_maintained_on_write_and_match_backfill():
+    _fresh_db()
+    save_run("org/a", 1, "b", "h1", {"risk_score": 80, "risk_level": "HIGH", "reasons": []}, {})
+    save_run("org/a", 1, "b", "h1", {"risk_score": 80, "risk_level": "HIGH", "reasons": []}, {}) # Ignored duplicate
+    save_run("org/a", 2, "b", "h2", {"risk_score": 20, "risk_level": "LOW", "reasons": []}, {})
+    _decide(0, "BLOCKED", ["SEC-1", "SEC-2"])
+    _decide(1, "CONDITIONAL", ["SEC-1"])
+    _decide(2, "ALLOWED", ["SEC-2"])
+
+    conn = get_connection()
+    runs = rollups.daily_run_stats(conn, repo="org/a")
+    assert len(runs) == 1 and runs[0]["runs"] == 2 and runs[0]["high"] == 1 and runs[0]["risk_sum"] == 100
+    assert rollups.daily_decision_stats(conn) == {
+        "2026-03-01": {"BLOCKED": 1, "ALLOWED": 1}, "2026-03-02": {"CONDITIONAL": 1},
+    }
+    assert rollups.top_policies(conn) == [{"policy": "SEC-1", "count": 2}, {"policy": "SEC-2", "count": 1}]
+
+    incremental = _snapshot(conn)
+    rollups.backfill(conn)
+    assert _snapshot(conn) == incremental
+    close_connection()
+    os.remove(DB_PATH)
+
+def test_analytics_and_dashboard_from_rollups():
+    _fresh_db()
+    _decide(0, "BLOCKED", ["SEC-1"])
+    _decide(2, "ALLOWED", [])
+    _decide(1, "CONDITIONAL", ["SEC-1"])
+
+    analytics = ComplianceAnalytics()
+    stats = analytics.daily_stats_from_rollups()
+    assert stats["2026-03-01"] == {"total": 2, "block": 1, "warn": 0, "pass": 1, "risk_avg": 0}
+    assert stats["2026-03-02"]["warn"] == 1
+    assert analytics.get_top_violations_from_rollups(since="2026-03-02") == [{"policy": "SEC-1", "count": 1}]
+
+    report = DashboardGenerator(analytics).generate_markdown_from_rollups(repo="org/a")
+    assert "- **Total Scans**: 3" in report
+    assert "| `SEC-1` | 2 |" in report
+    close_connection()
+    os.remove(DB_PATH)
@@ -0,0 +1,63 @@
+import os
+from datetime import datetime, timedelta
+from releasegate.audit.db import close_connection, get_connection
+from releasegate.config import DB_PATH
+from releasegate.hotspots.file_risk import aggregate_file_risks
+from releasegate.signals.criticality import CriticalityEngine
+from releasegate.storage import run_files
+from releasegate.storage.database import write
+from releasegate.storage.schema import init_db
+from releasegate.storage.sqlite import save_run, save_runs_bulk
+
+def _fresh_db():
+    close_connection()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    init_db()
+
+def _legacy_run(conn, pr, files_json, churn, label, created_at):
+    conn.execute(
+        "INSERT INTO pr_runs (repo, pr_number, head_sha, files_json, churn, label_value, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        ("org/a", pr, f"h{pr}", files_json, churn, label, created_at)
+    )
+
+def test_save_run_and_bulk_index_files():
+    _fresh_db()
+    save_run("org/a", 1, "b", "h1", {"risk_score": 10, "risk_level": "LOW", "reasons": []}, {"files": ["a.py", "b.py"]})
+    save_runs_bulk([{"repo": "org/a", "pr_number": 2, "head_sha": "h2", "features": {"files": ["a.py"]}}])
+    conn = get_connection()
+    rows = sorted(tuple(r) for r in conn.execute("SELECT run_id, file_path FROM pr_run_files"))
+    assert [path for _, path in rows] == ["a.py", "b.py", "a.py"]
+    close_connection()
+
+def test_aggregations_over_files_json_and_features():
+    _fresh_db()
+    recent = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+    old = (datetime.now() - timedelta(days=200)).strftime("%Y-%m-%d %H:%M:%S")
+
+    def seed(conn):
+        _legacy_run(conn, 1, '["a.py", "b.py"]', 100, 1, recent)
+        _legacy_run(conn, 2, '{"a.py": 3}', 40, 0, old)
+        _legacy_run(conn, 3, 'not json', 10, 1, recent)
+        # A path listed twice counts once; churn is split over distinct paths
+        _legacy_run(conn, 4, '["c.py", "c.py", "d.py"]', 30, None, recent)
+        conn.execute("DELETE FROM pr_run_files")
+        # One-time backfill (what the schema migration runs)
+        run_files.backfill(conn)
+    write(seed)
+
+    risks = aggregate_file_risks("org/a", window_days=90)
+    assert set(risks) == {"a.py", "b.py", "c.py", "d.py"}
+    a = risks["a.py"]
+    assert (a["changes"], a["incidents"], a["total_churn"], a["recent_churn"]) == (2, 1, 90.0, 50.0)
+    assert a["last_touched"].strftime("%Y-%m-%d %H:%M:%S") == recent
+    assert risks["b.py"]["changes"] == 1
+    assert (risks["c.py"]["changes"], risks["c.py"]["total_churn"]) == (1, 15.0)
+
+    # Runs saved by save_run carry their files in features_json and count too
+    save_run("org/a", 5, "b", "h5", {"risk_score": 10, "risk_level": "LOW", "reasons": []}, {"files": ["b.py"]})
+    assert aggregate_file_risks("org/a", window_days=90)["b.py"]["changes"] == 2
+
+    engine = CriticalityEngine({})
+    assert engine.file_risk_map == {"a.py": 0.5, "b.py": 1.0}
+    close_connection()
@@ -0,0 +1,35 @@
+from releasegate.signals.namespace import SignalNamespace, flatten_signals
+
+def _signals():
+    return {
+        "core_risk": {"severity_level": "HIGH", "signals": {"churn": 700}, "empty": {}},
+        "features": {"churn": 700},
+        "raw": {
+            "files_changed": {"a.py": 1},
+            "per_file_churn": {"src/a.py": 10, "src/b.py": 5},
+            "labels": ["hotfix"],
+        },
+        "secrets.detected": True,
+    }
+
+def test_namespace_matches_eager_flatten():
+    data = _signals()
+    ns = SignalNamespace(data)
+    flat = flatten_signals(data)
+
+    for key in list(flat) + ["core_risk", "core_risk.empty", "raw.per_file_churn", "missing.key"]:
+        assert ns.get(key, "MISSING") == flat.get(key, "MISSING"), key
+    assert dict(ns) == flat
+
+def test_dotted_keys_and_leaf_dicts():
+    ns = SignalNamespace(_signals())
+    assert ns["secrets.detected"] is True
+    assert ns["raw.files_changed"] == {"a.py": 1}
+    assert ns["raw.per_file_churn.src/a.py"] == 10
+    assert "raw.files_changed.a.py" not in ns
+
+def test_collision_last_writer_wins():
+    data = {"a": {"b": 1}, "a.b": 2}
+    assert SignalNamespace(data)["a.b"] == flatten_signals(data)["a.b"] == 2
+    data = {"a.b": 2, "a": {"b": 1}}
+    assert SignalNamespace(data)["a.b"] == flatten_signals(data)["a.b"] == 1
@@ -116,6 +116,27 @@ def test_webhook_ping():
     assert response.json() == {"msg": "pong"}
     print("Success: Ping event handled!")
 
+def test_webhook_labeled_invalidates_cached_issue(tmp_path):
+    """Label events drop cached labels, also on a database that does not exist yet."""
+    from releasegate.storage.database import Database
+    from releasegate.storage.provider_cache import ProviderCache
+
+    path = str(tmp_path / "fresh.db")
+    payload = {"action": "labeled", "issue": {"number": 7}, "repository": {"full_name": "test/webhook-repo"}}
+    with unittest.mock.patch("releasegate.config.DB_PATH", path), \
+         unittest.mock.patch("releasegate.server.GITHUB_SECRET", None):
+        response = client.post("/webhooks/github", json=payload, headers={"X-GitHub-Event": "issues"})
+        assert response.status_code == 200
+        assert response.json() == {"msg": "Ignored non-PR event"}
+
+        cache = ProviderCache.for_table("github_cache")
+        cache.set("github:test/webhook-repo:issue:7", {"labels": ["bug"]})
+        response = client.post("/webhooks/github", json=payload, headers={"X-GitHub-Event": "issues"})
+        assert response.status_code == 200
+        assert cache.get("github:test/webhook-repo:issue:7") is None
+        cache.stop()
+        Database.for_path(path).close()
+
 if __name__ == "__main__":
     test_webhook_ping()
     test_webhook_pr_opened()